@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program benchmarks the divide-and-conquer conversions behind
+'arbitrary2dec' and 'convert_among_arbitraries' from the 'base_converters'
+module, for numbers from 10^3 to 10^6 digits.
+The references are the built-in 'int' (only up to CPython's int/str
+conversion digit limit) and the repeated-division algorithm, which is
+quadratic and hence only timed for the smaller sizes.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import random
+import sys
+import timeit
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases.base_converters import arbitrary2dec, convert_among_arbitraries
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+DIGIT_COUNTS = [10**3, 10**4, 10**5, 10**6]
+SOURCE_BASE = 10
+TARGET_BASE = 7
+RANDOM_SEED = 42
+
+# Largest size for which the quadratic reference is timed
+MAX_REFERENCE_DIGITS = 10**4
+
+#------------------#
+# Define functions #
+#------------------#
+
+def repeated_division(n, base):
+    """Quadratic reference: render n in the given base one digit at a time."""
+    digits = []
+    while n:
+        n, digit = divmod(n, base)
+        digits.append("0123456789abcdefghijklmnopqrstuvwxyz"[digit])
+    return "".join(reversed(digits)) or "0"
+
+#------------#
+# Operations #
+#------------#
+
+random.seed(RANDOM_SEED)
+int_max_str_digits = sys.get_int_max_str_digits()
+
+for n_digits in DIGIT_COUNTS:
+    number_str = str(random.randint(1, 9)) \
+                 + "".join(random.choices("0123456789", k=n_digits - 1))
+    
+    print(f"{n_digits} digits")
+    
+    # Parsing (string -> int) #
+    dc_parse_time = min(timeit.repeat(lambda: arbitrary2dec(number_str, SOURCE_BASE),
+                                      repeat=3, number=1))
+    if n_digits <= int_max_str_digits:
+        builtin_parse_time = min(timeit.repeat(lambda: int(number_str, SOURCE_BASE),
+                                               repeat=3, number=1))
+        builtin_parse_str = f"{builtin_parse_time:.4f} s"
+    else:
+        builtin_parse_str = f"not allowed (> {int_max_str_digits} digits)"
+    print(f"  parse, divide-and-conquer : {dc_parse_time:.4f} s")
+    print(f"  parse, built-in int       : {builtin_parse_str}")
+    
+    # Rendering (int -> string in another base) #
+    number = arbitrary2dec(number_str, SOURCE_BASE)
+    dc_render_time = min(timeit.repeat(
+        lambda: convert_among_arbitraries(number, SOURCE_BASE, target_base=TARGET_BASE),
+        repeat=3, number=1
+        ))
+    print(f"  base {TARGET_BASE}, divide-and-conquer: {dc_render_time:.4f} s")
+    if n_digits <= MAX_REFERENCE_DIGITS:
+        reference_time = min(timeit.repeat(lambda: repeated_division(number, TARGET_BASE),
+                                           repeat=3, number=1))
+        print(f"  base {TARGET_BASE}, repeated division : {reference_time:.4f} s")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program benchmarks 'adapted_factorial' from the 'mathematical_utils' module
+against the exact path, i.e. building the full factorial and rounding it.
+Before timing, the estimated significant digits are checked against
+the exact ones for a range of inputs above the exact-computation threshold.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import timeit
+
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases import mathematical_utils
+from pygenutils.number_bases.mathematical_utils import adapted_factorial
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+# Accuracy check #
+#----------------#
+
+ACCURACY_INPUTS = [1000, 1001, 2024, 4999, 12345, 31416, 65537, 100_000]
+ACCURACY_DIGITS = [1, 3, 6, 10, 15]
+
+# Timing #
+#--------#
+
+TIMING_INPUTS = [1000, 10_000, 100_000, 300_000]
+TIMING_DIGITS = 6
+ARRAY_SIZE = 100_000
+REPEATS = 3
+
+#------------------#
+# Define functions #
+#------------------#
+
+def exact_factorial(num, significant_digits):
+    """
+    Reference result, computing the factorial exactly whatever its size.
+    """
+    sig_int, exponent = mathematical_utils._exact_factorial_digits(num, significant_digits)
+    return mathematical_utils._format_significant_digits(sig_int, exponent, significant_digits)
+
+#------------#
+# Operations #
+#------------#
+
+# Check the estimates against the exact path #
+n_mismatches = 0
+for num in ACCURACY_INPUTS:
+    for significant_digits in ACCURACY_DIGITS:
+        estimated = adapted_factorial(num, significant_digits)
+        exact = exact_factorial(num, significant_digits)
+        if estimated != exact:
+            n_mismatches += 1
+            print(f"Mismatch for {num}! ({significant_digits} digits): {estimated} != {exact}")
+print(f"Accuracy check: {n_mismatches} mismatches over "
+      f"{len(ACCURACY_INPUTS) * len(ACCURACY_DIGITS)} cases\n")
+
+# Time scalar inputs #
+for num in TIMING_INPUTS:
+    exact_time = min(timeit.repeat(lambda: exact_factorial(num, TIMING_DIGITS),
+                                   repeat=REPEATS, number=1))
+    estimated_time = min(timeit.repeat(lambda: adapted_factorial(num, TIMING_DIGITS),
+                                       repeat=REPEATS, number=1))
+    print(f"{num}! -> {adapted_factorial(num, TIMING_DIGITS)}")
+    print(f"  exact     : {exact_time:.6f} s")
+    print(f"  estimated : {estimated_time:.6f} s (x{exact_time / estimated_time:.0f})")
+
+# Time array inputs #
+nums = np.arange(ARRAY_SIZE)
+array_time = min(timeit.repeat(lambda: adapted_factorial(nums, TIMING_DIGITS),
+                               repeat=REPEATS, number=1))
+print(f"\nArray of {ARRAY_SIZE} inputs: {array_time:.4f} s")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program benchmarks the overhead of normalising list inputs across
+chained calls, i.e. when the output of one function is passed on to the
+next ones.
+
+The former pattern, repeated at every entry point, scanned each list for
+nested lists and then flattened it from the start if any was found.
+'normalise_flat_list' does both in a single pass, flattening from the first
+nested list onwards, and with 'freeze=True' returns an immutable list that
+later calls pass on without scanning. The three are timed over chains of
+calls on flat and nested inputs, and then through a pipeline of pygenutils
+functions fed with the raw nested list, its plain normalised form or its
+frozen one.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import timeit
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.arrays_and_lists.data_manipulation import (
+    extract_1d_unique_basic,
+    flatten_list,
+    normalise_flat_list
+)
+from pygenutils.arrays_and_lists.patterns import find_duplicated_elements
+from pygenutils.dictionaries.dict_handler import merge_dictionaries
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+# Inputs #
+#--------#
+
+SIZES = [10_000, 100_000, 1_000_000]
+NESTED_SIZE = 100_000
+
+# Timing #
+#--------#
+
+CHAIN_LENGTH = 5
+REPEATS = 5
+
+#------------------#
+# Define functions #
+#------------------#
+
+def legacy_normalise(obj):
+    """
+    Former entry-point check: scan for nested lists, then flatten.
+    """
+    if isinstance(obj, list) and any(isinstance(item, list) for item in obj):
+        obj = flatten_list(obj)
+    return obj
+
+
+def run_chain(normaliser, obj):
+    """
+    Normalise an input at every link of a chain of calls.
+    """
+    for _ in range(CHAIN_LENGTH):
+        obj = normaliser(obj)
+    return obj
+
+
+def best_time(func):
+    return min(timeit.repeat(func, repeat=REPEATS, number=1))
+
+#------------#
+# Operations #
+#------------#
+
+# Chained normalisation #
+print(f"Normalisation over a chain of {CHAIN_LENGTH} calls")
+for size in SIZES:
+    inputs = {
+        "flat" : list(range(size)),
+        "nested" : [[i, i + 1] for i in range(0, size, 2)],
+    }
+    for label, obj in inputs.items():
+        legacy_time = best_time(lambda: run_chain(legacy_normalise, obj))
+        flat_time = best_time(lambda: run_chain(normalise_flat_list, obj))
+        frozen_time = best_time(lambda: run_chain(normalise_flat_list,
+                                                  normalise_flat_list(obj, freeze=True)))
+        print(f"  {label:<6} n={size:<9} legacy {legacy_time:.4f} s, "
+              f"normalise_flat_list {flat_time:.4f} s (x{legacy_time / flat_time:.1f}), "
+              f"frozen {frozen_time:.4f} s (x{legacy_time / frozen_time:.1f})")
+
+# Pipeline of pygenutils functions #
+nested_values = [[i % 1000, [i % 997]] for i in range(NESTED_SIZE)]
+nested_dicts = [[{i: i}, [{i + 1: i}]] for i in range(0, NESTED_SIZE, 2)]
+
+def pipeline(values, dicts):
+    extract_1d_unique_basic(values)
+    find_duplicated_elements(values)
+    merge_dictionaries(dicts)
+    merge_dictionaries(dicts)
+
+raw_time = best_time(lambda: pipeline(nested_values, nested_dicts))
+normalised_time = best_time(lambda: pipeline(normalise_flat_list(nested_values),
+                                             normalise_flat_list(nested_dicts)))
+frozen_time = best_time(lambda: pipeline(normalise_flat_list(nested_values, freeze=True),
+                                         normalise_flat_list(nested_dicts, freeze=True)))
+print(f"\nPipeline on nested inputs of {NESTED_SIZE} items")
+print(f"  raw inputs        : {raw_time:.4f} s")
+print(f"  normalised once   : {normalised_time:.4f} s (x{raw_time / normalised_time:.1f})")
+print(f"  frozen once       : {frozen_time:.4f} s (x{raw_time / frozen_time:.1f})")
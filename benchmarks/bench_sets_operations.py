@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program benchmarks the n-way 'bulk_sets_operator' against the pairwise
+reduction through 'sets_operator' from the 'sets_handler' module.
+Each backend is timed over the same collection of random integer id sets.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+from functools import reduce
+import timeit
+
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.sets_and_intervals.sets_handler import bulk_sets_operator, sets_operator
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+# Random set collection #
+#-----------------------#
+
+N_SETS = 300
+SET_SIZE = 20_000
+VALUE_RANGE = 1_000_000
+RANDOM_SEED = 42
+
+# Timing #
+#--------#
+
+OPERATORS = ["union", "intersection", "difference", "symmetric_difference"]
+BACKENDS = ["numpy", "bitmap", "default"]
+REPEATS = 3
+
+#------------#
+# Operations #
+#------------#
+
+# Build the random id sets #
+rng = np.random.default_rng(RANDOM_SEED)
+int_arrays = [rng.choice(VALUE_RANGE, size=SET_SIZE, replace=False) for _ in range(N_SETS)]
+python_sets = [set(arr.tolist()) for arr in int_arrays]
+
+# Time every operator #
+for operator in OPERATORS:
+    pairwise_time = min(timeit.repeat(
+        lambda: reduce(lambda s1, s2: sets_operator(s1, s2, operator=operator), python_sets),
+        repeat=REPEATS,
+        number=1
+        ))
+    print(f"{operator} ({N_SETS} sets of {SET_SIZE} ids)")
+    print(f"  pairwise sets_operator : {pairwise_time:.4f} s")
+
+    for backend in BACKENDS:
+        operands = python_sets if backend == "default" else int_arrays
+        bulk_time = min(timeit.repeat(
+            lambda: bulk_sets_operator(operands, operator=operator, backend=backend),
+            repeat=REPEATS,
+            number=1
+            ))
+        print(f"  bulk ({backend:<7})         : {bulk_time:.4f} s "
+              f"(x{pairwise_time / bulk_time:.1f})")
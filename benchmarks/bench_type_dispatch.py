@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program benchmarks the type resolution done by functions branching on
+the kind of their input, as in scalar-heavy loops over date/time objects.
+
+The former pattern built the lowercase type name of every object with
+'get_type_str' and compared strings; 'type_key' looks the type object up
+in a registry cached per type, following its MRO. Both are timed on their
+own over a mix of scalars, and then through 'dt_obj_converter' called once
+per record.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+from datetime import datetime, time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from filewise.general.introspection_utils import get_type_str
+from pygenutils._type_dispatch import type_key
+from pygenutils.time_handling.time_formatters import dt_obj_converter
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+# Inputs #
+#--------#
+
+N_RECORDS = 100_000
+SCALARS = [
+    datetime(2024, 1, 31, 12),
+    np.datetime64("2024-01-31T12:00:00"),
+    pd.Timestamp("2024-01-31 12:00:00"),
+    time(12, 30),
+    1.5,
+    "2024-01-31",
+]
+
+# Timing #
+#--------#
+
+REPEATS = 5
+
+#------------------#
+# Define functions #
+#------------------#
+
+def best_time(func):
+    return min(timeit.repeat(func, repeat=REPEATS, number=1))
+
+#------------#
+# Operations #
+#------------#
+
+# Type resolution alone #
+records = [SCALARS[i % len(SCALARS)] for i in range(N_RECORDS)]
+
+name_time = best_time(lambda: [get_type_str(obj, lowercase=True) for obj in records])
+key_time = best_time(lambda: [type_key(obj) for obj in records])
+print(f"Type resolution of {N_RECORDS} mixed scalars")
+print(f"  get_type_str : {name_time:.4f} s")
+print(f"  type_key     : {key_time:.4f} s (x{name_time / key_time:.1f})")
+
+# Per-record conversion #
+dt_records = [obj for obj in records if not isinstance(obj, (float, str))]
+convert_time = best_time(lambda: [dt_obj_converter(obj, "float") for obj in dt_records])
+print(f"\ndt_obj_converter to float, {len(dt_records)} records")
+print(f"  per record   : {convert_time / len(dt_records) * 1e6:.2f} us")
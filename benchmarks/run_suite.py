@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+This program runs the pygenutils benchmark suite, i.e. every case of
+'suite_cases.py' over a size sweep from 10^2 up to 10^7 elements
+(or the case's own cap), timed with the 'benchmark' harness.
+
+Each run is written to a timestamped JSON file under 'benchmarks/results',
+so results accumulate over time. A scaling report follows the timings:
+the growth exponent of each case is the slope of log(median time)
+against log(size) over its largest sizes, and cases growing faster than
+linearly are flagged. If a baseline file is given, regressions against
+it are flagged too. Finally, the public functions of the swept
+subpackages that have no case and are not listed among the documented
+exclusions of 'suite_cases.py' are reported.
+
+Usage
+-----
+python benchmarks/run_suite.py [--max-size N] [--only NAME ...] [--baseline FILE]
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import argparse
+from datetime import datetime
+import importlib
+from inspect import isfunction
+import json
+import os
+import pkgutil
+import sys
+
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from pygenutils.time_handling.program_snippet_exec_timers import (
+    benchmark,
+    compare_to_baseline,
+    load_benchmarks
+)
+from pygenutils.time_handling.instrumentation import _is_script
+from suite_cases import EXCLUDED_FUNCTIONS, SUITE_CASES
+
+#------------------#
+# Define functions #
+#------------------#
+
+def run_case(subpackage, name, func, build_args, sizes, repeats, min_time):
+    """
+    Time one case over its size sweep, returning the results (one per size)
+    and the error message if a call failed.
+    """
+    results = []
+    for size in sizes:
+        args = build_args(size)
+        try:
+            result = benchmark(lambda: func(*args),
+                               name=f"{subpackage}.{name}[{size}]",
+                               repeats=repeats,
+                               min_time=min_time)
+        except Exception as err:
+            return results, f"{type(err).__name__}: {err}"
+        result.metadata.update(subpackage=subpackage, case=name, size=size)
+        results.append(result)
+        print(f"  {name:<30} n={size:<10} median {result.median:.4g} s "
+              f"(IQR {result.iqr:.2g} s, {result.number} loops)")
+    return results, None
+
+
+def growth_exponent(results):
+    """
+    Slope of log(median time) against log(size) over the largest sizes.
+    """
+    fit_results = results[-SCALING_FIT_POINTS:]
+    if len(fit_results) < 2:
+        return None
+    sizes = [result.metadata["size"] for result in fit_results]
+    medians = [result.median for result in fit_results]
+    return float(np.polyfit(np.log(sizes), np.log(medians), 1)[0])
+
+
+def scaling_report(case_results):
+    """
+    Table of the growth exponents, flagging superlinear cases.
+    """
+    lines = ["", f"{'case':<50}{'exponent':>10}  flag"]
+    for case_name, results in case_results.items():
+        exponent = growth_exponent(results)
+        if exponent is None:
+            lines.append(f"{case_name:<50}{'n/a':>10}")
+        else:
+            flag = "SUPERLINEAR" if exponent > SUPERLINEAR_EXPONENT else ""
+            lines.append(f"{case_name:<50}{exponent:>10.2f}  {flag}")
+    return "\n".join(lines)
+
+
+def uncovered_functions(subpackage):
+    """
+    Public functions of a subpackage that neither have a case
+    nor are listed in EXCLUDED_FUNCTIONS.
+    """
+    package = importlib.import_module(f"pygenutils.{subpackage}")
+    known_names = ({case[0] for case in SUITE_CASES.get(subpackage, [])}
+                   | set(EXCLUDED_FUNCTIONS.get(subpackage, {})))
+    uncovered = []
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+        module_name = module_info.name
+        if module_name.rsplit(".", 1)[-1].startswith("_") or _is_script(module_name):
+            continue
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        uncovered.extend(f"{module_name}.{attr_name}"
+                         for attr_name, obj in vars(module).items()
+                         if (not attr_name.startswith("_")
+                             and isfunction(obj)
+                             and obj.__module__ == module_name
+                             and attr_name not in known_names))
+    return uncovered
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the pygenutils benchmark suite.")
+    parser.add_argument("--max-size", type=float, default=MAX_SIZE,
+                        help="Largest size of the sweep (default 1e7).")
+    parser.add_argument("--only", nargs="+", default=None,
+                        help="Run only these subpackages or case names.")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--min-time", type=float, default=MIN_TIME,
+                        help="Minimum duration of a repeat, in seconds.")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON results file of a previous run to compare against.")
+    parser.add_argument("--output-dir", default=RESULTS_DIR)
+    return parser.parse_args()
+
+#-------------------#
+# Define parameters #
+#-------------------#
+
+# Size sweep #
+#------------#
+
+SIZES = [10**exp for exp in range(2, 8)]
+MAX_SIZE = 10**7
+
+# Timing #
+#--------#
+
+REPEATS = 5
+MIN_TIME = 0.05
+
+# Scaling report #
+#----------------#
+
+SCALING_FIT_POINTS = 3
+SUPERLINEAR_EXPONENT = 1.2
+
+# Output #
+#--------#
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+#------------#
+# Operations #
+#------------#
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    # Time every selected case #
+    case_results = {}
+    errors = {}
+    for subpackage, cases in SUITE_CASES.items():
+        selected = [case for case in cases
+                    if args.only is None or subpackage in args.only or case[0] in args.only]
+        if selected:
+            print(subpackage)
+
+        for name, func, build_args, case_max_size in selected:
+            sizes = [size for size in SIZES if size <= min(case_max_size, args.max_size)]
+            results, error = run_case(subpackage, name, func, build_args, sizes,
+                                      args.repeats, args.min_time)
+            case_results[f"{subpackage}.{name}"] = results
+            if error is not None:
+                errors[f"{subpackage}.{name}"] = error
+                print(f"  {name:<30} ERROR {error}")
+
+    # Public functions without a case nor a documented exclusion #
+    uncovered = [func_name
+                 for subpackage in SUITE_CASES
+                 if args.only is None or subpackage in args.only
+                 for func_name in uncovered_functions(subpackage)]
+    
+    # Record the run #
+    os.makedirs(args.output_dir, exist_ok=True)
+    run_stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+    output_path = os.path.join(args.output_dir, f"suite_{run_stamp}.json")
+
+    all_results = [result for results in case_results.values() for result in results]
+    with open(output_path, "w") as json_file:
+        json.dump(dict(
+            run=run_stamp,
+            results=[result.to_dict() for result in all_results],
+            growth_exponents={case_name: growth_exponent(results)
+                              for case_name, results in case_results.items()},
+            errors=errors,
+            uncovered=uncovered
+        ), json_file, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    # Scaling report #
+    print(scaling_report(case_results))
+    
+    # Coverage of the public functions #
+    if uncovered:
+        print(f"\n{len(uncovered)} public functions have no case nor documented exclusion:")
+        for func_name in uncovered:
+            print(f"  {func_name}")
+
+    # Comparison with a previous run #
+    if args.baseline is not None:
+        with open(args.baseline) as json_file:
+            baseline = json.load(json_file)
+        if isinstance(baseline, dict):
+            baseline = baseline["results"]
+        else:
+            baseline = load_benchmarks(args.baseline)
+
+        print()
+        for comparison in compare_to_baseline(all_results, baseline):
+            if comparison["regression"] or comparison["improvement"]:
+                label = "REGRESSION" if comparison["regression"] else "improvement"
+                print(f"{label:<12} {comparison['name']:<50} x{comparison['ratio']:.2f}")
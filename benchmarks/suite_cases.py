@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+**Note**
+
+Catalogue of the size-parametrised cases of the benchmark suite run by
+'run_suite.py', grouped by subpackage.
+
+Each case is a tuple (name, function, input builder, maximum size):
+the input builder takes a size n and returns the positional arguments
+of the call, built outside the timed region. The maximum size caps the
+sweep for functions that loop in pure Python, so that a full run stays
+within minutes. Case names are those of the public functions they time.
+
+Public functions whose input has no size to sweep (a single path, date
+or scalar), or which act on the file system, the clock or the process,
+are listed in EXCLUDED_FUNCTIONS with the reason. 'run_suite.py' reports
+any public function that is neither benchmarked nor excluded.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+import pandas as pd
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.arrays_and_lists.conversions import (
+    combine_arrays,
+    convert_data_type,
+    flatten_to_string
+)
+from pygenutils.arrays_and_lists.data_manipulation import (
+    extend_array,
+    extract_1d_unique_basic,
+    flatten_list,
+    flip_array,
+    insert_values,
+    normalise_flat_list,
+    remove_elements,
+    revert_1d_basic,
+    sort_1d_basic,
+    sort_columns_by_row,
+    sort_rows_by_column,
+    sort_values_standard
+)
+from pygenutils.arrays_and_lists.maths import unique_pairs
+from pygenutils.arrays_and_lists.patterns import (
+    approach_value,
+    count_consecutive,
+    detect_subarray_in_array,
+    find_duplicated_elements,
+    find_item_basic,
+    select_elements,
+    unique_type_objects
+)
+from pygenutils.dictionaries.dict_handler import merge_dictionaries, sort_object_of_dictionaries
+from pygenutils.dictionaries.dict_operators import dict_value_basic_operator
+from pygenutils.number_bases.base_converters import (
+    arbitrary2dec,
+    base2bin,
+    base2bin_array,
+    base2hex,
+    base2hex_array,
+    base2oct,
+    base2oct_array,
+    bin2dec,
+    bin2dec_array,
+    bin2dec_basic,
+    convert_among_arbitraries,
+    dec2bin_basic,
+    hex2dec,
+    hex2dec_array,
+    oct2dec
+)
+from pygenutils.number_bases.binary_operations import (
+    buffer_to_array,
+    buffer_to_str_chunks,
+    bytes_obj_to_int,
+    bytes_obj_to_str,
+    str2bytes,
+    str_to_buffer,
+    str_to_byte_array,
+    struct_format_to_dtype,
+    unpack_records
+)
+from pygenutils.number_bases.bitwise_operators import (
+    bitwise_and,
+    bitwise_or,
+    bitwise_xor,
+    extract_bit_field,
+    is_bit_set,
+    leftwards_bitshift,
+    popcount,
+    rightwards_bitshift
+)
+from pygenutils.number_bases.mathematical_utils import adapted_factorial
+from pygenutils.sets_and_intervals.interval_handler import (
+    basic_interval_operator,
+    numpy_interval_operator,
+    to_pandas_interval_array
+)
+from pygenutils.sets_and_intervals.sets_handler import bulk_sets_operator, sets_operator
+from pygenutils.strings.string_handler import (
+    case_modifier,
+    find_substring_index,
+    strip,
+    substring_replacer
+)
+from pygenutils.strings.text_formatters import (
+    format_string,
+    format_table,
+    format_table_from_list,
+    format_table_from_lists,
+    string_underliner
+)
+from pygenutils.time_handling.calendar_utils import leap_year_detector
+from pygenutils.time_handling.date_and_time_maths import dt_average, sum_date_objects, sum_dt_objects
+from pygenutils.time_handling.date_and_time_utils import (
+    infer_dt_range,
+    infer_frequency,
+    merge_datetime_dataframes
+)
+from pygenutils.time_handling.time_formatters import dt_obj_converter, parse_dt_string, parse_float_dt
+from pygenutils.time_handling.time_utils import get_nano_datetime_array
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Input builders #
+#----------------#
+
+def _int_array(n):
+    return RNG.integers(0, n, size=n)
+
+def _uint_array(n):
+    return RNG.integers(0, 2**32, size=n, dtype=np.uint64)
+
+def _float_array(n):
+    return RNG.random(n)
+
+def _nested_list(n):
+    return [[i, [i + 1, i + 2]] for i in range(0, n, 3)]
+
+def _runs_array(n):
+    return RNG.integers(0, 2, size=n)
+
+def _str_list(n):
+    return [f"item_{i}" for i in range(n)]
+
+def _epoch_seconds(n):
+    return RNG.integers(0, 2_000_000_000, size=n)
+
+def _date_strings(n):
+    return pd.to_datetime(_epoch_seconds(n), unit="s").strftime("%Y-%m-%d %H:%M:%S").to_numpy()
+
+def _clock_strings(n):
+    return pd.to_datetime(RNG.integers(0, 86_400, size=n), unit="s").strftime("%H:%M:%S").to_numpy()
+
+def _datetime64_array(n):
+    return _epoch_seconds(n).astype("datetime64[s]")
+
+def _dict_list(n):
+    return [{"a": i, "b": 2 * i} for i in range(n)]
+
+def _intervals(n):
+    left = np.sort(RNG.random(n) * n)
+    return np.column_stack([left, left + RNG.random(n) * 3])
+
+def _int_sets(n):
+    return [set(RNG.choice(10 * n, size=n, replace=False).tolist()) for _ in range(2)]
+
+def _int_set_arrays(n):
+    return [RNG.choice(10 * n, size=n, replace=False) for _ in range(8)]
+
+def _digit_string(n, digits="0123456789"):
+    return "".join(RNG.choice(list(digits), size=n))
+
+def _big_int(n):
+    # About n decimal digits, built without the int-to-str digit limit
+    return int.from_bytes(RNG.bytes(max(n * 5 // 12, 1)), "big") | 1
+
+def _date_only_strings(n):
+    return pd.to_datetime(_epoch_seconds(n), unit="s").strftime("%Y-%m-%d").to_numpy()
+
+def _hourly_series(n):
+    return pd.Series(pd.date_range("2000-01-01", periods=n, freq="h"))
+
+def _hourly_frame(n):
+    return pd.DataFrame({"time": pd.date_range("2000-01-01", periods=n, freq="h"), "a": _float_array(n)})
+
+def _hourly_frames(n):
+    times = pd.date_range("2000-01-01", periods=n, freq="h")
+    return (pd.DataFrame({"time": times, "a": _float_array(n)}),
+            pd.DataFrame({"time": times[::2], "b": _float_array(len(times[::2]))}))
+
+def _interval_tuples(n):
+    return [tuple(bounds) for bounds in _intervals(n).tolist()]
+
+def _utf8_text(n):
+    return "Neño € " * (n // 7 + 1)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Random input generator #
+RNG = np.random.default_rng(42)
+
+# Benchmark cases per subpackage #
+#--------------------------------#
+
+SUITE_CASES = {
+    "arrays_and_lists" : [
+        ("flatten_list", flatten_list, lambda n: (_nested_list(n),), 10**6),
+        ("flatten_to_string", flatten_to_string, lambda n: (_str_list(n),), 10**6),
+        ("combine_arrays", combine_arrays, lambda n: ([_float_array(n).reshape(-1, 1), _float_array(n).reshape(-1, 1)],), 10**7),
+        ("sort_values_standard", sort_values_standard, lambda n: (_float_array(n),), 10**7),
+        ("remove_elements", remove_elements, lambda n: (_float_array(n), [0, n // 2]), 10**7),
+        ("extract_1d_unique_basic", extract_1d_unique_basic, lambda n: (_int_array(n).tolist(),), 10**6),
+        ("unique_pairs", unique_pairs, lambda n: (list(range(n)),), 10**3),
+        ("count_consecutive", count_consecutive, lambda n: (_runs_array(n),), 10**7),
+        ("find_duplicated_elements", find_duplicated_elements, lambda n: (_int_array(n).tolist(),), 10**6),
+        ("find_item_basic", find_item_basic, lambda n: (_int_array(n), 0), 10**3),
+        ("select_elements", select_elements, lambda n: (_float_array(n), list(range(0, n, 2))), 10**6),
+        ("approach_value", approach_value, lambda n: (_float_array(n), 0.5), 10**7),
+        ("convert_data_type", convert_data_type, lambda n: (_float_array(n), "float64", "float32"), 10**7),
+        ("normalise_flat_list", normalise_flat_list, lambda n: (_nested_list(n),), 10**6),
+        ("sort_1d_basic", sort_1d_basic, lambda n: (_int_array(n).tolist(),), 10**3),
+        ("sort_rows_by_column", sort_rows_by_column, lambda n: (RNG.random((n, 4)), 0), 10**6),
+        ("sort_columns_by_row", sort_columns_by_row, lambda n: (RNG.random((4, n)), 0), 10**6),
+        ("revert_1d_basic", revert_1d_basic, lambda n: (_int_array(n).tolist(),), 10**6),
+        ("flip_array", flip_array, lambda n: (_float_array(n),), 10**7),
+        ("insert_values", insert_values, lambda n: (_float_array(n), n // 2, [1.0, 2.0]), 10**7),
+        ("extend_array", extend_array, lambda n: (_int_array(n).tolist(), _int_array(n).tolist()), 10**6),
+        ("detect_subarray_in_array", detect_subarray_in_array, lambda n: (_int_array(n), _int_array(100)), 10**7),
+        ("unique_type_objects", unique_type_objects, lambda n: (_str_list(n),), 10**6),
+    ],
+    "strings" : [
+        ("find_substring_index", find_substring_index, lambda n: (_str_list(n), "item_1"), 10**6),
+        ("substring_replacer", substring_replacer, lambda n: ("ab" * n, "b", "c"), 10**7),
+        ("format_string", format_string, lambda n: ("{} " * n, list(range(n))), 10**6),
+        ("case_modifier", case_modifier, lambda n: ("ab" * (n // 2), "upper"), 10**7),
+        ("strip", strip, lambda n: (" " * 8 + "a" * n + " " * 8,), 10**7),
+        ("string_underliner", string_underliner, lambda n: ("a" * n,), 10**7),
+        ("format_table", format_table, lambda n: ({i: {"a": i, "b": 2 * i} for i in range(n)},), 10**5),
+        ("format_table_from_list", format_table_from_list, lambda n: (_dict_list(n),), 10**5),
+        ("format_table_from_lists", format_table_from_lists,
+         lambda n: (["a", "b"], [[i, 2 * i] for i in range(n)]), 10**5),
+    ],
+    "time_handling" : [
+        ("parse_dt_string", parse_dt_string, lambda n: (_date_strings(n), "%Y-%m-%d %H:%M:%S"), 10**6),
+        ("parse_float_dt", parse_float_dt, lambda n: (_epoch_seconds(n),), 10**7),
+        ("dt_obj_converter", dt_obj_converter, lambda n: (_datetime64_array(n), "float"), 10**7),
+        ("sum_dt_objects", sum_dt_objects, lambda n: (_clock_strings(n),), 10**7),
+        ("dt_average", dt_average, lambda n: (_clock_strings(n),), 10**7),
+        ("get_nano_datetime_array", get_nano_datetime_array, lambda n: (_epoch_seconds(n) * 10**9,), 10**6),
+        ("sum_date_objects", sum_date_objects,
+         lambda n: (_date_only_strings(n), "sum", "%F", "default", np.arange(n) // 2), 10**6),
+        ("leap_year_detector", leap_year_detector, lambda n: (1, n), 10**6),
+        ("infer_frequency", infer_frequency, lambda n: (_hourly_series(n),), 10**7),
+        ("infer_dt_range", infer_dt_range, lambda n: (_hourly_frame(n),), 10**7),
+        ("merge_datetime_dataframes", merge_datetime_dataframes, _hourly_frames, 10**6),
+    ],
+    "number_bases" : [
+        ("base2bin_array", base2bin_array, lambda n: (_uint_array(n),), 10**7),
+        ("bin2dec_array", bin2dec_array, lambda n: (base2bin_array(_uint_array(n)),), 10**6),
+        ("hex2dec_array", hex2dec_array, lambda n: (np.char.mod("%x", _uint_array(n)),), 10**6),
+        ("bitwise_and", bitwise_and, lambda n: (_uint_array(n), _uint_array(n)), 10**7),
+        ("popcount", popcount, lambda n: (_uint_array(n),), 10**7),
+        ("arbitrary2dec", arbitrary2dec, lambda n: (_digit_string(n), 10), 10**6),
+        ("adapted_factorial", adapted_factorial, lambda n: (n, 10), 10**7),
+        ("base2oct_array", base2oct_array, lambda n: (_uint_array(n),), 10**7),
+        ("base2hex_array", base2hex_array, lambda n: (_uint_array(n),), 10**7),
+        ("base2bin", base2bin, lambda n: (_big_int(n),), 10**6),
+        ("base2oct", base2oct, lambda n: (_big_int(n),), 10**6),
+        ("base2hex", base2hex, lambda n: (_big_int(n),), 10**6),
+        ("dec2bin_basic", dec2bin_basic, lambda n: (_big_int(n),), 10**4),
+        ("bin2dec", bin2dec, lambda n: ("1" + _digit_string(n - 1, "01"),), 10**6),
+        ("bin2dec_basic", bin2dec_basic, lambda n: ("1" + _digit_string(n - 1, "01"),), 10**5),
+        ("oct2dec", oct2dec, lambda n: ("1" + _digit_string(n - 1, "01234567"),), 10**6),
+        ("hex2dec", hex2dec, lambda n: ("1" + _digit_string(n - 1, "0123456789abcdef"),), 10**6),
+        ("convert_among_arbitraries", convert_among_arbitraries, lambda n: (_digit_string(n), 10, 16), 10**6),
+        ("bitwise_or", bitwise_or, lambda n: (_uint_array(n), _uint_array(n)), 10**7),
+        ("bitwise_xor", bitwise_xor, lambda n: (_uint_array(n), _uint_array(n)), 10**7),
+        ("leftwards_bitshift", leftwards_bitshift, lambda n: (_uint_array(n), 3), 10**7),
+        ("rightwards_bitshift", rightwards_bitshift, lambda n: (_uint_array(n), 3), 10**7),
+        ("is_bit_set", is_bit_set, lambda n: (_uint_array(n), 5), 10**7),
+        ("extract_bit_field", extract_bit_field, lambda n: (_uint_array(n), 2, 5), 10**7),
+        ("str2bytes", str2bytes, lambda n: (_utf8_text(n),), 10**7),
+        ("str_to_byte_array", str_to_byte_array, lambda n: (_utf8_text(n),), 10**7),
+        ("bytes_obj_to_int", bytes_obj_to_int, lambda n: (RNG.bytes(n),), 10**7),
+        ("bytes_obj_to_str", bytes_obj_to_str, lambda n: (_utf8_text(n).encode(),), 10**7),
+        ("buffer_to_array", buffer_to_array, lambda n: (RNG.bytes(8 * n), "uint64"), 10**7),
+        ("unpack_records", unpack_records, lambda n: (RNG.bytes(8 * n), "<Ihh"), 10**7),
+        ("struct_format_to_dtype", struct_format_to_dtype, lambda n: ("<" + "ih" * (n // 2),), 10**4),
+        ("str_to_buffer", str_to_buffer, lambda n: (_utf8_text(n),), 10**7),
+        ("buffer_to_str_chunks", lambda buffer: "".join(buffer_to_str_chunks(buffer)),
+         lambda n: (_utf8_text(n).encode(),), 10**7),
+    ],
+    "dictionaries" : [
+        ("merge_dictionaries", merge_dictionaries, lambda n: ([{i: i} for i in range(n)],), 10**6),
+        ("sort_object_of_dictionaries", sort_object_of_dictionaries,
+         lambda n: (dict(zip(_int_array(n).tolist(), range(n))),), 10**6),
+        ("dict_value_basic_operator", dict_value_basic_operator, lambda n: (_dict_list(n), "+"), 10**5),
+    ],
+    "sets_and_intervals" : [
+        ("sets_operator", sets_operator, lambda n: tuple(_int_sets(n)), 10**6),
+        ("bulk_sets_operator", bulk_sets_operator, lambda n: (_int_set_arrays(n),), 10**6),
+        ("numpy_interval_operator", numpy_interval_operator, lambda n: (_intervals(n),), 10**7),
+        ("to_pandas_interval_array", to_pandas_interval_array, lambda n: (_intervals(n),), 10**7),
+        ("basic_interval_operator", basic_interval_operator,
+         lambda n: (_interval_tuples(n), "intervaltree"), 10**5),
+    ],
+}
+
+# Public functions left out of the suite, with the reason #
+#---------------------------------------------------------#
+
+_SCALAR_INPUT = "single scalar, date or string input, with no size to sweep"
+_FILE_PATH_INPUT = "single file path input, with no size to sweep"
+_SIDE_EFFECTS = "acts on the file system, the clock or the process"
+
+EXCLUDED_FUNCTIONS = {
+    "arrays_and_lists" : {},
+    "strings" : {
+        "obj_path_specs" : _FILE_PATH_INPUT,
+        "get_obj_specs" : _FILE_PATH_INPUT,
+        "modify_obj_specs" : _FILE_PATH_INPUT,
+        "add_to_path" : _FILE_PATH_INPUT,
+        "append_ext" : _FILE_PATH_INPUT,
+        "print_format_string" : "prints 'format_string' output, which is benchmarked",
+        "print_percent_string" : "prints its output; a single %-formatting call",
+    },
+    "time_handling" : {
+        "datetime_obj_converter" : _SCALAR_INPUT,
+        "get_datetime_object_unit" : _SCALAR_INPUT,
+        "get_nano_datetime" : "scalar counterpart of 'get_nano_datetime_array', which is benchmarked",
+        "make_converter" : "builds the converters 'dt_obj_converter' caches and applies, which is benchmarked",
+        "extract_dt_part" : _SCALAR_INPUT,
+        "return_date_part" : _SCALAR_INPUT,
+        "natural_year" : _SCALAR_INPUT,
+        "nearest_leap_year" : _SCALAR_INPUT,
+        "week_range" : _SCALAR_INPUT,
+        "find_dt_key" : "scans the column or dimension names only",
+        "display_user_timestamp" : _SCALAR_INPUT,
+        "get_current_datetime" : _SIDE_EFFECTS,
+        "get_obj_operation_datetime" : _SIDE_EFFECTS,
+        "standardise_calendar" : "needs xarray/NetCDF inputs and writes files",
+        "program_exec_timer" : _SIDE_EFFECTS,
+        "snippet_exec_timer" : "timing harness",
+        "benchmark" : "timing harness used by the suite itself",
+        "save_benchmarks" : _SIDE_EFFECTS,
+        "load_benchmarks" : _SIDE_EFFECTS,
+        "compare_to_baseline" : "timing harness used by the suite itself",
+        "enable_instrumentation" : _SIDE_EFFECTS,
+        "disable_instrumentation" : _SIDE_EFFECTS,
+        "is_instrumentation_enabled" : _SIDE_EFFECTS,
+        "load_call_profiles" : _SIDE_EFFECTS,
+    },
+    "number_bases" : {
+        "validate_input" : "single type check",
+    },
+    "dictionaries" : {},
+    "sets_and_intervals" : {
+        "define_interval" : _SCALAR_INPUT,
+    },
+}
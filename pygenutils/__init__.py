@@ -15,4 +15,14 @@ __all__ = [
     'sets_and_intervals',
     'strings',
     'time_handling',
-]
\ No newline at end of file
+]
+
+# Load the submodules on first access
+from pygenutils._lazy_imports import lazy_submodules
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
+
+# Opt-in instrumentation of the public functions (see 'time_handling.instrumentation')
+import os as _os
+if _os.environ.get("PYGENUTILS_INSTRUMENT"):
+    from pygenutils.time_handling.instrumentation import _enable_from_environment
+    _enable_from_environment()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Helpers keeping heavy dependencies and subpackages out of import time.
+
+Packages load their submodules on first attribute access (PEP 562), and
+objects are checked against pandas types only if pandas has already been
+imported by someone else, since otherwise they cannot be pandas objects.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import importlib
+import sys
+
+#------------------#
+# Define functions #
+#------------------#
+
+def lazy_submodules(package_name, submodule_names):
+    """
+    Module '__getattr__' and '__dir__' functions importing the submodules
+    of a package on first access, e.g. 'pygenutils.strings.string_handler'
+    after a bare 'import pygenutils'.
+
+    Parameters
+    ----------
+    package_name : str
+        Name of the package, i.e. its '__name__'.
+    submodule_names : list[str]
+        Names of the submodules loaded on demand, i.e. its '__all__'.
+
+    Returns
+    -------
+    tuple[function, function]
+        The '__getattr__' and '__dir__' functions of the package.
+    """
+    def __getattr__(name):
+        if name in submodule_names:
+            return importlib.import_module(f"{package_name}.{name}")
+        raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(submodule_names))
+
+    return __getattr__, __dir__
+
+
+def is_pandas_instance(obj, *type_names):
+    """
+    Whether an object is an instance of any of the given pandas types
+    (e.g. "Series", "DataFrame"), without importing pandas.
+    """
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, tuple(getattr(pd, type_name)
+                                                    for type_name in type_names))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Type dispatch keyed on the type objects themselves.
+
+Functions branching on the kind of their input look the object's type up
+in a registry, following its MRO as 'functools.singledispatch' does, so
+that subclasses resolve to their closest registered base. The resolution
+is cached per type, so repeated calls on objects of a known type cost one
+dictionary lookup, without building any type-name string.
+
+Third-party types (pandas, numpy, xarray, arrow...) are registered by
+their dotted names and resolved only once their module has been imported
+by someone else, since otherwise no object can be of those types.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import sys
+import threading
+
+#------------------#
+# Define functions #
+#------------------#
+
+class TypeRegistry:
+    """
+    Registry mapping types to values (type keys, handlers...), resolved
+    along the MRO of the looked-up type and cached per type.
+
+    Parameters
+    ----------
+    registry : dict, optional
+        Initial mapping of types, or of dotted type names such as
+        "pandas.Series", to their values.
+    default : callable, optional
+        Function returning the value of types with no registered base.
+        If not given, such types resolve to None.
+        
+    Lookups of cached types take no lock; resolutions and registrations
+    are serialised, so the registry can be shared across threads.
+    """
+
+    def __init__(self, registry=None, default=None):
+        self._registry = {}
+        self._lazy_registry = {}
+        self._cache = {}
+        self._default = default
+        self._lock = threading.Lock()
+        for type_obj, value in (registry or {}).items():
+            self.register(type_obj, value)
+
+    def register(self, type_obj, value):
+        """
+        Register the value of a type, given either as the type itself or
+        as its dotted name (e.g. "xarray.DataArray"), to be resolved when
+        its module is first found imported.
+        """
+        with self._lock:
+            if isinstance(type_obj, str):
+                self._lazy_registry[type_obj] = value
+            else:
+                self._registry[type_obj] = value
+            self._cache.clear()
+
+    def lookup(self, obj):
+        """
+        Value registered for the type of an object.
+        """
+        obj_type = type(obj)
+        try:
+            return self._cache[obj_type]
+        except KeyError:
+            return self.resolve(obj_type)
+
+    def resolve(self, obj_type):
+        """
+        Value registered for a type or its closest base in the MRO,
+        caching the result.
+        """
+        with self._lock:
+            self._resolve_lazy_types()
+            for base in obj_type.__mro__:
+                if base in self._registry:
+                    value = self._registry[base]
+                    break
+            else:
+                value = self._default(obj_type) if self._default is not None else None
+            self._cache[obj_type] = value
+        return value
+
+    def _resolve_lazy_types(self):
+        # Called with the lock held
+        for type_name in list(self._lazy_registry):
+            module_name, _, attr_name = type_name.rpartition(".")
+            module = sys.modules.get(module_name)
+            if module is not None:
+                type_obj = getattr(module, attr_name, None)
+                value = self._lazy_registry.pop(type_name, None)
+                if type_obj is not None and value is not None:
+                    self._registry.setdefault(type_obj, value)
+
+
+def _type_name_key(obj_type):
+    return obj_type.__name__.lower()
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Lowercase keys of the types the dispatch dictionaries branch on #
+TYPE_KEYS = TypeRegistry({
+    bool : "bool",
+    int : "int",
+    float : "float",
+    complex : "complex",
+    str : "str",
+    bytes : "bytes",
+    list : "list",
+    tuple : "tuple",
+    dict : "dict",
+    set : "set",
+    frozenset : "frozenset",
+    "datetime.datetime" : "datetime",
+    "datetime.date" : "date",
+    "datetime.time" : "time",
+    "datetime.timedelta" : "timedelta",
+    "time.struct_time" : "struct_time",
+    "numpy.ndarray" : "ndarray",
+    "numpy.datetime64" : "datetime64",
+    "numpy.timedelta64" : "timedelta64",
+    "pandas.DataFrame" : "dataframe",
+    "pandas.Series" : "series",
+    "pandas.Timestamp" : "timestamp",
+    "pandas.Timedelta" : "timedelta",
+    "xarray.DataArray" : "dataarray",
+    "xarray.Dataset" : "dataset",
+    "arrow.Arrow" : "arrow",
+}, default=_type_name_key)
+
+# Lowercase key of an object's type, e.g. "series" for a pandas Series #
+type_key = TYPE_KEYS.lookup
@@ -9,4 +9,8 @@ __all__ = [
     'data_manipulation',
     'maths',
     'patterns'
-]
\ No newline at end of file
+]
+
+# Load the submodules on first access
+from pygenutils._lazy_imports import lazy_submodules
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
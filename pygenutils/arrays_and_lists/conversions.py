@@ -11,8 +11,8 @@ import numpy as np
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 
 #------------------#
 # Define functions #
@@ -56,10 +56,10 @@ def convert_data_type(obj_data, old_type, new_type, colnames=None, convert_to_li
         If specified columns are not found in pandas DataFrame.
     """
     # Get input object's type
-    obj_type = get_type_str(obj_data)
+    obj_type = type_key(obj_data)
     
     # Handle pandas DataFrames
-    if obj_type == "DataFrame":
+    if obj_type == "dataframe":
         if colnames is None:
             raise ValueError("Please specify 'colnames' for pandas DataFrame.")
         if colnames == '__all_columns__':  # apply to all columns
@@ -90,7 +90,7 @@ def convert_data_type(obj_data, old_type, new_type, colnames=None, convert_to_li
         return data_converted
 
     # Handle pandas Series
-    elif obj_type == "Series":       
+    elif obj_type == "series":       
         if obj_data.dtype == old_type:
             try:
                 return obj_data.astype(new_type)
@@ -105,7 +105,7 @@ def convert_data_type(obj_data, old_type, new_type, colnames=None, convert_to_li
         try:
             # Handle nested lists by flattening them first
             if isinstance(obj_data, list):
-                obj_data = np.array(flatten_list(obj_data))
+                obj_data = np.array(normalise_flat_list(obj_data))
             else:
                 obj_data = np.array(obj_data)  # convert to numpy array if it's not already
             if obj_data.dtype == old_type:
@@ -193,7 +193,7 @@ def combine_arrays(array_of_lists):
             except ValueError:
                 # If direct conversion fails due to irregular nesting,
                 # flatten the list and convert
-                flattened = flatten_list(item)
+                flattened = normalise_flat_list(item)
                 processed_arrays.append(np.array(flattened))
         else:
             processed_arrays.append(item)
@@ -272,16 +272,15 @@ def flatten_to_string(obj, delim=" ", add_final_space=False):
     that require string input. Nested lists are automatically flattened.
     """
     # Get input object type 
-    obj_type = get_type_str(obj)
+    obj_type = type_key(obj)
     
     # Validate input type #
-    if obj_type not in ["list", "ndarray", "DataFrame", "Series"]:
+    if obj_type not in ["list", "ndarray", "dataframe", "series"]:
         raise TypeError("'flatten_to_string' supports list | numpy.ndarray | pandas.DataFrame | pandas.Series.")
     
     # Handle different input types and convert to flattened array
     if obj_type == "list":
-        # Use flatten_list for proper nested list handling
-        obj_val_array = np.array(flatten_list(obj))
+        obj_val_array = np.array(normalise_flat_list(obj))
     elif obj_type == "ndarray":
         # NumPy arrays can be flattened directly
         obj_val_array = obj.flatten()
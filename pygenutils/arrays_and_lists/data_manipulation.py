@@ -6,12 +6,13 @@
 #----------------#
 
 import numpy as np
-from pandas import Series, DataFrame
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
+from pygenutils._lazy_imports import is_pandas_instance
+
 #------------------#
 # Define functions # 
 #------------------#
@@ -89,6 +90,23 @@ def _flatten_generator(lst):
         else:
             yield item
 
+def _selection_sort(arr, reverse):
+    """
+    Sort an already flat list or 1D array in place, by selection.
+    
+    Callers that have just built a new flat list pass it here directly,
+    since 'sort_1d_basic' would scan and copy it once more.
+    """
+    for i in range(len(arr)):
+        current = i
+        for k in range(i+1, len(arr)):
+            if not reverse and arr[k] < arr[current]:
+                current = k
+            elif reverse and arr[k] > arr[current]:
+                current = k
+        _pos_swapper(arr, current, i)
+    return arr
+
 # Main #
 def sort_values_standard(array, key=None, reverse=False,
                          axis=-1, order=None,
@@ -131,12 +149,12 @@ def sort_values_standard(array, key=None, reverse=False,
     dtype: int64
     """
     # Check input type (allow pandas Series as well)
-    if isinstance(array, (list, np.ndarray, Series)):
+    if isinstance(array, (list, np.ndarray)) or is_pandas_instance(array, "Series"):
         if isinstance(array, list):
             array.sort(key=key, reverse=reverse)
         elif isinstance(array, np.ndarray):
             array = np.sort(array, axis=axis, order=order)[::-1] if reverse else np.sort(array, axis=axis, order=order)
-        elif isinstance(array, Series):
+        else:
             array = array.sort_values(ascending=not reverse)
         return np.array(array) if want_numpy_array else array
     else:
@@ -162,19 +180,11 @@ def sort_1d_basic(arr, reverse=False):
     if isinstance(arr, np.ndarray):
         if arr.ndim >= 2:
             arr = arr.flatten()
-    elif isinstance(arr, list):
-        arr = flatten_list(arr)
+    else:
+        arr = normalise_flat_list(arr, copy=True)
 
     # Program progression #
-    for i in range(len(arr)):
-        current = i
-        for k in range(i+1, len(arr)):
-            if not reverse and arr[k] < arr[current]:
-                current = k
-            elif reverse and arr[k] > arr[current]:
-                current = k
-        _pos_swapper(arr, current, i)
-    return arr
+    return _selection_sort(arr, reverse)
 
 
 # Advanced #
@@ -219,7 +229,7 @@ def sort_rows_by_column(array, ncol, reverse=False, order=None):
            [4, 6, 4, 5],
            [3, 9, 7, 1]])
     """
-    if isinstance(array, DataFrame):
+    if is_pandas_instance(array, "DataFrame"):
         return array.sort_values(by=array.columns[ncol], ascending=not reverse)
     
     if isinstance(array, (list, np.ndarray)):
@@ -264,7 +274,7 @@ def sort_columns_by_row(array, nrow, reverse=False):
            [3, 9, 1, 7],
            [5, 4, 6, 4]])
     """
-    if isinstance(array, DataFrame):
+    if is_pandas_instance(array, "DataFrame"):
         return array.T.sort_values(by=array.T.columns[nrow], ascending=not reverse).T
     
     array = np.array(array).T
@@ -302,13 +312,13 @@ def revert_1d_basic(arr, procedure="index"):
     if isinstance(arr, np.ndarray):
         if arr.ndim >= 2:
             arr = arr.flatten()
-    elif isinstance(arr, list):
-        arr = flatten_list(arr)
+    else:
+        arr = normalise_flat_list(arr, copy=True)
 
     # Program progression #
     arr_len = len(arr)-1
     if procedure == "iterative":
-        for i in range(arr_len//2):
+        for i in range(len(arr)//2):
             _pos_swapper(arr, i, arr_len-i)
     elif procedure == "index":
         arr = arr[::-1]
@@ -382,13 +392,14 @@ def insert_values(x, index, values, axis=None):
     2      3
     dtype: int64
     """
-    if isinstance(x, (list, np.ndarray, Series)):
+    if isinstance(x, (list, np.ndarray)) or is_pandas_instance(x, "Series"):
         if isinstance(x, list):
             x.insert(index, values)
         elif isinstance(x, np.ndarray):
             x = np.insert(x, index, values, axis=axis)
-        elif isinstance(x, Series):
-            x = x.append(Series(values)).sort_index()
+        else:
+            import pandas as pd
+            x = pd.concat([x, pd.Series(values)]).sort_index()
         return x
     raise TypeError(f"Unsupported type '{type(x)}' for insertion.")
 
@@ -430,8 +441,9 @@ def extend_array(obj, obj2extend, np_axis=None):
         obj.extend(obj2extend)
     elif isinstance(obj, np.ndarray):
         obj = np.concatenate((obj, obj2extend), axis=np_axis)
-    elif isinstance(obj, Series):
-        obj = obj.append(Series(obj2extend)).sort_index()
+    elif is_pandas_instance(obj, "Series"):
+        import pandas as pd
+        obj = pd.concat([obj, pd.Series(obj2extend)]).sort_index()
     return obj
 
 
@@ -478,7 +490,7 @@ def remove_elements(array, idx2access, axis=None):
             raise TypeError("For list inputs, indices must be an integer or a list/array of integers.")
     elif isinstance(array, np.ndarray):
         array = np.delete(array, idx2access, axis=axis)
-    elif isinstance(array, Series):
+    elif is_pandas_instance(array, "Series"):
         array = array.drop(idx2access)
     else:
         raise TypeError(f"Unsupported type '{type(array)}' for removal.")
@@ -535,9 +547,12 @@ def flatten_list(lst, return_list=True, sort=False, reverse=False):
     [1, 2, 3, 4, 5, 6]
     """
     if return_list:
-        flattened_list = list(_flatten_generator(lst))
+        if isinstance(lst, list):
+            flattened_list = normalise_flat_list(lst, copy=True)
+        else:
+            flattened_list = list(_flatten_generator(lst))
         if sort:
-            return sort_1d_basic(flattened_list, reverse=reverse)
+            return _selection_sort(flattened_list, reverse)
         return flattened_list
     else:
         return _flatten_generator(lst)
@@ -590,8 +605,8 @@ def extract_1d_unique_basic(arr, procedure="dict", sort=False, reverse=False):
     if isinstance(arr, np.ndarray):
         if arr.ndim >= 2:
             arr = arr.flatten()
-    elif isinstance(arr, list):
-        arr = flatten_list(arr)
+    else:
+        arr = normalise_flat_list(arr)
 
     # Program progression #
     if procedure == "dict":
@@ -608,9 +623,114 @@ def extract_1d_unique_basic(arr, procedure="dict", sort=False, reverse=False):
         unique_val_arr = list(set(arr))
                 
     if sort:
-        return sort_1d_basic(unique_val_arr, reverse)
+        return _selection_sort(unique_val_arr, reverse)
     return unique_val_arr
 
+# Input normalisation #
+#---------------------#
+
+def normalise_flat_list(obj, copy=False, freeze=False):
+    """
+    Bring a possibly nested list to its canonical flat form in a single pass.
+    
+    Entry points call this on their list arguments instead of checking
+    for nested lists and then flattening them. Lists are scanned once:
+    a list without nested lists is returned at the end of that scan,
+    and otherwise flattening into a new list starts at the first nested
+    list found.
+    
+    With 'freeze', the result is an immutable list recording that it holds
+    no nested lists. Such lists are returned by this function without
+    being scanned, so data normalised once and passed along a chain of
+    calls pays for the scan only once.
+    
+    Parameters
+    ----------
+    obj : object
+        Object to normalise. Only lists are transformed; any other object
+        (string, tuple, NumPy array, ...) is returned unchanged.
+    copy : bool, optional
+        Whether a list without nested lists must be copied rather than
+        returned as is, for callers that modify the result in place.
+        The copy is always a plain, mutable list. Default is False.
+    freeze : bool, optional
+        Whether to return the flat list as an immutable list that later
+        calls do not scan again. Default is False.
+    
+    Returns
+    -------
+    list | object
+        The flattened list, or the unchanged input if it is not a list.
+    
+    Examples
+    --------
+    >>> normalise_flat_list([1, [2, 3], [4, [5, 6]]])
+    [1, 2, 3, 4, 5, 6]
+    >>> flat_list = [1, 2, 3]
+    >>> normalise_flat_list(flat_list) is flat_list
+    True
+    >>> frozen_list = normalise_flat_list([1, [2, 3]], freeze=True)
+    >>> normalise_flat_list(frozen_list) is frozen_list
+    True
+    """
+    if type(obj) is _FrozenFlatList:
+        return list(obj) if copy else obj
+    if not isinstance(obj, list):
+        return obj
+    
+    for i, item in enumerate(obj):
+        if isinstance(item, list):
+            flat_list = obj[:i]
+            _flatten_into(obj[i:], flat_list)
+            break
+    else:
+        flat_list = list(obj) if (copy or freeze) else obj
+        
+    return _freeze_flat_list(flat_list) if freeze else flat_list
+
+
+def _flatten_into(lst, flat_list):
+    """
+    Append the elements of a nested list to 'flat_list', in order.
+    """
+    for item in lst:
+        if isinstance(item, list):
+            _flatten_into(item, flat_list)
+        else:
+            flat_list.append(item)
+            
+
+class _FrozenFlatList(list):
+    """
+    Immutable list without nested lists, built only by '_freeze_flat_list'.
+    
+    Every mutating method raises a TypeError, so the list cannot come to
+    hold nested lists after having been checked. Slices, concatenations
+    and copies made with list() are plain lists.
+    """
+    
+    __slots__ = ()
+    
+    def __reduce__(self):
+        return (_freeze_flat_list, (list(self),))
+    
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Normalised lists are immutable; copy them with list() to modify them.")
+        
+    __init__ = _immutable
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    
+    
+def _freeze_flat_list(flat_list):
+    """
+    Immutable copy of a list known to hold no nested lists.
+    """
+    frozen_list = list.__new__(_FrozenFlatList)
+    list.__init__(frozen_list, flat_list)
+    return frozen_list
+    
+    
 #--------------------------#
 # Parameters and constants #
 #--------------------------#
@@ -12,7 +12,7 @@ from numpy import array
 # Import project modules #
 #------------------------#
 
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 
 #------------------#
 # Define functions #
@@ -86,7 +86,7 @@ def unique_pairs(array_like, library="python-default"):
     # Input arr #
     # Handle nested lists by flattening them first
     if isinstance(array_like, list):
-        arr = array(flatten_list(array_like))
+        arr = array(normalise_flat_list(array_like))
     else:
         arr = array(array_like)
     
@@ -109,7 +109,7 @@ def unique_pairs(array_like, library="python-default"):
     # Compute pairs of numbers #
     #-#-#-#-#-#-#-#-#-#-#-#-#-#-
     
-    all_pair_combo_arr = RETURN_PAIRS_OPT_DICT.get(library)(array)
+    all_pair_combo_arr = RETURN_PAIRS_OPT_DICT.get(library)(arr)
     return all_pair_combo_arr
 
 
@@ -5,18 +5,18 @@
 # Import modules #
 #----------------#
 
+from importlib import import_module
 import itertools as it
-import more_itertools as mit
 
 import numpy as np
-from pandas import Series
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str, get_caller_args
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list, sort_1d_basic
+from filewise.general.introspection_utils import get_caller_args
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list, sort_1d_basic
 from pygenutils.strings.string_handler import find_substring_index
 
 #------------------#
@@ -61,8 +61,8 @@ def find_item_basic(obj, obj2find):
     if isinstance(obj, np.ndarray):
         if obj.ndim >= 2:
             obj = obj.flatten()
-    elif isinstance(obj, list):
-        obj = flatten_list(obj)
+    else:
+        obj = normalise_flat_list(obj)
     
     # Program progression #
     length = len(obj)
@@ -164,7 +164,7 @@ def detect_subarray_in_array(obj, test_obj,
             return is_test_obj_contained
             
         
-    elif get_type_str(obj) == "Series":        
+    elif type_key(obj) == "series":        
         if not reverse_arg_order:
             is_test_obj_contained = obj.isin(test_obj)
         else:
@@ -209,7 +209,7 @@ def find_duplicated_elements(array_like, remove_duplicated=False):
     
     # Handle nested lists by flattening them first, then convert to numpy array
     if isinstance(array_like, list):
-        flattened_array = np.array(flatten_list(array_like))
+        flattened_array = np.array(normalise_flat_list(array_like))
     else:
         # For tuples and numpy arrays, use the existing approach
         flattened_array = np.asarray(array_like).flatten()
@@ -369,6 +369,7 @@ def count_consecutive(arr, calc_max_len=False):
         consecutive_lens = [len(list(group)) for key, group in it.groupby(arr) if key]
     else:
         # For numeric arrays, group consecutive numbers
+        import more_itertools as mit
         consecutive_lens = [len(list(group)) for group in mit.consecutive_groups(arr)]
     
     if calc_max_len:
@@ -438,7 +439,7 @@ def approach_value(array, given_value):
         
         diff_array = abs(array - given_value)
         
-        value_approach_idx = np.where(array==np.min(diff_array))     
+        value_approach_idx = np.where(diff_array==np.min(diff_array))     
         if dims == 1:        
             value_approach_idx = value_approach_idx[0][0]
             
@@ -476,5 +477,5 @@ MODULES_ADAPTATION = ["numpy", "pandas"]
 # Data type main conversions #
 OBJ_CONVERSION_OPT_DICT = {
     MODULES_ADAPTATION[0] : lambda obj: np.array(obj),
-    MODULES_ADAPTATION[1] : lambda obj: Series(obj)
+    MODULES_ADAPTATION[1] : lambda obj: import_module("pandas").Series(obj)
 }
\ No newline at end of file
@@ -12,7 +12,7 @@ import os
 #------------------------#
 
 from filewise.general.introspection_utils import get_caller_args
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.operative_systems.os_operations import run_system_command, exit_info
 from pygenutils.time_handling.time_formatters import parse_dt_string
 
@@ -52,12 +52,9 @@ def _load_file_list(files):
     TypeError
         If the input is neither a string nor a list
     """
-    # Handle nested lists using the robust flatten_list function
+    # Handle nested lists by flattening them first
     if isinstance(files, list):
-        # Check if there are nested lists and flatten if needed
-        if any(isinstance(item, list) for item in files):
-            files = flatten_list(files)
-        return files
+        return normalise_flat_list(files)
         
     # If it's a string, check if it's a direct media file
     if isinstance(files, str):
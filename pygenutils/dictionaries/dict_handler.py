@@ -5,8 +5,8 @@
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 
 #------------------#
 # Define functions #
@@ -43,15 +43,14 @@ def sort_object_of_dictionaries(obj, sort_by="keys", custom_sort_key=None):
     # Input object type validation #
     #------------------------------#
     
-    if get_type_str(obj) not in ["dict", "list", "tuple", "ndarray"]:
+    if type_key(obj) not in ["dict", "list", "tuple", "ndarray"]:
         raise TypeError("Unsupported object type. "
                         "It must be dict, list, tuple or NumPy array.")
         
     # Handle nested lists by flattening them first
-    if isinstance(obj, list) and any(isinstance(item, list) for item in obj):
-        obj = flatten_list(obj)
+    obj = normalise_flat_list(obj)
         
-    if (get_type_str(obj) in ["list", "tuple", "ndarray"] and len(obj)) < 2:
+    if type_key(obj) in ["list", "tuple", "ndarray"] and len(obj) < 2:
         raise ValueError("At least 2 dictionaries must be provided.")
         
     # Validate sorting option
@@ -109,13 +108,12 @@ def merge_dictionaries(dict_list):
     """
 
     # Validate the input type
-    obj_type = get_type_str(dict_list)
+    obj_type = type_key(dict_list)
     if obj_type not in ["list", "tuple", "ndarray"]:
         raise TypeError("Unsupported object type. Must be list, tuple, or NumPy array.")
     
     # Handle nested lists by flattening them first
-    if isinstance(dict_list, list) and any(isinstance(item, list) for item in dict_list):
-        dict_list = flatten_list(dict_list)
+    dict_list = normalise_flat_list(dict_list)
     
     if len(dict_list) < 2:
         raise ValueError("At least 2 dictionaries must be provided.")
@@ -12,8 +12,8 @@ from functools import reduce
 #------------------------#
 
 from paramlib.global_parameters import BASIC_ARITHMETIC_OPERATORS
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
-from pygenutils.dictionaries.dict_handler import sort_dictionary_by_keys
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
+from pygenutils.dictionaries.dict_handler import sort_object_of_dictionaries
 
 #------------------#
 # Define functions #
@@ -70,8 +70,7 @@ def dict_value_basic_operator(dict_list,
                         "only of dictionaries.")
     
     # Handle nested lists by flattening them first
-    if any(isinstance(item, list) for item in dict_list):
-        dict_list = flatten_list(dict_list)
+    dict_list = normalise_flat_list(dict_list)
     
     # Validate number of dictionaries in the list #
     if len(dict_list) < 2:
@@ -91,7 +90,7 @@ def dict_value_basic_operator(dict_list,
     
     # Order resulting dictionary's keys if desired #
     if return_sorted_keys: 
-        result_dict = sort_dictionary_by_keys(result_dict)
+        result_dict = sort_object_of_dictionaries(result_dict)
         
     return result_dict
 
@@ -101,10 +100,10 @@ def dict_value_basic_operator(dict_list,
 
 # Basic calculator operations #
 ALLOWED_CALC_DICT = {
-    BASIC_ARITHMETIC_OPERATORS[0] : lambda d1, d2 : {k : d1[k]+d2[k] for k in d1.ks() & d2},
-    BASIC_ARITHMETIC_OPERATORS[1] : lambda d1, d2 : {k : d1[k]-d2[k] for k in d1.ks() & d2},
-    BASIC_ARITHMETIC_OPERATORS[2] : lambda d1, d2 : {k : d1[k]*d2[k] for k in d1.ks() & d2},
-    BASIC_ARITHMETIC_OPERATORS[3] : lambda d1, d2 : {k : d1[k]/d2[k] for k in d1.ks() & d2},
-    "//" : lambda d1, d2 : {k : d1[k]//d2[k] for k in d1.ks() & d2},
-    "**" : lambda d1, d2 : {k : d1[k]**d2[k] for k in d1.ks() & d2}
+    BASIC_ARITHMETIC_OPERATORS[0] : lambda d1, d2 : {k : d1[k]+d2[k] for k in d1.keys() & d2},
+    BASIC_ARITHMETIC_OPERATORS[1] : lambda d1, d2 : {k : d1[k]-d2[k] for k in d1.keys() & d2},
+    BASIC_ARITHMETIC_OPERATORS[2] : lambda d1, d2 : {k : d1[k]*d2[k] for k in d1.keys() & d2},
+    BASIC_ARITHMETIC_OPERATORS[3] : lambda d1, d2 : {k : d1[k]/d2[k] for k in d1.keys() & d2},
+    "//" : lambda d1, d2 : {k : d1[k]//d2[k] for k in d1.keys() & d2},
+    "**" : lambda d1, d2 : {k : d1[k]**d2[k] for k in d1.keys() & d2}
 }
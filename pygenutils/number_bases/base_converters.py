@@ -9,6 +9,12 @@ The supported bases include binary, octal, decimal, and hexadecimal, as well as
 arbitrary bases.
 """
 
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+
 #------------------------#
 # Import project modules # 
 #------------------------#
@@ -129,6 +135,9 @@ def dec2bin_basic(n):
     str
         The binary representation of the input number.
     """
+    if isinstance(n, np.ndarray):
+        return base2bin_array(n, zero_pad=1)
+    
     n_checked = _check_input_int(n)
     bits_lsb_first = "" # LSB == Least Significant Bit
     while n_checked >= 1:
@@ -147,8 +156,9 @@ def base2bin(n, procedure="format_string", zero_pad=4):
 
     Parameters
     ----------
-    n : int
-        The input number.
+    n : int | numpy.ndarray
+        The input number. Integer arrays are converted element-wise
+        by `base2bin_array`, ignoring `procedure`.
     procedure : str
         The procedure to use for conversion ('default' or 'format_string').
     zero_pad : int
@@ -156,9 +166,12 @@ def base2bin(n, procedure="format_string", zero_pad=4):
 
     Returns
     -------
-    str
+    str | numpy.ndarray
         The binary representation of the input number.
     """
+    if isinstance(n, np.ndarray):
+        return base2bin_array(n, zero_pad=zero_pad)
+    
     _procedure_checker(procedure, NUMBER_CONVERSION_PROCEDURE_OPTS)
 
     if procedure == "default":
@@ -173,8 +186,9 @@ def base2oct(n, procedure="format_string", zero_pad=4):
 
     Parameters
     ----------
-    n : int
-        The input number.
+    n : int | numpy.ndarray
+        The input number. Integer arrays are converted element-wise
+        by `base2oct_array`, ignoring `procedure`.
     procedure : str
         The procedure to use for conversion ('default' or 'format_string').
     zero_pad : int
@@ -182,9 +196,12 @@ def base2oct(n, procedure="format_string", zero_pad=4):
 
     Returns
     -------
-    str
+    str | numpy.ndarray
         The octal representation of the input number.
     """
+    if isinstance(n, np.ndarray):
+        return base2oct_array(n, zero_pad=zero_pad)
+    
     _procedure_checker(procedure, NUMBER_CONVERSION_PROCEDURE_OPTS)
 
     if procedure == "default":
@@ -199,8 +216,9 @@ def base2hex(n, procedure="format_string", zero_pad=4):
 
     Parameters
     ----------
-    n : int
-        The input number.
+    n : int | float | numpy.ndarray
+        The input number. Integer arrays are converted element-wise
+        by `base2hex_array`, ignoring `procedure`.
     procedure : str
         The procedure to use for conversion ('default' or 'format_string').
     zero_pad : int
@@ -208,9 +226,12 @@ def base2hex(n, procedure="format_string", zero_pad=4):
 
     Returns
     -------
-    str
+    str | numpy.ndarray
         The hexadecimal representation of the input number.
     """
+    if isinstance(n, np.ndarray):
+        return base2hex_array(n, zero_pad=zero_pad)
+    
     _procedure_checker(procedure, NUMBER_CONVERSION_PROCEDURE_OPTS)
 
     if procedure == "default":
@@ -229,14 +250,18 @@ def bin2dec(n_bin):
 
     Parameters
     ----------
-    n_bin : str
-        The binary number as a string.
+    n_bin : str | numpy.ndarray
+        The binary number as a string. String arrays and (n, w) bit matrices
+        are converted element-wise by `bin2dec_array`.
 
     Returns
     -------
-    int
+    int | numpy.ndarray
         The decimal equivalent of the binary number.
     """
+    if isinstance(n_bin, np.ndarray):
+        return bin2dec_array(n_bin)
+    
     if isinstance(n_bin, int):
         n = n_bin
     else:
@@ -318,14 +343,18 @@ def hex2dec(n_hex):
 
     Parameters
     ----------
-    n_hex : str
-        The hexadecimal number as a string.
+    n_hex : str | numpy.ndarray
+        The hexadecimal number as a string. String arrays are converted
+        element-wise by `hex2dec_array`.
 
     Returns
     -------
-    int
+    int | numpy.ndarray
         The decimal equivalent of the hexadecimal number.
     """
+    if isinstance(n_hex, np.ndarray):
+        return hex2dec_array(n_hex)
+    
     if isinstance(n_hex, int):
         n = n_hex
     else:
@@ -338,42 +367,511 @@ def hex2dec(n_hex):
 def arbitrary2dec(x, base=10):
     """
     Converts a number from an arbitrary base to decimal.
+    
+    Long inputs in bases other than powers of two are split recursively
+    and recombined with multiplications by precomputed powers of the base,
+    so the cost is subquadratic in the number of digits and CPython's
+    int/str conversion digit limit does not apply.
 
     Parameters
     ----------
     x : str
         The number as a string.
     base : int
-        The base of the input number.
+        The base of the input number, between 2 and 36.
 
     Returns
     -------
     int
         The decimal equivalent of the input number.
     """
+    _check_base(base)
     x_checked = _check_input_str(x)
-    n = int(x_checked, base=base)
+    n = _base_str_to_int(x_checked, base)
     return n
 
-def convert_among_arbitraries(x, base):
+def convert_among_arbitraries(x, base, target_base=None):
     """
     Converts a number from one arbitrary base to another.
+    
+    Both directions use divide-and-conquer over precomputed powers of the
+    bases, so million-digit numbers convert in subquadratic time, without
+    an intermediate decimal string and without raising CPython's
+    int/str conversion digit limit.
 
     Parameters
     ----------
-    x : str
-        The number as a string.
+    x : str | int
+        The number as a string, or as an integer.
     base : int
-        The base of the input number.
+        The base of the input number, between 2 and 36.
+        Ignored if `x` is an integer.
+    target_base : int | None, optional
+        The base to convert to, between 2 and 36. Default is None,
+        which returns the integer value of `x`.
 
     Returns
     -------
-    int
-        The number converted to the specified base.
+    int | str
+        The integer value of `x` if `target_base` is None,
+        otherwise its representation in `target_base` (lowercase digits).
+        
+    Examples
+    --------
+    >>> convert_among_arbitraries("ff", 16)
+    255
+    >>> convert_among_arbitraries("ff", 16, target_base=2)
+    '11111111'
     """
-    x_checked = _check_input_str(x)
-    y = int(x_checked, base=base)
-    return y
+    if isinstance(x, int):
+        y = x
+    else:
+        _check_base(base)
+        y = _base_str_to_int(_check_input_str(x), base)
+        
+    if target_base is None:
+        return y
+    
+    _check_base(target_base)
+    return _int_to_base_str(y, target_base)
+
+
+# Arbitrary base conversion helpers #
+#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#
+
+def _check_base(base):
+    """
+    Checks that the base is an integer between 2 and 36.
+    """
+    if not isinstance(base, int) or not 2 <= base <= 36:
+        raise ValueError(f"Base must be an integer between 2 and 36, got {base}.")
+
+
+def _split_sign(x_str, base):
+    """
+    Strips whitespace, the sign and a prefix matching the base ('0b', '0o', '0x').
+    
+    Returns
+    -------
+    tuple(bool, str)
+        Whether the number is negative, and its digits.
+    """
+    digits = x_str.strip()
+    negative = digits.startswith("-")
+    if digits and digits[0] in "+-":
+        digits = digits[1:]
+    prefix = BASE_PREFIXES.get(base)
+    if prefix and digits[:2].lower() == prefix:
+        digits = digits[2:]
+    if not digits:
+        raise ValueError(f"Invalid literal for base {base}: '{x_str}'")
+    return negative, digits
+
+
+def _base_str_to_int(x_str, base):
+    """
+    Parses a string in the given base, recursively for long inputs.
+    """
+    # Linear-time and unrestricted in CPython for these cases
+    if len(x_str) <= BIG_INT_LEAF_DIGITS or base & (base - 1) == 0:
+        return int(x_str, base)
+    
+    negative, digits = _split_sign(x_str, base)
+    
+    # Powers base ** (LEAF * 2**k), computed once per call
+    powers = [base ** BIG_INT_LEAF_DIGITS]
+    while BIG_INT_LEAF_DIGITS << len(powers) < len(digits):
+        powers.append(powers[-1] * powers[-1])
+    
+    def combine(start, stop, level):
+        # digits[start:stop] holds at most LEAF * 2**(level + 1) digits
+        if stop - start <= BIG_INT_LEAF_DIGITS:
+            return int(digits[start:stop], base)
+        while stop - start <= BIG_INT_LEAF_DIGITS << level:
+            level -= 1
+        split = stop - (BIG_INT_LEAF_DIGITS << level)
+        return combine(start, split, level) * powers[level] + combine(split, stop, level)
+    
+    n = combine(0, len(digits), len(powers) - 1)
+    return -n if negative else n
+
+
+def _int_to_base_str(n, base):
+    """
+    Renders an integer in the given base, recursively for large values.
+    
+    The value is split by divisions by base ** (m * 2**k) down to leaves holding
+    m digits each, m being the most digits fitting in 63 bits; the leaves are then
+    expanded into digits all at once with NumPy.
+    """
+    if n < 0:
+        return "-" + _int_to_base_str(-n, base)
+    if n < base:
+        return DIGIT_CHARS[n]
+    
+    # Linear-time builtins for power-of-two bases
+    if base in POWER_OF_TWO_FORMATS:
+        return format(n, POWER_OF_TWO_FORMATS[base])
+    
+    leaf_digits = 1
+    while base ** (leaf_digits + 1) < 2**63:
+        leaf_digits += 1
+    
+    powers = [base ** leaf_digits]
+    while powers[-1].bit_length() * 2 <= n.bit_length() + 1:
+        powers.append(powers[-1] * powers[-1])
+    
+    leaves = []
+    
+    def split(x, level):
+        # x < powers[level] ** 2, rendered as 2**(level + 1) leaves
+        if level < 0:
+            leaves.append(x)
+        elif x == 0:
+            leaves.extend([0] * (2 << level))
+        else:
+            q, r = _divmod_large(x, powers[level])
+            split(q, level - 1)
+            split(r, level - 1)
+    
+    split(n, len(powers) - 1)
+    
+    values = np.array(leaves, dtype=np.uint64)
+    digits = np.empty((values.size, leaf_digits), dtype=np.uint8)
+    for col in range(leaf_digits - 1, -1, -1):
+        values, digits[:, col] = np.divmod(values, np.uint64(base))
+    
+    text = BASE36_DIGITS_TABLE[digits].tobytes().decode("ascii")
+    return text.lstrip("0")
+
+
+def _divmod_large(a, b):
+    """
+    Divides a < b * 2**n by the n-bit divisor b with the recursive
+    Burnikel-Ziegler scheme, which reduces the division to multiplications,
+    unlike the quadratic built-in divmod of CPython < 3.12.
+    """
+    n = b.bit_length()
+    return _div_2n_by_n(a, b, n)
+
+
+def _div_2n_by_n(a, b, n):
+    """
+    Divides a 2n-bit integer a < b * 2**n by the n-bit integer b.
+    """
+    if a.bit_length() - n <= BIG_INT_DIVISION_CUTOFF_BITS:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a, b, n = a << 1, b << 1, n + 1
+    half_n = n >> 1
+    mask = (1 << half_n) - 1
+    b_high, b_low = b >> half_n, b & mask
+    q_high, r = _div_3_halves_by_2(a >> n, (a >> half_n) & mask, b, b_high, b_low, half_n)
+    q_low, r = _div_3_halves_by_2(r, a & mask, b, b_high, b_low, half_n)
+    if pad:
+        r >>= 1
+    return q_high << half_n | q_low, r
+
+
+def _div_3_halves_by_2(a_high, a_low, b, b_high, b_low, n):
+    """
+    Divides the 3-half integer (a_high, a_low) by b = (b_high, b_low),
+    estimating the quotient from the leading halves and correcting it.
+    """
+    if a_high >> n == b_high:
+        q, r = (1 << n) - 1, a_high - (b_high << n) + b_high
+    else:
+        q, r = _div_2n_by_n(a_high, b_high, n)
+    r = (r << n | a_low) - q * b_low
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+# Vectorised conversions for integer arrays #
+#-------------------------------------------#
+
+# From decimal to bases 2, 8, 16 #
+def base2bin_array(arr, zero_pad=4, output="str"):
+    """
+    Converts an array of non-negative integers to binary.
+    
+    Every value is viewed as its 8 big-endian bytes and expanded with
+    `np.unpackbits`, so no per-element formatting takes place.
+
+    Parameters
+    ----------
+    arr : array-like
+        Non-negative integers, up to 64 bits.
+    zero_pad : int, optional
+        Minimum number of digits. The output width is the larger of this
+        and the number of bits of the largest value. Default is 4.
+    output : str, optional
+        Output format. Options are:
+        - 'str': fixed-width '<U{w}' string array, with the shape of `arr`.
+        - 'bits': (n, w) uint8 bit matrix, most significant bit first.
+        Default is 'str'.
+
+    Returns
+    -------
+    numpy.ndarray
+        The binary representation of every value.
+        
+    Examples
+    --------
+    >>> base2bin_array(np.array([5, 10]))
+    array(['0101', '1010'], dtype='<U4')
+    >>> base2bin_array(np.array([5, 10]), output="bits")
+    array([[0, 1, 0, 1],
+           [1, 0, 1, 0]], dtype=uint8)
+    """
+    _procedure_checker(output, ARRAY_BINARY_OUTPUT_OPTS)
+    
+    values, shape = _as_uint64_array(arr)
+    width = _digit_width(values, 1, zero_pad)
+    
+    byte_view = values.astype(">u8").view(np.uint8).reshape(-1, 8)
+    bits = np.unpackbits(byte_view, axis=1)[:, 64 - width:]
+    
+    if output == "bits":
+        return bits
+    return _digits_to_str_array(bits, width, shape)
+
+
+def base2oct_array(arr, zero_pad=4):
+    """
+    Converts an array of non-negative integers to octal.
+    
+    Digits are extracted as 3-bit triplets by shifting and masking the whole
+    array at once, and mapped to characters through a lookup table.
+
+    Parameters
+    ----------
+    arr : array-like
+        Non-negative integers, up to 64 bits.
+    zero_pad : int, optional
+        Minimum number of digits (see `base2bin_array`). Default is 4.
+
+    Returns
+    -------
+    numpy.ndarray
+        Fixed-width '<U{w}' string array with the shape of `arr`.
+    """
+    values, shape = _as_uint64_array(arr)
+    width = _digit_width(values, 3, zero_pad)
+    
+    shifts = np.arange(3 * (width - 1), -1, -3, dtype=np.uint64)
+    triplets = ((values[:, None] >> shifts) & np.uint64(7)).astype(np.uint8)
+    return _digits_to_str_array(triplets, width, shape)
+
+
+def base2hex_array(arr, zero_pad=4, uppercase=False):
+    """
+    Converts an array of non-negative integers to hexadecimal.
+    
+    Every value is viewed as its 8 big-endian bytes, split into nibbles
+    and mapped to characters through a lookup table.
+
+    Parameters
+    ----------
+    arr : array-like
+        Non-negative integers, up to 64 bits.
+    zero_pad : int, optional
+        Minimum number of digits (see `base2bin_array`). Default is 4.
+    uppercase : bool, optional
+        Whether to use uppercase letters. Default is False.
+
+    Returns
+    -------
+    numpy.ndarray
+        Fixed-width '<U{w}' string array with the shape of `arr`.
+    """
+    values, shape = _as_uint64_array(arr)
+    width = _digit_width(values, 4, zero_pad)
+    
+    byte_view = values.astype(">u8").view(np.uint8).reshape(-1, 8)
+    nibbles = np.empty((byte_view.shape[0], 16), dtype=np.uint8)
+    nibbles[:, 0::2] = byte_view >> 4
+    nibbles[:, 1::2] = byte_view & 0x0F
+    return _digits_to_str_array(nibbles[:, 16 - width:], width, shape, uppercase)
+
+
+# From above bases to decimal #
+def bin2dec_array(bin_arr):
+    """
+    Converts an array of binary numbers to decimal.
+    
+    Characters are decoded through a lookup table and the resulting bits
+    are packed into bytes with `np.packbits`, then read as big-endian uint64.
+
+    Parameters
+    ----------
+    bin_arr : numpy.ndarray
+        Either a string array (optionally with the '0b' prefix; shorter strings
+        are taken as left-padded with zeros) or an (n, w) bit matrix with the
+        most significant bit first, as returned by `base2bin_array`.
+        At most 64 digits per value.
+
+    Returns
+    -------
+    numpy.ndarray
+        uint64 array with the shape of the input strings, or (n,) for bit matrices.
+        
+    Raises
+    ------
+    ValueError
+        If any character is not a binary digit or a value exceeds 64 bits.
+    """
+    bin_arr = np.asarray(bin_arr)
+    
+    if bin_arr.dtype.kind in "US":
+        shape = bin_arr.shape
+        bits = _str_array_to_digits(bin_arr, "b", 2)
+    else:
+        if bin_arr.ndim != 2:
+            raise ValueError("Bit matrices must be two-dimensional (n, w).")
+        if np.any((bin_arr != 0) & (bin_arr != 1)):
+            raise ValueError("Bit matrices can only contain zeros and ones.")
+        shape = bin_arr.shape[:1]
+        bits = bin_arr.astype(np.uint8, copy=False)
+    
+    bits = _trim_leading_zeros(bits, 64, "Binary numbers longer than 64 digits do not fit in uint64.")
+    width = bits.shape[1]
+        
+    padded_bits = np.zeros((bits.shape[0], 64), dtype=np.uint8)
+    padded_bits[:, 64 - width:] = bits
+    return np.packbits(padded_bits, axis=1).view(">u8").astype(np.uint64).reshape(shape)
+
+
+def hex2dec_array(hex_arr):
+    """
+    Converts an array of hexadecimal strings to decimal.
+    
+    Characters are decoded through a lookup table and pairs of nibbles are
+    joined into bytes, which are then read as big-endian uint64.
+
+    Parameters
+    ----------
+    hex_arr : numpy.ndarray
+        String array, optionally with the '0x' prefix, upper or lower case.
+        Shorter strings are taken as left-padded with zeros.
+        At most 16 digits per value.
+
+    Returns
+    -------
+    numpy.ndarray
+        uint64 array with the shape of the input.
+        
+    Raises
+    ------
+    ValueError
+        If any character is not a hexadecimal digit or a value exceeds 64 bits.
+    """
+    hex_arr = np.asarray(hex_arr)
+    nibbles = _str_array_to_digits(hex_arr, "x", 16)
+    
+    nibbles = _trim_leading_zeros(nibbles, 16, 
+                                  "Hexadecimal numbers longer than 16 digits do not fit in uint64.")
+    width = nibbles.shape[1]
+        
+    padded_nibbles = np.zeros((nibbles.shape[0], 16), dtype=np.uint8)
+    padded_nibbles[:, 16 - width:] = nibbles
+    byte_view = (padded_nibbles[:, 0::2] << 4) | padded_nibbles[:, 1::2]
+    return np.ascontiguousarray(byte_view).view(">u8").astype(np.uint64).reshape(hex_arr.shape)
+
+
+# Vectorised conversion helpers #
+#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#
+
+def _as_uint64_array(arr):
+    """
+    Flatten an integer array into uint64, remembering the original shape.
+    """
+    arr = np.asarray(arr)
+    if not np.issubdtype(arr.dtype, np.integer):
+        raise TypeError(f"Expected an integer array, got dtype '{arr.dtype}'.")
+    if np.issubdtype(arr.dtype, np.signedinteger) and np.any(arr < 0):
+        raise ValueError("Vectorised base conversion only supports non-negative integers.")
+    return arr.astype(np.uint64, copy=False).ravel(), arr.shape
+
+
+def _digit_width(values, bits_per_digit, zero_pad):
+    """
+    Common number of digits for all values: enough for the largest one,
+    and at least `zero_pad`.
+    """
+    max_value = int(values.max()) if values.size else 0
+    needed_digits = -(-max(max_value.bit_length(), 1) // bits_per_digit)
+    return max(needed_digits, zero_pad, 1)
+
+
+def _digits_to_str_array(digits, width, shape, uppercase=False):
+    """
+    Map an (n, w) matrix of digit values to characters by table lookup,
+    and view every row as one fixed-width string.
+    """
+    lookup_table = HEX_DIGITS_UPPER_TABLE if uppercase else HEX_DIGITS_LOWER_TABLE
+    char_codes = np.ascontiguousarray(lookup_table[digits])
+    return char_codes.view(f"S{width}").astype(f"U{width}").reshape(shape)
+
+
+def _str_array_to_digits(str_arr, prefix_char, base):
+    """
+    Decode a string array into an (n, w) matrix of digit values,
+    right-aligning shorter strings and dropping the '0b'/'0x' prefix.
+    """
+    invalid_digits_msg = f"Some strings contain characters that are not base-{base} digits."
+    try:
+        byte_strings = np.ascontiguousarray(str_arr.ravel().astype("S"))
+    except UnicodeEncodeError:
+        # Non-ASCII characters cannot be digits in any base
+        raise ValueError(invalid_digits_msg)
+    width = max(byte_strings.dtype.itemsize, 1)
+    char_codes = byte_strings.view(np.uint8).reshape(-1, width).copy()
+    
+    # Blank out the prefix (either case), then right-align the remaining digits
+    if width > 1:
+        has_prefix = (char_codes[:, 0] == ord("0")) & ((char_codes[:, 1] | 0x20) == ord(prefix_char))
+        char_codes[has_prefix, :2] = 0
+    char_codes = _right_align(char_codes)
+    
+    digits = DIGIT_VALUE_TABLE[char_codes]
+    if np.any(digits >= base):
+        raise ValueError(invalid_digits_msg)
+    return digits
+
+
+def _trim_leading_zeros(digits, max_digits, error_msg):
+    """
+    Drop the leading digit columns beyond `max_digits`, provided they are all zero.
+    """
+    excess = digits.shape[1] - max_digits
+    if excess > 0:
+        if np.any(digits[:, :excess]):
+            raise ValueError(error_msg)
+        digits = digits[:, excess:]
+    return digits
+
+
+def _right_align(char_codes):
+    """
+    Shift the non-null characters of every row to its right end,
+    filling the left with the '0' character.
+    """
+    is_char = char_codes != 0
+    lengths = is_char.sum(axis=1)
+    starts = np.argmax(is_char, axis=1)
+    width = char_codes.shape[1]
+    
+    if np.all(lengths == width):
+        return char_codes
+    
+    source_cols = np.arange(width)[None, :] - (width - lengths)[:, None] + starts[:, None]
+    valid = np.arange(width)[None, :] >= (width - lengths)[:, None]
+    aligned = np.take_along_axis(char_codes, np.clip(source_cols, 0, width - 1), axis=1)
+    return np.where(valid, aligned, ord("0")).astype(np.uint8)
+    
 
 #--------------------------#
 # Parameters and constants #
@@ -381,3 +879,28 @@ def convert_among_arbitraries(x, base):
 
 BIN2DEC_PROCEDURE_OPTS = ['list_comprehension', 'loop']
 NUMBER_CONVERSION_PROCEDURE_OPTS = ['default', 'format_string']
+ARRAY_BINARY_OUTPUT_OPTS = ['str', 'bits']
+
+# Lookup tables for vectorised conversions #
+HEX_DIGITS_LOWER_TABLE = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+HEX_DIGITS_UPPER_TABLE = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+
+# Byte value to digit value, 255 marking invalid characters
+DIGIT_VALUE_TABLE = np.full(256, 255, dtype=np.uint8)
+DIGIT_VALUE_TABLE[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+DIGIT_VALUE_TABLE[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+DIGIT_VALUE_TABLE[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+# Arbitrary-precision conversions #
+#---------------------------------#
+
+# Digits per leaf when parsing long strings, well below CPython's 4300-digit limit
+BIG_INT_LEAF_DIGITS = 1000
+
+# Divisions of numbers up to this many extra bits go through the built-in divmod
+BIG_INT_DIVISION_CUTOFF_BITS = 4000
+
+DIGIT_CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE36_DIGITS_TABLE = np.frombuffer(DIGIT_CHARS.encode("ascii"), dtype=np.uint8)
+BASE_PREFIXES = {2: "0b", 8: "0o", 16: "0x"}
+POWER_OF_TWO_FORMATS = {2: "b", 8: "o", 16: "x"}
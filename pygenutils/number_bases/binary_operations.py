@@ -7,14 +7,28 @@
 This module provides functionalities for converting between 
 strings, bytes, and integers. It includes functions for converting 
 strings to bytes objects using different procedures, converting 
-bytes objects to integers, and decoding bytes objects back to string
+bytes objects to integers, and decoding bytes objects back to string.
+
+For large binary data, it also provides zero-copy NumPy views over
+buffers, chunked text encoding into preallocated buffers (and its decoding
+counterpart), and batch unpacking of struct-formatted records.
 """
 
+#----------------#
+# Import modules #
+#----------------#
+
+import codecs
+import re
+import struct
+
+import numpy as np
+
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from pygenutils.strings.text_formatters import get_type_str
+from filewise.general.introspection_utils import get_type_str
 
 #------------------#
 # Define functions #
@@ -96,30 +110,267 @@ def str_to_byte_array(string, encoding="utf-8"):
 # From bytes objects to integers or list of them #
 #-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-
 
-def bytes_obj_to_int(bytes_obj):
+def bytes_obj_to_int(bytes_obj, as_array=False):
     """
     Convert a bytes or bytearray object to a list of integers.
 
     Parameters
     ----------
-    bytes_obj : bytes | bytearray
+    bytes_obj : bytes | bytearray | memoryview
         The bytes object to convert.
+    as_array : bool, optional
+        If True, return a uint8 NumPy view sharing the memory of the input
+        instead of building one Python int per byte. Default is False.
 
     Returns
     -------
-    list_of_ints: list[int]
-        A list of integers representing the byte values.
+    list_of_ints: list[int] | numpy.ndarray
+        A list of integers representing the byte values, 
+        or a uint8 array if `as_array` is True.
 
     Raises
     ------
-    TypeError: If the input is not bytes or bytearray.
+    TypeError: If the input is not bytes, bytearray or memoryview.
     """
-    validate_input(bytes_obj, (bytes, bytearray))
+    validate_input(bytes_obj, BUFFER_TYPES)
+    
+    if as_array:
+        return buffer_to_array(bytes_obj)
     
     list_of_ints = list(bytes_obj)
     return list_of_ints
 
 
+def buffer_to_array(buffer, dtype="uint8", byteorder="=", offset=0, count=-1):
+    """
+    Expose a bytes-like object as a typed NumPy array without copying it.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview
+        The buffer to view. Views over bytes objects are read-only,
+        views over bytearrays are writable.
+    dtype : str | numpy.dtype, optional
+        Data type of the elements. Default is 'uint8'.
+    byteorder : str, optional
+        Byte order of multi-byte elements: '<' (little-endian), '>' (big-endian),
+        '=' (native) or '|' (not applicable). Default is '='.
+    offset : int, optional
+        Number of bytes to skip at the start. Default is 0.
+    count : int, optional
+        Number of elements to read. Default is -1, meaning up to the end.
+
+    Returns
+    -------
+    numpy.ndarray
+        1-D array sharing the memory of the buffer.
+
+    Raises
+    ------
+    TypeError: If the input does not support the buffer protocol.
+    ValueError: If the byte order is not supported, or the buffer size does not
+        match the element size.
+    """
+    validate_input(buffer, BUFFER_TYPES)
+    if byteorder not in BYTEORDER_OPTIONS:
+        raise ValueError(f"Unsupported byte order '{byteorder}'. Choose one from {BYTEORDER_OPTIONS}.")
+        
+    view_dtype = np.dtype(dtype).newbyteorder(byteorder)
+    return np.frombuffer(buffer, dtype=view_dtype, count=count, offset=offset)
+
+
+def unpack_records(buffer, fmt, names=None, offset=0, count=-1):
+    """
+    Unpack consecutive struct-formatted records into a NumPy structured array,
+    viewing the buffer in place instead of calling struct.unpack per record.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview
+        The buffer holding the records back to back.
+    fmt : str
+        A struct module format string describing one record, e.g. '<IHd4s'.
+        Pad bytes ('x') are skipped; repeat counts create sub-array fields,
+        except for 's', whose count is the string length.
+        Pascal strings ('p') are not supported.
+    names : list[str] | None, optional
+        Field names. Default is None, which names them 'f0', 'f1', ...
+    offset : int, optional
+        Number of bytes to skip at the start. Default is 0.
+    count : int, optional
+        Number of records to read. Default is -1, meaning up to the end.
+
+    Returns
+    -------
+    numpy.ndarray
+        Structured array sharing the memory of the buffer, whose item size
+        equals struct.calcsize(fmt).
+
+    Raises
+    ------
+    TypeError: If the input does not support the buffer protocol.
+    ValueError: If the format contains unsupported codes or the number of names
+        does not match the number of fields.
+        
+    Examples
+    --------
+    >>> raw = struct.pack("<Ih", 7, -2) + struct.pack("<Ih", 8, 5)
+    >>> unpack_records(raw, "<Ih", names=["id", "flag"])["flag"]
+    array([-2,  5], dtype=int16)
+    """
+    validate_input(buffer, BUFFER_TYPES)
+    record_dtype = struct_format_to_dtype(fmt, names)
+    return np.frombuffer(buffer, dtype=record_dtype, count=count, offset=offset)
+
+
+def struct_format_to_dtype(fmt, names=None):
+    """
+    Translate a struct module format string into an equivalent NumPy
+    structured dtype, keeping the field offsets and the record size of struct.
+
+    Parameters
+    ----------
+    fmt : str
+        A struct module format string.
+    names : list[str] | None, optional
+        Field names. Default is None, which names them 'f0', 'f1', ...
+
+    Returns
+    -------
+    numpy.dtype
+    """
+    fmt = fmt.replace(" ", "")
+    order_char = fmt[0] if fmt[:1] in STRUCT_BYTEORDER_MAP else "@"
+    items = STRUCT_ITEM_PATTERN.findall(fmt[1:] if fmt[:1] in STRUCT_BYTEORDER_MAP else fmt)
+    if "".join(f"{num}{code}" for num, code in items) != fmt.lstrip("@=<>!"):
+        raise ValueError(f"Unsupported or malformed struct format '{fmt}'.")
+    
+    numpy_order = STRUCT_BYTEORDER_MAP[order_char]
+    formats, offsets = [], []
+    prefix = order_char
+    
+    for num, code in items:
+        if code == "p":
+            raise ValueError("Pascal strings ('p') are not supported.")
+        if code != "x":
+            # The '0<code>' trick makes struct apply the field alignment only
+            offsets.append(struct.calcsize(f"{prefix}0{code}"))
+            repeat = int(num) if num else 1
+            item_size = struct.calcsize(f"{order_char}{code}")
+            if code == "s":
+                formats.append(f"S{repeat}")
+            else:
+                base_format = "S1" if code == "c" else f"{numpy_order}{STRUCT_KIND_MAP[code]}{item_size}"
+                formats.append(base_format if repeat == 1 and num == "" else (base_format, (repeat,)))
+        prefix += f"{num}{code}"
+    
+    if names is None:
+        names = [f"f{i}" for i in range(len(formats))]
+    elif len(names) != len(formats):
+        raise ValueError(f"Got {len(names)} names for {len(formats)} fields.")
+    
+    return np.dtype(dict(names=names, formats=formats, offsets=offsets, 
+                         itemsize=struct.calcsize(fmt)))
+
+
+# Chunked text encoding into preallocated buffers #
+#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-
+
+def str_to_buffer(string, out=None, encoding="utf-8", chunk_size=1 << 20):
+    """
+    Encode a large string chunk by chunk, writing the bytes into a buffer.
+    
+    Only one chunk of encoded bytes is alive at a time, besides the output
+    buffer itself, which can be reused across calls.
+
+    Parameters
+    ----------
+    string : str
+        The string to encode.
+    out : bytearray | memoryview | None, optional
+        Writable buffer receiving the bytes. Default is None, which allocates
+        a bytearray sized for up to 4 bytes per character, grown if an encoding
+        (e.g. 'unicode_escape') needs more.
+    encoding : str, optional
+        The encoding to use. Stateful encodings (such as 'utf-16') are handled
+        with an incremental encoder. Default is "utf-8".
+    chunk_size : int, optional
+        Number of characters encoded per step. Default is 1 048 576.
+
+    Returns
+    -------
+    memoryview
+        View over the written part of `out`.
+
+    Raises
+    ------
+    TypeError: If the input is not a string.
+    ValueError: If the given output buffer is too small.
+    """
+    validate_input(string, str)
+    
+    owns_buffer = out is None
+    if owns_buffer:
+        out = bytearray(len(string) * MAX_BYTES_PER_CHAR + MAX_BOM_BYTES)
+    out_view = memoryview(out).cast("B")
+    
+    encoder = codecs.getincrementalencoder(encoding)()
+    n_written = 0
+    n_chars = len(string)
+    
+    for start in range(0, n_chars + 1, chunk_size):
+        is_final = start + chunk_size > n_chars
+        chunk_bytes = encoder.encode(string[start:start + chunk_size], final=is_final)
+        end = n_written + len(chunk_bytes)
+        if end > len(out_view):
+            if not owns_buffer:
+                raise ValueError(f"Output buffer too small: {len(out_view)} bytes.")
+            # At least double the buffer, which cannot be resized while viewed
+            out_view.release()
+            out.extend(bytes(max(len(out), end - len(out))))
+            out_view = memoryview(out)
+        out_view[n_written:end] = chunk_bytes
+        n_written = end
+        if is_final:
+            break
+        
+    return out_view[:n_written]
+
+
+def buffer_to_str_chunks(buffer, encoding="utf-8", chunk_size=1 << 20):
+    """
+    Decode a large buffer chunk by chunk, without copying it.
+    
+    Multi-byte characters split between two chunks are handled by
+    an incremental decoder.
+
+    Parameters
+    ----------
+    buffer : bytes | bytearray | memoryview
+        The buffer to decode.
+    encoding : str, optional
+        The encoding to use. Default is "utf-8".
+    chunk_size : int, optional
+        Number of bytes decoded per step. Default is 1 048 576.
+
+    Yields
+    ------
+    str
+        Consecutive pieces of the decoded text.
+    """
+    validate_input(buffer, BUFFER_TYPES)
+    
+    buffer_view = memoryview(buffer).cast("B")
+    decoder = codecs.getincrementaldecoder(encoding)()
+    n_bytes = len(buffer_view)
+    
+    for start in range(0, n_bytes, chunk_size):
+        text = decoder.decode(buffer_view[start:start + chunk_size], 
+                              final=start + chunk_size >= n_bytes)
+        if text:
+            yield text
+    
+
 # Decode bytes objects #
 #-#-#-#-#-#-#-#-#-#-#-#-
 
@@ -181,3 +432,28 @@ def validate_input(obj, expected_type):
 
 # String to bytes object conversion procedures
 CONV_TO_BYTE_OPTIONS = ["class", "straightforward"]
+
+# Zero-copy buffers #
+#-------------------#
+
+# Objects supporting the buffer protocol accepted as input
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# NumPy byte order characters
+BYTEORDER_OPTIONS = ["<", ">", "=", "|"]
+
+# Upper bounds used to preallocate encoding buffers
+MAX_BYTES_PER_CHAR = 4
+MAX_BOM_BYTES = 4
+
+# Struct format translation #
+STRUCT_ITEM_PATTERN = re.compile(r"(\d*)([xcbB?hHiIlLqQnNefdspP])")
+
+STRUCT_BYTEORDER_MAP = {"@": "=", "=": "=", "<": "<", ">": ">", "!": ">"}
+
+STRUCT_KIND_MAP = {
+    **{code: "i" for code in "bhilqn"},
+    **{code: "u" for code in "BHILQNP"},
+    **{code: "f" for code in "efd"},
+    "?": "b",
+}
@@ -4,8 +4,8 @@
 """
 This module provides functions to perform bitwise logical operations
 and shift operations. The results are provided in both binary and decimal
-formats. Each function utilises custom converters to switch between 
-binary and decimal systems.
+formats. Each function utilises custom converters to render the result
+in binary.
 
 Functions
 ---------
@@ -14,124 +14,250 @@ Functions
 - bitwise_xor(n1, n2): Performs a bitwise XOR operation.
 - rightwards_bitshift(n, despl): Performs a rightwards bitwise shift.
 - leftwards_bitshift(n, despl): Performs a leftwards bitwise shift.
+- popcount(n): Counts the set bits.
+- is_bit_set(n, bit): Tells whether a given bit is set.
+- extract_bit_field(n, start, width): Extracts a field of consecutive bits.
 
 Note
 ----
-All functions return a tuple containing the result in both binary and 
-decimal formats. The conversion functions `base2bin` and `bin2dec` 
-from the `numeral_systems.base_converters` module are used for this 
-purpose.
+The operators accept integers or NumPy integer arrays, which broadcast
+against each other. For integers, they return a tuple containing the result
+in both binary and decimal formats, as rendered by `base2bin`.
+For arrays, they return the integer array directly; the binary rendering
+(`base2bin_array`) is only computed if requested with `return_binary=True`.
 """
 
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from pygenutils.numeral_systems.base_converters import base2bin, bin2dec
+from pygenutils.number_bases.base_converters import base2bin
 
 #-------------------------#
 # Define custom functions #
 #-------------------------#
 
-def bitwise_and(n1, n2):
+# Bitwise operators #
+#-------------------#
+
+def bitwise_and(n1, n2, return_binary=None):
     """
-    Performs a bitwise AND operation on two integers.
+    Performs a bitwise AND operation on two integers or integer arrays.
 
     Parameters
     ----------
-    n1 : int
+    n1 : int | numpy.ndarray
         First integer operand.
-    n2 : int
-        Second integer operand.
+    n2 : int | numpy.ndarray
+        Second integer operand, broadcast against the first one.
+    return_binary : bool | None, optional
+        Whether to also return the binary representation.
+        Default is None, meaning True for integers and False for arrays.
 
     Returns
     -------
-    tuple
-        A tuple containing the result in binary and decimal formats.
+    tuple | int | numpy.ndarray
+        A tuple containing the result in binary and decimal formats,
+        or the decimal result only if `return_binary` is False.
     """
-    res_bitwise_and = n1 & n2
-    res_bin = base2bin(res_bitwise_and)
-    res_dec = bin2dec(res_bin)
-    return (res_bin, res_dec)
+    res_bitwise_and = np.bitwise_and(n1, n2) if _any_array(n1, n2) else n1 & n2
+    return _format_result(res_bitwise_and, return_binary)
 
-def bitwise_or(n1, n2):
+def bitwise_or(n1, n2, return_binary=None):
     """
-    Performs a bitwise OR operation on two integers.
+    Performs a bitwise OR operation on two integers or integer arrays.
 
     Parameters
     ----------
-    n1 : int
+    n1 : int | numpy.ndarray
         First integer operand.
-    n2 : int
-        Second integer operand.
+    n2 : int | numpy.ndarray
+        Second integer operand, broadcast against the first one.
+    return_binary : bool | None, optional
+        Whether to also return the binary representation.
+        Default is None, meaning True for integers and False for arrays.
 
     Returns
     -------
-    tuple
-        A tuple containing the result in binary and decimal formats.
+    tuple | int | numpy.ndarray
+        A tuple containing the result in binary and decimal formats,
+        or the decimal result only if `return_binary` is False.
     """
-    res_bitwise_or = n1 | n2
-    res_bin = base2bin(res_bitwise_or)
-    res_dec = bin2dec(res_bin)
-    return (res_bin, res_dec)
+    res_bitwise_or = np.bitwise_or(n1, n2) if _any_array(n1, n2) else n1 | n2
+    return _format_result(res_bitwise_or, return_binary)
 
-def bitwise_xor(n1, n2):
+def bitwise_xor(n1, n2, return_binary=None):
     """
-    Performs a bitwise XOR operation on two integers.
+    Performs a bitwise XOR operation on two integers or integer arrays.
 
     Parameters
     ----------
-    n1 : int
+    n1 : int | numpy.ndarray
         First integer operand.
-    n2 : int
-        Second integer operand.
+    n2 : int | numpy.ndarray
+        Second integer operand, broadcast against the first one.
+    return_binary : bool | None, optional
+        Whether to also return the binary representation.
+        Default is None, meaning True for integers and False for arrays.
 
-    Returns:
-    tuple: A tuple containing the result in binary and decimal formats.
+    Returns
+    -------
+    tuple | int | numpy.ndarray
+        A tuple containing the result in binary and decimal formats,
+        or the decimal result only if `return_binary` is False.
     """
-    res_bitwise_xor = n1 ^ n2
-    res_bin = base2bin(res_bitwise_xor)
-    res_dec = bin2dec(res_bin)
-    return (res_bin, res_dec)
+    res_bitwise_xor = np.bitwise_xor(n1, n2) if _any_array(n1, n2) else n1 ^ n2
+    return _format_result(res_bitwise_xor, return_binary)
 
-def rightwards_bitshift(n, despl):
+def rightwards_bitshift(n, despl, return_binary=None):
     """
-    Performs a rightwards bitwise shift on an integer.
+    Performs a rightwards bitwise shift on an integer or integer array.
 
     Parameters
     ----------
-    n : int
+    n : int | numpy.ndarray
         The integer to be shifted.
-    despl : int
-        The number of positions to shift.
+    despl : int | numpy.ndarray
+        The number of positions to shift, broadcast against `n`.
+    return_binary : bool | None, optional
+        Whether to also return the binary representation.
+        Default is None, meaning True for integers and False for arrays.
 
     Returns
     -------
-    tuple
-        A tuple containing the result in binary and decimal formats.
+    tuple | int | numpy.ndarray
+        A tuple containing the result in binary and decimal formats,
+        or the decimal result only if `return_binary` is False.
     """
-    res_right_shift = n >> despl
-    res_bin = base2bin(res_right_shift)
-    res_dec = bin2dec(res_bin)
-    return (res_bin, res_dec)
+    res_right_shift = np.right_shift(n, despl) if _any_array(n, despl) else n >> despl
+    return _format_result(res_right_shift, return_binary)
 
-def leftwards_bitshift(n, despl):
+def leftwards_bitshift(n, despl, return_binary=None):
     """
-    Performs a leftwards bitwise shift on an integer.
+    Performs a leftwards bitwise shift on an integer or integer array.
 
     Parameters
     ----------
-    n : int
-        The integer to be shifted.
-    despl : int
-        The number of positions to shift.
+    n : int | numpy.ndarray
+        The integer to be shifted. Array values wrap around at their dtype width.
+    despl : int | numpy.ndarray
+        The number of positions to shift, broadcast against `n`.
+    return_binary : bool | None, optional
+        Whether to also return the binary representation.
+        Default is None, meaning True for integers and False for arrays.
 
     Returns
     -------
-    tuple
-        A tuple containing the result in binary and decimal formats.
+    tuple | int | numpy.ndarray
+        A tuple containing the result in binary and decimal formats,
+        or the decimal result only if `return_binary` is False.
+    """
+    res_left_shift = np.left_shift(n, despl) if _any_array(n, despl) else n << despl
+    return _format_result(res_left_shift, return_binary)
+
+# Bit inspection #
+#----------------#
+
+def popcount(n):
+    """
+    Counts the bits set to one (Hamming weight).
+
+    Parameters
+    ----------
+    n : int | numpy.ndarray
+        Integer or integer array. Negative values count the bits
+        of their absolute value.
+
+    Returns
+    -------
+    int | numpy.ndarray
+        The number of set bits, element-wise for arrays (uint8).
+    """
+    if _any_array(n):
+        return np.bitwise_count(n)
+    return abs(n).bit_count()
+
+def is_bit_set(n, bit):
+    """
+    Tells whether a given bit is set.
+
+    Parameters
+    ----------
+    n : int | numpy.ndarray
+        Integer or integer array.
+    bit : int | numpy.ndarray
+        Position of the bit to test, 0 being the least significant one.
+        Broadcast against `n`.
+
+    Returns
+    -------
+    bool | numpy.ndarray
+        True where the bit is set.
+    """
+    if _any_array(n, bit):
+        return np.bitwise_and(np.right_shift(n, bit), 1).astype(bool)
+    return bool((n >> bit) & 1)
+
+def extract_bit_field(n, start, width):
+    """
+    Extracts `width` consecutive bits starting at bit `start`,
+    as used to decode packed quality flags.
+
+    Parameters
+    ----------
+    n : int | numpy.ndarray
+        Integer or integer array.
+    start : int
+        Position of the least significant bit of the field.
+    width : int
+        Number of bits of the field.
+
+    Returns
+    -------
+    int | numpy.ndarray
+        The value of the field, element-wise for arrays.
+        
+    Examples
+    --------
+    >>> extract_bit_field(np.array([0b101100, 0b010100]), start=2, width=3)
+    array([3, 5])
+    """
+    if width < 1 or start < 0:
+        raise ValueError("'start' must be non-negative and 'width' positive.")
+        
+    if _any_array(n):
+        n = np.asarray(n)
+        n_bits = n.dtype.itemsize * 8
+        if start >= n_bits:
+            return np.zeros_like(n)
+        shifted = np.right_shift(n, start)
+        if width >= n_bits:
+            return shifted
+        return np.bitwise_and(shifted, n.dtype.type((1 << width) - 1))
+    return (n >> start) & ((1 << width) - 1)
+
+# Helpers #
+#---------#
+
+def _any_array(*operands):
+    """
+    Tells whether any operand is a NumPy array (or array-like collection).
+    """
+    return any(isinstance(operand, (np.ndarray, list, tuple)) for operand in operands)
+
+def _format_result(result, return_binary):
+    """
+    Returns the decimal result, along with its binary rendering if requested.
     """
-    res_left_shift = n << despl
-    res_bin = base2bin(res_left_shift)
-    res_dec = bin2dec(res_bin)
-    return (res_bin, res_dec)
+    is_array = isinstance(result, np.ndarray)
+    if return_binary is None:
+        return_binary = not is_array
+    if not return_binary:
+        return result
+    return (base2bin(result), result)
@@ -1,8 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
 # Import modules #
 #----------------#
 
-from math import factorial
+from decimal import Decimal, localcontext
+from math import factorial, lgamma, log, pi
+
+import numpy as np
 
+#------------------#
 # Define functions #
 #------------------#
 
@@ -10,49 +18,265 @@ def adapted_factorial(num, significant_digits):
     """
     Calculate the factorial of a number with precise formatting control.
     
-    For standard-sized results, formats the output using the specified precision.
-    For extremely large factorials that would cause an OverflowError during formatting,
-    converts the result to scientific notation with appropriate rounding.
+    The result is given with the specified number of significant digits,
+    in fixed or scientific notation following the rules of the 'g' format.
+    Below EXACT_FACTORIAL_THRESHOLD the factorial is computed exactly and rounded;
+    above it, the mantissa and exponent are derived from log10(num!), obtained
+    from the Stirling series evaluated with extended precision, so the
+    (possibly multi-million-digit) factorial is never built.
     
     Parameters
     ----------
-    num : int | float
-        The number for which to calculate the factorial
+    num : int | float | array-like
+        The number for which to calculate the factorial. Floats must be integral.
+        Arrays (or lists) are processed at once: their log-factorials are
+        estimated in double precision whenever that suffices for the requested
+        digits, falling back to the scalar procedure element-wise otherwise.
     significant_digits : int
         The number of significant digits to include in the result
     
     Returns
     -------
-    result_adapted : str
+    result_adapted : str | numpy.ndarray
         The formatted factorial result as a string, either in standard or
-        scientific notation depending on the magnitude
+        scientific notation depending on the magnitude.
+        A string array with the shape of `num` for array inputs.
              
     Raises
     ------
     TypeError
         If the input is not an integer or float
+    ValueError
+        If the input is negative or not integral
+        
+    Examples
+    --------
+    >>> adapted_factorial(10, 3)
+    '3.63e+06'
+    >>> adapted_factorial(10**6, 6)
+    '8.26393e+5565708'
     """
     # Validate input
+    if isinstance(num, (list, tuple, np.ndarray)):
+        return _adapted_factorial_array(np.asarray(num), significant_digits)
+    
     if not isinstance(num, (int, float)):
         raise TypeError("Input must either be an integer or a float")
+    num = _check_factorial_input(num)
+    
+    # Calculate the significant digits and the decimal exponent
+    if num < EXACT_FACTORIAL_THRESHOLD:
+        sig_int, exponent = _exact_factorial_digits(num, significant_digits)
+    else:
+        sig_int, exponent = _estimated_factorial_digits(num, significant_digits)
+    
+    # Return result
+    result_adapted = _format_significant_digits(sig_int, exponent, significant_digits)
+    return result_adapted
+
+
+# Helpers #
+#---------#
+
+def _check_factorial_input(num):
+    """
+    Ensures the input is a non-negative integral number, returned as int.
+    """
+    if isinstance(num, float):
+        if not num.is_integer():
+            raise ValueError("Factorial is only defined for integral values")
+        num = int(num)
+    if num < 0:
+        raise ValueError("Factorial is not defined for negative values")
+    return num
+
+
+def _round_to_significant_digits(value, n_digits, significant_digits):
+    """
+    Rounds a positive integer with `n_digits` digits to its first
+    `significant_digits` digits (half up), handling the carry.
     
-    # Calculate factorial
+    Returns
+    -------
+    tuple(int, int)
+        The significant digits as an integer and the decimal exponent.
+    """
+    exponent = n_digits - 1
+    excess_digits = n_digits - significant_digits
+    if excess_digits <= 0:
+        return value * 10**(-excess_digits), exponent
+    
+    sig_int, remainder = divmod(value, 10**excess_digits)
+    if 2 * remainder >= 10**excess_digits:
+        sig_int += 1
+    if sig_int == 10**significant_digits:
+        sig_int //= 10
+        exponent += 1
+    return sig_int, exponent
+
+
+def _exact_factorial_digits(num, significant_digits):
+    """
+    Significant digits and exponent of num!, computed from the exact factorial.
+    """
     result = factorial(num)
+    
+    # Digit count from the bit length, avoiding the integer string conversion limit
+    n_digits = int(result.bit_length() * LOG10_2) + 1
+    if result < 10**(n_digits - 1):
+        n_digits -= 1
+    elif result >= 10**n_digits:
+        n_digits += 1
+    return _round_to_significant_digits(result, n_digits, significant_digits)
 
-    try:
-        result = f"{result:.{significant_digits}g}"
-    except OverflowError:
-        # Convert to string and round to the desired significant digits
-        result_str = str(result)
-        # Take into account the number next to the significant digits position
-        if int(result_str[significant_digits]) >= 5:
-            prev_num = int(result_str[significant_digits-1]) + 1
+
+def _log10_factorial_decimal(num, precision):
+    """
+    log10(num!) from the Stirling series, evaluated with `precision` digits.
+    
+    For num >= EXACT_FACTORIAL_THRESHOLD the truncation error of the series
+    terms kept is far below 10**(-precision) for any practical precision.
+    """
+    with localcontext() as ctx:
+        ctx.prec = precision
+        n = Decimal(num)
+        two_pi = 2 * _decimal_pi(precision)
+        ln_factorial = n * n.ln() - n + (two_pi * n).ln() / 2
+        
+        # Asymptotic correction terms B_2k / (2k (2k - 1) n^(2k - 1))
+        n_power = n
+        n_squared = n * n
+        for numerator, denominator in STIRLING_SERIES_COEFFICIENTS:
+            ln_factorial += Decimal(numerator) / (denominator * n_power)
+            n_power *= n_squared
+        
+        return ln_factorial / Decimal(10).ln()
+
+
+def _decimal_pi(precision):
+    """
+    Compute pi to the current context precision (Machin's formula).
+    """
+    def arctan_inverse(x):
+        x_squared = x * x
+        term = Decimal(1) / x
+        total, k, sign = term, 1, 1
+        while True:
+            term /= x_squared
+            sign = -sign
+            k += 2
+            new_total = total + sign * term / k
+            if new_total == total:
+                return total
+            total = new_total
+            
+    with localcontext() as ctx:
+        ctx.prec = precision + 5
+        pi_value = 16 * arctan_inverse(Decimal(5)) - 4 * arctan_inverse(Decimal(239))
+    return +pi_value
+
+
+def _estimated_factorial_digits(num, significant_digits):
+    """
+    Significant digits and exponent of num! from its logarithm,
+    without computing the factorial itself.
+    """
+    # Integer digits of log10(num!) plus the requested ones and guard digits
+    integer_digits = len(str(int(lgamma(num + 1) / log(10)))) + 1
+    precision = integer_digits + significant_digits + FACTORIAL_GUARD_DIGITS
+    
+    log10_factorial = _log10_factorial_decimal(num, precision)
+    
+    with localcontext() as ctx:
+        ctx.prec = precision
+        exponent = int(log10_factorial)
+        mantissa = Decimal(10) ** (log10_factorial - exponent)
+        scaled = mantissa * Decimal(10) ** (significant_digits + FACTORIAL_GUARD_DIGITS - 1)
+    
+    n_digits = significant_digits + FACTORIAL_GUARD_DIGITS
+    sig_int, extra_exponent = _round_to_significant_digits(int(scaled), n_digits, significant_digits)
+    return sig_int, exponent + extra_exponent - (n_digits - 1)
+
+
+def _format_significant_digits(sig_int, exponent, significant_digits):
+    """
+    Format 'd.ddd x 10**exponent', given its significant digits as an integer,
+    following the rules of the 'g' format specifier
+    (trailing zeros removed, scientific notation for large or small exponents).
+    """
+    digits = str(sig_int).rjust(significant_digits, "0")
+    
+    if -4 <= exponent < significant_digits:
+        if exponent >= 0:
+            int_part, frac_part = digits[:exponent + 1], digits[exponent + 1:]
         else:
-            prev_num = int(result_str[significant_digits-1])
-        # Convert to float
-        result_adapted = f"{result_str[0]}.{result_str[1:significant_digits-1]}{prev_num}e+{len(result_str)-1}"
-    else:
-        result_adapted = result
+            int_part, frac_part = "0", "0" * (-exponent - 1) + digits
+        frac_part = frac_part.rstrip("0")
+        return f"{int_part}.{frac_part}" if frac_part else int_part
     
-    # Return result
-    return result_adapted
\ No newline at end of file
+    frac_part = digits[1:].rstrip("0")
+    mantissa = f"{digits[0]}.{frac_part}" if frac_part else digits[0]
+    return f"{mantissa}e{'+' if exponent >= 0 else '-'}{abs(exponent):02d}"
+
+
+def _adapted_factorial_array(nums, significant_digits):
+    """
+    Vectorised counterpart of `adapted_factorial` for arrays of inputs.
+    """
+    if not (np.issubdtype(nums.dtype, np.integer) or np.issubdtype(nums.dtype, np.floating)):
+        raise TypeError("Input must either be an integer or a float")
+    if np.any(nums < 0) or np.any(nums != np.floor(nums)):
+        raise ValueError("Factorial is only defined for non-negative integral values")
+    
+    flat_nums = nums.ravel().astype(np.float64)
+    
+    # log10(n!) in double precision: exact table up to 170, Stirling series above
+    small = flat_nums <= MAX_FLOAT_FACTORIAL
+    log10_factorial = np.empty_like(flat_nums)
+    log10_factorial[small] = LOG10_FLOAT_FACTORIALS[flat_nums[small].astype(np.intp)]
+    n = flat_nums[~small]
+    log10_factorial[~small] = ((n + 0.5) * np.log(n) - n + 0.5 * np.log(2 * pi)
+                               + 1 / (12 * n) - 1 / (360 * n**3)) / np.log(10)
+    
+    # The absolute error grows with the magnitude of the logarithm; keep
+    # the double-precision result only with three guard digits to spare
+    mantissa_error = (np.abs(log10_factorial) + 1) * np.finfo(np.float64).eps * 4 * np.log(10)
+    precise_enough = mantissa_error * 10.0**(significant_digits + 3) < 1
+    
+    exponents = np.floor(log10_factorial)
+    sig_ints = np.rint(10.0**(log10_factorial - exponents + significant_digits - 1))
+    
+    results = np.empty(flat_nums.size, dtype=object)
+    for pos in range(flat_nums.size):
+        if precise_enough[pos]:
+            sig_int, exponent = int(sig_ints[pos]), int(exponents[pos])
+            if sig_int == 10**significant_digits:
+                sig_int, exponent = sig_int // 10, exponent + 1
+            results[pos] = _format_significant_digits(sig_int, exponent, significant_digits)
+        else:
+            results[pos] = adapted_factorial(int(flat_nums[pos]), significant_digits)
+    
+    return results.astype(str).reshape(nums.shape)
+
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Inputs below this value are computed exactly
+EXACT_FACTORIAL_THRESHOLD = 1000
+
+# Extra digits carried by the extended-precision estimate
+FACTORIAL_GUARD_DIGITS = 10
+
+# Decimal logarithm of 2, to count digits from bit lengths
+LOG10_2 = log(2) / log(10)
+
+# Stirling series correction terms (B_2k / (2k (2k - 1)) as numerator, denominator)
+STIRLING_SERIES_COEFFICIENTS = [
+    (1, 12), (-1, 360), (1, 1260), (-1, 1680), (1, 1188), (-691, 360360), (1, 156)
+]
+
+# Largest factorial representable as a float, and the log10 of all of them
+MAX_FLOAT_FACTORIAL = 170
+LOG10_FLOAT_FACTORIALS = np.log10([float(factorial(k)) for k in range(MAX_FLOAT_FACTORIAL + 1)])
@@ -6,4 +6,8 @@
 # Define what should be available when using 'from pygenutils.operative_systems import *'
 __all__ = [
     'os_operations'
-]
\ No newline at end of file
+]
+
+# Load the submodules on first access
+from pygenutils._lazy_imports import lazy_submodules
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -11,9 +11,9 @@ import os
 # Import project modules # 
 #------------------------#
 
+from filewise.general.introspection_utils import get_type_str
 from paramlib.global_parameters import FILESYSTEM_CONTEXT_MODULES
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
-from pygenutils.strings.string_handler import get_type_str
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.strings.text_formatters import format_string
 
 # %%
@@ -92,9 +92,7 @@ def run_system_command(command,
 
     
     # Handle nested lists by flattening them first for list commands
-    if isinstance(command, list):
-        if any(isinstance(item, list) for item in command):
-            command = flatten_list(command)
+    command = normalise_flat_list(command)
     
     # Validate module and class
     if (module, _class) not in COMMAND_HELPERS:
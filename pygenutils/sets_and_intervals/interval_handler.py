@@ -13,9 +13,9 @@ import pandas as pd
 # Import project modules #
 #------------------------#
 
-from filewise.instrospection_utils import get_caller_args
+from filewise.general.introspection_utils import get_caller_args
 from paramlib.global_parameters import INTERVALS_OPERATION_LIST
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.strings.string_handler import find_substring_index
 
 #------------------#
@@ -136,22 +136,28 @@ def basic_interval_operator(interval_array,
         Array of interval objects to perform operations on.
     constructor : str, optional
         The library used for constructing the intervals. Options are:
-        'pandas', 'intervaltree', 'numpy', 'custom_tuple'. Default is 'pandas'.
+        'pandas', 'intervaltree', 'numpy'. Default is 'pandas'.
+        The 'numpy' constructor runs a native sort-and-sweep engine over paired
+        left/right endpoint arrays, see `numpy_interval_operator`.
     closed : str, optional
         Defines whether the intervals are closed on the left, right, or both sides. 
         Valid values are 'left', 'right', 'both', or 'neither'. Default is 'left'.
     operator : str, optional
         The operation to perform on the interval objects. Options are:
         'union', 'intersection', 'difference', 'symmetric_difference', 'comparison'.
-        Default is 'union'.
+        The 'numpy' constructor also supports 'complement' and does not support
+        'comparison'. Default is 'union'.
     force_union : bool, optional
         Forces the union of all intervals into a single interval if True.
-        Only applies to 'union' and 'pandas' constructor. Default is False.
+        Only applies to 'union' and the 'pandas' and 'numpy' constructors.
+        Default is False.
 
     Returns
     -------
-    Interval object | list[Interval]
+    Interval object | list[Interval] | numpy.ndarray
         The result of the operation applied to the intervals.
+        For the 'numpy' constructor, an (n, 2) array of disjoint, sorted
+        [left, right] bounds, convertible with `to_pandas_interval_array`.
 
     Raises
     ------
@@ -170,7 +176,7 @@ def basic_interval_operator(interval_array,
     # Input validation #
     #-#-#-#-#-#-#-#-#-#-
     
-    particular_constructor_opts = INTERVAL_CONSTRUCTOR_OPTIONS[:2]
+    particular_constructor_opts = INTERVAL_CONSTRUCTOR_OPTIONS[:3]
     all_args = get_caller_args()
     constr_arg_pos = find_substring_index(all_args, "constructor")
     operator_arg_pos = find_substring_index(all_args, "operator")
@@ -180,13 +186,20 @@ def basic_interval_operator(interval_array,
                          "for interval computations."
                          f"Choose one from {particular_constructor_opts}.")
         
-    if operator not in INTERVALS_OPERATION_LIST:
+    supported_operators = NUMPY_INTERVAL_OPERATION_LIST if constructor == "numpy" \
+                          else INTERVALS_OPERATION_LIST
+    if operator not in supported_operators:
         raise ValueError(f"Invalid operator '{operator}' (position {operator_arg_pos}). "
-                         f"Supported options are {INTERVALS_OPERATION_LIST}.")
+                         f"Supported options are {supported_operators}.")
+        
+    if constructor == "numpy":
+        return numpy_interval_operator(interval_array, 
+                                       closed=closed, 
+                                       operator=operator,
+                                       force_union=force_union)
 
     # Handle nested lists by flattening them first
-    if isinstance(interval_array, list) and any(isinstance(item, list) for item in interval_array):
-        interval_array = flatten_list(interval_array)
+    interval_array = normalise_flat_list(interval_array)
 
     # Program progression #
     #-#-#-#-#-#-#-#-#-#-#-#
@@ -205,6 +218,498 @@ def basic_interval_operator(interval_array,
                            "is stored into an array-like object, "
                            f"and that they are interval object compatible:\n{err}")
 
+
+# Native interval engine #
+#------------------------#
+
+def numpy_interval_operator(interval_array, closed="left", operator="union", force_union=False):
+    """
+    Performs interval algebra with a sort-and-sweep over paired endpoint arrays.
+    
+    Intervals are held as two NumPy arrays (left and right endpoints) sharing
+    a single closedness flag, so no per-interval Python objects are built.
+    Every operation runs in O(n log n), the cost of sorting the endpoints.
+
+    Parameters
+    ----------
+    interval_array : array-like
+        Intervals given as an (n, 2) array, a sequence of [left, right] pairs
+        (such as the output of `define_interval` with the 'numpy' or 'custom_tuple'
+        constructors), or a pandas IntervalArray/IntervalIndex.
+        Numeric and datetime64 endpoints are supported.
+    closed : str, optional
+        Defines whether the intervals are closed on the left, right, or both sides.
+        Valid values are 'left', 'right', 'both', or 'neither'. Default is 'left'.
+        'difference', 'symmetric_difference' and 'complement' produce intervals
+        of mixed closedness unless the intervals are half-open, 
+        so they only accept 'left' or 'right'.
+    operator : str, optional
+        The operation to perform. Options are:
+        - 'union': merge overlapping (or touching, where closedness allows it) intervals.
+        - 'intersection': the region covered by every interval.
+        - 'difference': the first interval minus all the others.
+        - 'symmetric_difference': the region covered by an odd number of intervals,
+          as chained pairwise operations would give.
+        - 'complement': the gaps between the intervals, within the span
+          from the smallest left to the largest right endpoint.
+        Default is 'union'.
+    force_union : bool, optional
+        If True and operator is 'union', return the single interval spanning
+        all the inputs. Default is False.
+
+    Returns
+    -------
+    numpy.ndarray
+        An (m, 2) array of disjoint [left, right] bounds sorted by the left endpoint,
+        sharing the input closedness. Empty results have shape (0, 2).
+        
+    Raises
+    ------
+    ValueError
+        If the interval array is malformed, or the closedness is not supported
+        for the given operator.
+
+    Examples
+    --------
+    >>> numpy_interval_operator([[1, 3], [2, 5], [7, 9]], operator="union")
+    array([[1, 5],
+           [7, 9]])
+    >>> numpy_interval_operator([[1, 3], [2, 5], [7, 9]], operator="complement")
+    array([[5, 7]])
+    """
+    
+    # Input validation #
+    #-#-#-#-#-#-#-#-#-#-
+    
+    if operator not in NUMPY_INTERVAL_OPERATION_LIST:
+        raise ValueError(f"Invalid operator '{operator}'. "
+                         f"Supported options are {NUMPY_INTERVAL_OPERATION_LIST}.")
+        
+    valid_closed_options = ["left", "right", "both", "neither"]
+    if closed not in valid_closed_options:
+        raise ValueError(f"closed must be one of {valid_closed_options}, got '{closed}'")
+        
+    if operator in NUMPY_HALF_OPEN_OPERATIONS and closed not in ["left", "right"]:
+        raise ValueError(f"Operator '{operator}' is only supported for half-open intervals "
+                         "(closed='left' or closed='right').")
+        
+    left, right = _interval_endpoint_arrays(interval_array)
+    
+    # Program progression #
+    #-#-#-#-#-#-#-#-#-#-#-#
+    
+    if not left.size:
+        return np.empty((0, 2), dtype=left.dtype)
+    
+    if operator == "union" and force_union:
+        return np.array([[left.min(), right.max()]])
+    
+    return NUMPY_INTERVAL_OPERATIONS[operator](left, right, closed)
+
+
+def to_pandas_interval_array(interval_bounds, closed="left"):
+    """
+    Converts (n, 2) interval bounds, as returned by `numpy_interval_operator`,
+    into a pandas IntervalArray.
+
+    Parameters
+    ----------
+    interval_bounds : array-like
+        The [left, right] bounds of every interval.
+    closed : str, optional
+        Closedness of the intervals. Default is 'left'.
+
+    Returns
+    -------
+    pandas.arrays.IntervalArray
+    """
+    left, right = _interval_endpoint_arrays(interval_bounds)
+    return pd.arrays.IntervalArray.from_arrays(left, right, closed=closed)
+
+
+# Batch point-in-interval queries #
+#---------------------------------#
+
+class IntervalStabbingIndex:
+    """
+    Immutable index answering batch stabbing and overlap queries over intervals.
+    
+    The intervals are stored in plain arrays: grouped by length class
+    (powers of two) and sorted by left endpoint within each class.
+    For a query, the intervals that may contain it in one class have their left
+    endpoint within the class maximum length before it, which two binary searches
+    locate; the candidates are then filtered exactly. All queries of a batch are
+    processed together, so no Python loop runs per query or per interval,
+    and an instance can be pickled and shared with worker processes.
+    
+    Parameters
+    ----------
+    left : array-like
+        Left endpoints, numeric or datetime64.
+    right : array-like
+        Right endpoints, of the same type as `left`.
+    closed : str, optional
+        Defines whether the intervals are closed on the left, right, or both sides.
+        Valid values are 'left', 'right', 'both', or 'neither'. Default is 'both',
+        as in `define_interval`.
+        
+    Examples
+    --------
+    >>> index = IntervalStabbingIndex.from_intervals([define_interval(0, 10), 
+    ...                                               define_interval(5, 15)])
+    >>> indptr, interval_idx = index.stab([3, 7, 20])
+    >>> indptr, interval_idx
+    (array([0, 1, 3, 3]), array([0, 0, 1]))
+    """
+    
+    def __init__(self, left, right, closed="both"):
+        valid_closed_options = ["left", "right", "both", "neither"]
+        if closed not in valid_closed_options:
+            raise ValueError(f"closed must be one of {valid_closed_options}, got '{closed}'")
+            
+        left, right = np.asarray(left), np.asarray(right)
+        if left.shape != right.shape or left.ndim != 1:
+            raise ValueError("left and right must be 1-D arrays of the same length.")
+        if np.any(left > right):
+            raise ValueError("Every interval must satisfy left <= right.")
+            
+        self._closed = closed
+        self._dtype = np.result_type(left, right)
+        (left_keys, right_keys), _ = self._as_keys(left, right)
+        
+        # Group by length class, then sort by left endpoint within each class
+        length_class = _length_classes(right_keys - left_keys)
+        order = np.lexsort((left_keys, length_class))
+        sorted_classes = length_class[order]
+        class_starts = np.flatnonzero(np.append(True, sorted_classes[1:] != sorted_classes[:-1])) \
+                       if order.size else np.empty(0, dtype=np.intp)
+        
+        self._order = order
+        self._left = left_keys[order]
+        self._right = right_keys[order]
+        self._class_bounds = np.append(class_starts, order.size)
+        self._class_max_length = np.array([
+            (self._right[start:stop] - self._left[start:stop]).max()
+            for start, stop in zip(self._class_bounds[:-1], self._class_bounds[1:])
+            ], dtype=self._left.dtype)
+        self._freeze()
+        
+    @classmethod
+    def from_intervals(cls, intervals, closed=None):
+        """
+        Build the index from the outputs of `define_interval`.
+        
+        Parameters
+        ----------
+        intervals : array-like
+            pandas Interval objects, [left, right] pairs (numpy or custom_tuple
+            constructors), an (n, 2) array or a pandas IntervalArray/IntervalIndex.
+        closed : str | None, optional
+            Closedness of the intervals. Default is None, which takes the one
+            of pandas intervals, or 'both' otherwise.
+        """
+        if closed is None:
+            closed = getattr(intervals, "closed", None)
+            if closed is None and len(intervals) and isinstance(intervals[0], pd.Interval):
+                closed = intervals[0].closed
+            closed = closed or "both"
+        left, right = _interval_endpoint_arrays(intervals)
+        return cls(left, right, closed=closed)
+    
+    @property
+    def closed(self):
+        return self._closed
+    
+    def __len__(self):
+        return self._order.size
+    
+    def __repr__(self):
+        return (f"IntervalStabbingIndex(n_intervals={len(self)}, closed='{self._closed}', "
+                f"dtype={self._dtype})")
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._freeze()
+        
+    def stab(self, points):
+        """
+        Find the intervals containing each point.
+        
+        Parameters
+        ----------
+        points : array-like
+            Query values, of a type comparable to the interval endpoints.
+            
+        Returns
+        -------
+        indptr : numpy.ndarray
+            Array of length n_points + 1; the intervals containing point i
+            are interval_idx[indptr[i]:indptr[i + 1]].
+        interval_idx : numpy.ndarray
+            Positions of the matching intervals in the input order.
+            Within a point, intervals are grouped by length class,
+            not sorted by position.
+        """
+        (points,), scale = self._as_keys(np.asarray(points))
+        points = points.ravel()
+        left_inclusive = self._closed in ["both", "left"]
+        right_inclusive = self._closed in ["both", "right"]
+        return self._query(points, points, left_inclusive, right_inclusive, scale)
+    
+    def overlap(self, query_left, query_right):
+        """
+        Find the intervals overlapping each query interval.
+        
+        Query intervals share the closedness of the index, so touching intervals
+        only overlap if both are closed on the shared endpoint ('both').
+        
+        Parameters
+        ----------
+        query_left, query_right : array-like
+            Endpoints of the query intervals.
+            
+        Returns
+        -------
+        indptr, interval_idx : numpy.ndarray
+            CSR form of the (query, interval) pairs, as in `stab`.
+        """
+        (query_left, query_right), scale = self._as_keys(np.asarray(query_left),
+                                                         np.asarray(query_right))
+        query_left, query_right = query_left.ravel(), query_right.ravel()
+        if query_left.shape != query_right.shape:
+            raise ValueError("query_left and query_right must have the same length.")
+        inclusive = self._closed == "both"
+        return self._query(query_left, query_right, inclusive, inclusive, scale)
+    
+    @staticmethod
+    def pairs(indptr, interval_idx):
+        """Expand a CSR result into explicit (query_idx, interval_idx) arrays."""
+        query_idx = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
+        return query_idx, interval_idx
+    
+    def _as_keys(self, *values):
+        """
+        Represent datetime64 values as int64 in the finer unit of the index
+        and the values, so that no value is truncated, together with the factor
+        converting the stored keys to that unit (1 for numeric indexes).
+        """
+        if not np.issubdtype(self._dtype, np.datetime64):
+            return values, 1
+        
+        values = [arr if np.issubdtype(arr.dtype, np.datetime64) else arr.astype("datetime64")
+                  for arr in values]
+        dtype = np.result_type(self._dtype, *values)
+        scale = int(np.array([1], dtype=np.int64).view(self._dtype).astype(dtype).view(np.int64)[0])
+        return [arr.astype(dtype).view(np.int64) for arr in values], scale
+    
+    def _freeze(self):
+        for arr in (self._order, self._left, self._right, self._class_bounds, self._class_max_length):
+            arr.flags.writeable = False
+    
+    def _query(self, lower, upper, left_inclusive, right_inclusive, scale=1):
+        """
+        Collect the intervals with left <(=) upper and right >(=) lower,
+        for every (lower, upper) query pair, the stored keys being multiplied
+        by 'scale' to match a finer datetime unit of the queries.
+        
+        Queries are processed in ascending order of their lower bound, which keeps
+        the binary searches and gathers cache-friendly; the result blocks are
+        permuted back to the input order at the end.
+        """
+        n_queries = lower.size
+        query_order = np.argsort(lower, kind="stable")
+        lower, upper = lower[query_order], upper[query_order]
+        rank_parts, interval_parts = [], []
+        
+        index_left, index_right, class_max_length = self._left, self._right, self._class_max_length
+        if scale != 1:
+            index_left, index_right = index_left * scale, index_right * scale
+            class_max_length = class_max_length * scale
+        
+        for class_pos, (start, stop) in enumerate(zip(self._class_bounds[:-1], self._class_bounds[1:])):
+            class_left = index_left[start:stop]
+            
+            # An interval ending after 'lower' starts at most one maximum length earlier
+            earliest_left = lower - class_max_length[class_pos]
+            if np.issubdtype(earliest_left.dtype, np.floating):
+                earliest_left = np.nextafter(earliest_left, -np.inf)
+            first = np.searchsorted(class_left, earliest_left, side="left")
+            last = np.searchsorted(class_left, upper, side="right" if left_inclusive else "left")
+            
+            counts = np.maximum(last - first, 0)
+            n_candidates = counts.sum()
+            if not n_candidates:
+                continue
+            
+            # Expand every [first, last) range into explicit candidate positions
+            query_rank, positions = _expand_ranges(first + start, counts)
+            candidate_right = index_right[positions]
+            query_lower = lower[query_rank]
+            keep = candidate_right >= query_lower if right_inclusive else candidate_right > query_lower
+            
+            rank_parts.append(query_rank[keep])
+            interval_parts.append(self._order[positions[keep]])
+        
+        if rank_parts:
+            # Every part is already sorted by rank, so the stable sort only merges them
+            query_rank = np.concatenate(rank_parts)
+            rank_perm = np.argsort(query_rank, kind="stable")
+            query_rank = query_rank[rank_perm]
+            interval_idx = np.concatenate(interval_parts)[rank_perm]
+        else:
+            query_rank = interval_idx = np.empty(0, dtype=np.intp)
+        
+        # Move every query block from its rank to its input position
+        rank_counts = np.bincount(query_rank, minlength=n_queries)
+        rank_starts = np.cumsum(rank_counts) - rank_counts
+        counts = np.empty(n_queries, dtype=np.intp)
+        counts[query_order] = rank_counts
+        block_starts = np.empty(n_queries, dtype=np.intp)
+        block_starts[query_order] = rank_starts
+        
+        indptr = np.zeros(n_queries + 1, dtype=np.intp)
+        np.cumsum(counts, out=indptr[1:])
+        return indptr, interval_idx[_expand_ranges(block_starts, counts)[1]]
+
+
+# Helpers #
+#---------#
+
+def _interval_endpoint_arrays(interval_array):
+    """
+    Split any supported interval container into left and right endpoint arrays.
+    """
+    if isinstance(interval_array, (pd.arrays.IntervalArray, pd.IntervalIndex)):
+        return np.asarray(interval_array.left), np.asarray(interval_array.right)
+    
+    if isinstance(interval_array, (list, tuple)) \
+       and interval_array \
+       and isinstance(interval_array[0], pd.Interval):
+        interval_array = pd.arrays.IntervalArray(interval_array)
+        return np.asarray(interval_array.left), np.asarray(interval_array.right)
+    
+    bounds = np.asarray(interval_array)
+    if bounds.size == 0:
+        return np.empty(0), np.empty(0)
+    if bounds.ndim != 2 or bounds.shape[1] != 2:
+        raise ValueError("Intervals must be given as [left, right] pairs, "
+                         f"got an array of shape {bounds.shape}.")
+    
+    left, right = bounds[:, 0], bounds[:, 1]
+    if np.any(left > right):
+        raise ValueError("Every interval must satisfy left <= right.")
+    return left, right
+
+
+def _expand_ranges(starts, counts):
+    """
+    Expand the ranges [starts[i], starts[i] + counts[i]) into one flat array
+    of positions, together with the range number each position comes from.
+    """
+    range_idx = np.repeat(np.arange(counts.size), counts)
+    offsets = np.arange(range_idx.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    return range_idx, np.repeat(starts, counts) + offsets
+
+
+def _length_classes(lengths):
+    """
+    Assign every interval length to a power-of-two class,
+    zero-length intervals forming a class of their own.
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    classes = np.full(lengths.size, np.iinfo(np.int64).min, dtype=np.int64)
+    positive = lengths > 0
+    classes[positive] = np.frexp(lengths[positive])[1]
+    return classes
+
+
+def _stack_bounds(left, right):
+    """Pair the resulting endpoint arrays into an (m, 2) array."""
+    return np.column_stack((left, right)) if left.size else np.empty((0, 2), dtype=left.dtype)
+
+
+def _sweep_union(left, right, closed):
+    """
+    Merge overlapping intervals: after sorting by the left endpoint, a new group
+    starts wherever the left endpoint lies beyond the running maximum right endpoint.
+    Touching intervals merge unless the shared point is excluded by both.
+    """
+    order = np.argsort(left, kind="stable")
+    left, right = left[order], right[order]
+    reach = np.maximum.accumulate(right)
+    
+    if closed == "neither":
+        new_group = left[1:] >= reach[:-1]
+    else:
+        new_group = left[1:] > reach[:-1]
+    starts = np.flatnonzero(np.concatenate(([True], new_group)))
+    ends = np.append(starts[1:], left.size) - 1
+    
+    return _stack_bounds(left[starts], reach[ends])
+
+
+def _sweep_intersection(left, right, closed):
+    """The region common to all intervals is bounded by the extreme endpoints."""
+    lower, upper = left.max(), right.min()
+    if lower < upper or (lower == upper and closed == "both"):
+        return np.array([[lower, upper]])
+    return np.empty((0, 2), dtype=left.dtype)
+
+
+def _coverage_segments(left, right, weights=None):
+    """
+    Sort every endpoint once and compute, for each elementary segment between
+    consecutive distinct endpoints, how many intervals cover it.
+    
+    Returns the distinct endpoints and the coverage of the segment starting at
+    each of them (the last value always being zero). If weights are given,
+    intervals contribute their weight instead of one.
+    """
+    weights = np.ones(left.size, dtype=np.int64) if weights is None else weights
+    positions = np.concatenate((left, right))
+    deltas = np.concatenate((weights, -weights))
+    
+    order = np.argsort(positions, kind="stable")
+    positions, coverage = positions[order], np.cumsum(deltas[order])
+    
+    # Keep the coverage after the last event at every distinct position
+    last_at_position = np.append(positions[1:] != positions[:-1], True)
+    return positions[last_at_position], coverage[last_at_position]
+
+
+def _runs_to_bounds(positions, selected):
+    """
+    Join consecutive selected elementary segments into maximal intervals.
+    Segment k spans positions[k] to positions[k + 1].
+    """
+    selected = selected[:-1]
+    padded = np.concatenate(([False], selected, [False]))
+    changes = np.flatnonzero(padded[1:] != padded[:-1])
+    return _stack_bounds(positions[changes[::2]], positions[changes[1::2]])
+
+
+def _sweep_difference(left, right, closed):
+    """Subtract the union of all other intervals from the first one."""
+    weights = np.full(left.size, left.size, dtype=np.int64)
+    weights[0] = 1
+    positions, coverage = _coverage_segments(left, right, weights)
+    
+    # The first interval adds 1, each other one adds n > 1, so only
+    # coverage == 1 means 'inside the first and outside the others'
+    return _runs_to_bounds(positions, coverage == 1)
+
+
+def _sweep_symmetric_difference(left, right, closed):
+    """Keep the region covered by an odd number of intervals."""
+    positions, coverage = _coverage_segments(left, right)
+    return _runs_to_bounds(positions, coverage % 2 == 1)
+
+
+def _sweep_complement(left, right, closed):
+    """Keep the uncovered gaps between the smallest and largest endpoints."""
+    positions, coverage = _coverage_segments(left, right)
+    return _runs_to_bounds(positions, coverage == 0)
+
 #--------------------------#
 # Parameters and constants #
 #--------------------------#
@@ -224,32 +729,48 @@ INTERVAL_CONSTRUCTORS = {
 }
 
 # Define operations for pandas and intervaltree constructors
+# (the third argument, 'force_union', is already handled by the caller)
 OPERATIONS_PANDAS = {
-    "union": lambda interval_array, closed: 
+    "union": lambda interval_array, closed, _: 
         pd.arrays.IntervalArray(interval_array, closed=closed).piso.union()[0],
-    "intersection": lambda interval_array, closed: \
+    "intersection": lambda interval_array, closed, _: \
         pd.arrays.IntervalArray(interval_array, closed=closed).piso.intersection()[0],
-    "difference": lambda interval_array, closed: \
+    "difference": lambda interval_array, closed, _: \
         pd.arrays.IntervalArray(interval_array, closed=closed).piso.difference()[0],
-    "symmetric_difference": lambda interval_array, closed: \
+    "symmetric_difference": lambda interval_array, closed, _: \
         pd.arrays.IntervalArray(interval_array, closed=closed).piso.symmetric_difference()[0],
-    "comparison": lambda interval_array, closed: \
+    "comparison": lambda interval_array, closed, _: \
         pd.arrays.IntervalArray(interval_array, closed=closed).piso.comparison()[0]
 }
 
 OPERATIONS_INTERVALTREE = {
-    "union": lambda interval_array, closed: \
+    "union": lambda interval_array, closed, _: \
         IntervalTree.from_tuples(interval_array).merge_overlaps(),
-    "intersection": lambda interval_array, closed: \
+    "intersection": lambda interval_array, closed, _: \
         IntervalTree.from_tuples(interval_array).overlap(),
-    "difference": lambda interval_array, closed: \
+    "difference": lambda interval_array, closed, _: \
         IntervalTree.from_tuples(interval_array).difference(),
-    "symmetric_difference": lambda interval_array, closed: \
+    "symmetric_difference": lambda interval_array, closed, _: \
         IntervalTree.from_tuples(interval_array).symmetric_difference(),
-    "comparison": lambda interval_array, closed: \
+    "comparison": lambda interval_array, closed, _: \
         IntervalTree.from_tuples(interval_array).comparison()
 }
 
+# Define operations for the native (numpy) engine
+NUMPY_INTERVAL_OPERATIONS = {
+    "union": _sweep_union,
+    "intersection": _sweep_intersection,
+    "difference": _sweep_difference,
+    "symmetric_difference": _sweep_symmetric_difference,
+    "complement": _sweep_complement
+}
+
+NUMPY_INTERVAL_OPERATION_LIST = list(NUMPY_INTERVAL_OPERATIONS)
+
+# Operations whose results are only expressible with a single closedness flag
+# if the intervals are half-open
+NUMPY_HALF_OPEN_OPERATIONS = ["difference", "symmetric_difference", "complement"]
+
 # Combine operations into a dictionary for easy access
 INTERVAL_OPERATIONS = {
     "pandas": OPERATIONS_PANDAS,
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+#----------------#
+# Import modules #
+#----------------#
+
+from functools import reduce
+
+import numpy as np
+
 #------------------------#
 # Import project modules #
 #------------------------#
 
 from filewise.general.introspection_utils import get_caller_args
 from paramlib.global_parameters import sets_operation_list
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.strings.string_handler import find_substring_index
 
 #-------------------------#
@@ -17,7 +25,8 @@ from pygenutils.strings.string_handler import find_substring_index
 def sets_operator(array_of_sets1, 
                   array_of_sets2=None, 
                   constructor="default",
-                  operator="union"):
+                  operator="union",
+                  lazy=False):
     """
     Perform operations on sets using the specified constructor and operator.
     
@@ -34,15 +43,21 @@ def sets_operator(array_of_sets1,
     operator : str, optional
         The operation to perform. Options include 'union', 'intersection', 'difference', 
         'symmetric_difference', 'cartesian_product'. Default is 'union'.
+    lazy : bool, optional
+        Only for 'cartesian_product': if True, return a LazyCartesianProduct
+        over the sets in `array_of_sets1` instead of materialising the product,
+        regardless of the constructor. Default is False.
     
     Returns
     -------
-    Resulting set based on the operation and constructor.
+    Resulting set based on the operation and constructor,
+    or a LazyCartesianProduct if `lazy` is True.
     
     Raises
     ------
     ValueError
-        If an unsupported constructor or operator is specified.
+        If an unsupported constructor or operator is specified,
+        or if `lazy` is requested for an operator other than 'cartesian_product'.
     """
     
     # Argument validations #
@@ -59,13 +74,15 @@ def sets_operator(array_of_sets1,
     if constructor not in SETS_CONSTRUCTOR_OPTIONS: 
         raise ValueError(f"Unsupported set constructor library (position {constructor_arg_pos}). "
                          f"Choose one from {SETS_CONSTRUCTOR_OPTIONS}.")
+        
+    if lazy:
+        if operator != "cartesian_product":
+            raise ValueError("Lazy evaluation is only available for the 'cartesian_product' operator.")
+        return LazyCartesianProduct(array_of_sets1)
     
     # Handle nested lists by flattening them first
-    if isinstance(array_of_sets1, list) and any(isinstance(item, list) for item in array_of_sets1):
-        array_of_sets1 = flatten_list(array_of_sets1)
-    
-    if array_of_sets2 is not None and isinstance(array_of_sets2, list) and any(isinstance(item, list) for item in array_of_sets2):
-        array_of_sets2 = flatten_list(array_of_sets2)
+    array_of_sets1 = normalise_flat_list(array_of_sets1)
+    array_of_sets2 = normalise_flat_list(array_of_sets2)
     
     # Program progression #
     #-#-#-#-#-#-#-#-#-#-#-#
@@ -93,6 +110,375 @@ def sets_operator(array_of_sets1,
             return SYMPY_OPERATION_DICT[operator](finite_set1, finite_set2)
 
 
+
+def bulk_sets_operator(array_of_sets, operator="union", backend="auto"):
+    """
+    Perform an n-way operation over many sets at once.
+    
+    Instead of reducing the sets pairwise (one intermediate set per step),
+    every operand is processed in a single pass. Integer data are handled
+    either as sorted unique NumPy arrays or as packed bitmaps over the
+    common value range; Python sets remain the fallback for any other
+    hashable elements.
+    
+    Parameters
+    ----------
+    array_of_sets : list[set | list | numpy.ndarray]
+        Collection of sets (or set-like iterables) to operate on.
+    operator : str, optional
+        The operation to perform. Options are 'union', 'intersection',
+        'difference' and 'symmetric_difference'. The difference is taken as
+        the first set minus every other one, and the symmetric difference
+        keeps the elements present in an odd number of sets, as chained
+        pairwise operations would. Default is 'union'.
+    backend : str, optional
+        Storage used for the computation. Options are:
+        - 'auto': 'bitmap' for dense integer ranges, 'numpy' for the rest
+          of integer data, 'default' otherwise.
+        - 'numpy': sorted unique integer arrays.
+        - 'bitmap': packed bitmaps spanning the minimum to maximum value.
+        - 'default': Python's set class.
+        Default is 'auto'.
+    
+    Returns
+    -------
+    set | numpy.ndarray
+        A Python set for the 'default' backend, a sorted integer array
+        for the 'numpy' and 'bitmap' backends.
+    
+    Raises
+    ------
+    ValueError
+        If an unsupported operator or backend is specified.
+    TypeError
+        If an integer backend is requested for non-integer data.
+        
+    Examples
+    --------
+    >>> bulk_sets_operator([{1, 2, 3}, {2, 3, 4}, {3, 4, 5}], operator="intersection")
+    array([3])
+    >>> bulk_sets_operator([{"a", "b"}, {"b", "c"}], operator="union")
+    {'a', 'b', 'c'}
+    """
+    
+    # Argument validations #
+    #-#-#-#-#-#-#-#-#-#-#-#-
+    
+    param_keys = get_caller_args()
+    operator_arg_pos = find_substring_index(param_keys, "operator")
+    backend_arg_pos = find_substring_index(param_keys, "backend")
+    
+    if operator not in BULK_OPERATION_OPTIONS:
+        raise ValueError(f"Invalid operator for bulk set operations (position {operator_arg_pos}). "
+                         f"Supported options are {BULK_OPERATION_OPTIONS}.")
+        
+    if backend not in BULK_BACKEND_OPTIONS:
+        raise ValueError(f"Unsupported bulk set backend (position {backend_arg_pos}). "
+                         f"Choose one from {BULK_BACKEND_OPTIONS}.")
+        
+    array_of_sets = list(array_of_sets)
+    if not array_of_sets:
+        return set() if backend == "default" else np.array([], dtype=np.int64)
+    
+    # Program progression #
+    #-#-#-#-#-#-#-#-#-#-#-#
+    
+    if backend == "default":
+        return BULK_DEFAULT_OPERATION_DICT[operator](_as_python_sets(array_of_sets))
+    
+    int_arrays = [_to_unique_int_array(s) for s in array_of_sets]
+    
+    if any(arr is None for arr in int_arrays):
+        if backend == "auto":
+            return BULK_DEFAULT_OPERATION_DICT[operator](_as_python_sets(array_of_sets))
+        raise TypeError(f"Backend '{backend}' requires integer sets representable as int64.")
+        
+    if backend == "auto":
+        backend = "bitmap" if _is_dense(int_arrays) else "numpy"
+        
+    if backend == "numpy":
+        return BULK_NUMPY_OPERATION_DICT[operator](int_arrays)
+    else:
+        return _bitmap_operator(int_arrays, operator)
+    
+
+# Lazy cartesian product #
+#------------------------#
+
+class LazyCartesianProduct:
+    """
+    Sized, random-access view over the cartesian product of several sets.
+    
+    Nothing is materialised on construction: items are decoded on demand
+    from their flat index by mixed-radix arithmetic, in the same order as
+    itertools.product (the last factor varies fastest). This allows
+    splitting a parameter sweep into index ranges and handing each range
+    to a different worker process.
+    
+    Parameters
+    ----------
+    factors : list[set | list | tuple | numpy.ndarray]
+        The sets whose cartesian product is represented.
+        Unordered containers are fixed to their iteration order once.
+    
+    Examples
+    --------
+    >>> prod = LazyCartesianProduct([{1, 2}, ["a", "b", "c"]])
+    >>> len(prod)
+    6
+    >>> prod[4]
+    (2, 'b')
+    >>> next(prod.chunks(chunk_size=4)).shape
+    (4, 2)
+    """
+    
+    def __init__(self, factors):
+        self.factors = [tuple(factor) for factor in factors]
+        self.radices = [len(factor) for factor in self.factors]
+        
+        # Number of items spanned by one step of each factor
+        self._strides = [1] * len(self.radices)
+        for pos in range(len(self.radices) - 2, -1, -1):
+            self._strides[pos] = self._strides[pos + 1] * self.radices[pos + 1]
+            
+        # As for itertools.product, no factors give one empty item
+        self._size = self._strides[0] * self.radices[0] if self.radices else 1
+        self._factor_arrays = None
+        
+    @property
+    def size(self):
+        """Number of items, as a Python int (len() cannot exceed sys.maxsize)."""
+        return self._size
+    
+    def __len__(self):
+        return self._size
+    
+    def __iter__(self):
+        from itertools import product
+        return product(*self.factors)
+    
+    def __getitem__(self, index):
+        index = self._normalise_index(index)
+        return tuple(factor[(index // stride) % radix]
+                     for factor, stride, radix in zip(self.factors, self._strides, self.radices))
+    
+    def __repr__(self):
+        return f"LazyCartesianProduct(radices={self.radices}, size={self._size})"
+    
+    def chunks(self, chunk_size=100_000, start=0, stop=None):
+        """
+        Yield the items between two flat indices as (k, d) NumPy arrays.
+        
+        Row digits are decoded with numpy.unravel_index, so the flat indices
+        must fit in a 64-bit integer; use item access beyond that.
+        
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Maximum number of rows per chunk. Default is 100 000.
+        start : int, optional
+            First flat index to emit. Default is 0.
+        stop : int | None, optional
+            Flat index at which to stop (exclusive).
+            Default is None, meaning the end of the product.
+            
+        Yields
+        ------
+        numpy.ndarray
+            Array of shape (k, d), d being the number of factors.
+            The dtype is the common one of all factors, object if they
+            cannot be promoted to a single type.
+        """
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be a positive integer.")
+            
+        stop = self._size if stop is None else min(stop, self._size)
+        start = max(start, 0)
+        if start >= stop:
+            return
+        
+        if not self.factors:
+            yield np.empty((stop - start, 0), dtype=object)
+            return
+        
+        if self._factor_arrays is None:
+            self._factor_arrays = _factor_value_arrays(self.factors)
+        column_dtype = self._factor_arrays[0].dtype
+        
+        for chunk_start in range(start, stop, chunk_size):
+            flat_indices = np.arange(chunk_start, min(chunk_start + chunk_size, stop))
+            digits = np.unravel_index(flat_indices, self.radices)
+            chunk = np.empty((flat_indices.size, len(self.factors)), dtype=column_dtype)
+            for col, (values, digit) in enumerate(zip(self._factor_arrays, digits)):
+                chunk[:, col] = values[digit]
+            yield chunk
+            
+    def shard(self, worker_index, n_workers):
+        """
+        Return the (start, stop) flat index range assigned to one worker
+        when the product is split into `n_workers` contiguous parts.
+        """
+        if not 0 <= worker_index < n_workers:
+            raise ValueError(f"'worker_index' must lie between 0 and {n_workers - 1}.")
+        base_size, remainder = divmod(self._size, n_workers)
+        start = worker_index * base_size + min(worker_index, remainder)
+        return start, start + base_size + (worker_index < remainder)
+    
+    def _normalise_index(self, index):
+        index = int(index)
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"Index out of range for a product of size {self._size}.")
+        return index
+
+
+# Helpers #
+#---------#
+
+def _factor_value_arrays(factors):
+    """
+    Convert the product factors to NumPy arrays sharing one dtype,
+    falling back to object arrays when no common type exists.
+    """
+    factor_arrays = [np.asarray(factor) for factor in factors]
+    kinds = {arr.dtype.kind for arr in factor_arrays}
+    
+    # Mixing numbers with strings or dates would silently cast them all to one
+    if any(arr.ndim != 1 for arr in factor_arrays) \
+       or "O" in kinds \
+       or (len(kinds) > 1 and not kinds <= set("biuf")):
+        return [_object_array(factor) for factor in factors]
+    
+    common_dtype = np.result_type(*factor_arrays)
+    return [arr.astype(common_dtype, copy=False) for arr in factor_arrays]
+
+
+def _object_array(values):
+    """Build a 1-D object array, keeping tuple-like items as single elements."""
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = list(values)
+    return arr
+
+
+def _as_python_sets(array_of_sets):
+    """Convert the operands to Python sets, leaving existing sets uncopied."""
+    return [obj if isinstance(obj, (set, frozenset)) else set(obj) for obj in array_of_sets]
+
+
+def _update_symmetric_difference(accumulated_set, new_set):
+    """In-place symmetric difference, avoiding one new set per reduction step."""
+    accumulated_set ^= new_set
+    return accumulated_set
+
+
+def _to_unique_int_array(obj):
+    """
+    Convert a set-like object to a sorted unique int64 array.
+    
+    Returns None if the object holds anything other than integers
+    representable as int64.
+    """
+    if isinstance(obj, np.ndarray):
+        if not np.issubdtype(obj.dtype, np.integer):
+            return None
+        # Unsigned values above the int64 range would wrap around
+        if obj.dtype == np.uint64 and obj.size and obj.max() > np.iinfo(np.int64).max:
+            return None
+        arr = obj.astype(np.int64, copy=False).ravel()
+    else:
+        if not all(isinstance(x, (int, np.integer)) and not isinstance(x, bool) for x in obj):
+            return None
+        try:
+            arr = np.fromiter(obj, dtype=np.int64, count=len(obj))
+        except OverflowError:
+            return None
+        
+    if arr.size > 1 and np.all(arr[1:] > arr[:-1]):
+        return arr
+    return _sorted_unique(arr)[0]
+
+
+def _sorted_unique(arr):
+    """
+    Sort an integer array and drop repeated values.
+    
+    Returns the unique values together with the boolean mask marking the
+    first element of every run in the sorted array, so that callers can
+    derive occurrence counts without a second pass.
+    """
+    arr = np.sort(arr)
+    run_starts = np.empty(arr.size, dtype=bool)
+    if arr.size:
+        run_starts[0] = True
+        np.not_equal(arr[1:], arr[:-1], out=run_starts[1:])
+    return arr[run_starts], run_starts
+
+
+def _is_dense(int_arrays):
+    """
+    Decide whether packed bitmaps need less memory than sorted arrays,
+    i.e. one bit per value of the common range and per set against
+    64 bits per stored element.
+    """
+    non_empty = [arr for arr in int_arrays if arr.size]
+    if not non_empty:
+        return False
+    lower = min(arr[0] for arr in non_empty)
+    upper = max(arr[-1] for arr in non_empty)
+    total_size = sum(arr.size for arr in non_empty)
+    return len(int_arrays) * (int(upper) - int(lower) + 1) <= 64 * total_size
+
+
+def _numpy_intersection(int_arrays):
+    """Intersect sorted unique arrays, smallest first, stopping early when empty."""
+    int_arrays = sorted(int_arrays, key=len)
+    result = int_arrays[0]
+    for arr in int_arrays[1:]:
+        if not result.size:
+            break
+        result = np.intersect1d(result, arr, assume_unique=True)
+    return result
+
+
+def _numpy_symmetric_difference(int_arrays):
+    """Keep the values that appear in an odd number of sorted unique arrays."""
+    values, run_starts = _sorted_unique(np.concatenate(int_arrays))
+    counts = np.diff(np.append(np.flatnonzero(run_starts), run_starts.size))
+    return values[counts % 2 == 1]
+
+
+def _bitmap_operator(int_arrays, operator):
+    """
+    Run the operator over packed bitmaps spanning the common value range.
+    
+    Each set becomes one row of a (n_sets, ceil(span / 8)) uint8 matrix,
+    so the n-way operation is a single bitwise reduction along the rows.
+    """
+    non_empty = [arr for arr in int_arrays if arr.size]
+    if not non_empty:
+        return np.array([], dtype=np.int64)
+    
+    lower = min(arr[0] for arr in non_empty)
+    upper = max(arr[-1] for arr in non_empty)
+    span = int(upper) - int(lower) + 1
+    
+    packed = np.empty((len(int_arrays), (span + 7) // 8), dtype=np.uint8)
+    mask = np.empty(span, dtype=bool)
+    for row, arr in enumerate(int_arrays):
+        mask[:] = False
+        mask[arr - lower] = True
+        packed[row] = np.packbits(mask)
+    
+    if operator == "difference":
+        result = packed[0] & ~np.bitwise_or.reduce(packed[1:], axis=0) \
+                 if len(packed) > 1 else packed[0]
+    else:
+        result = BITMAP_REDUCERS[operator].reduce(packed, axis=0)
+    
+    return np.flatnonzero(np.unpackbits(result, count=span)) + lower
+
+
 #--------------------------#        
 # Parameters and constants #
 #--------------------------#
@@ -116,3 +502,36 @@ SYMPY_OPERATION_DICT = {
     "difference": lambda finite_set1, finite_set2: finite_set1 - finite_set2,
     "symmetric_difference": lambda finite_set1, finite_set2: finite_set1.symmetric_difference(finite_set2),
 }
+
+# Bulk (n-way) set operations #
+#-----------------------------#
+
+# Supported operators and storage backends #
+BULK_OPERATION_OPTIONS = ["union", "intersection", "difference", "symmetric_difference"]
+BULK_BACKEND_OPTIONS = ["auto", "numpy", "bitmap", "default"]
+
+# Operation dictionary for the 'default' backend (using Python's set class)
+BULK_DEFAULT_OPERATION_DICT = {
+    "union": lambda sets: set().union(*sets),
+    "intersection": lambda sets: set(min(sets, key=len)).intersection(*sets),
+    "difference": lambda sets: set(sets[0]).difference(*sets[1:]),
+    "symmetric_difference": lambda sets: reduce(_update_symmetric_difference, sets, set()),
+}
+
+# Operation dictionary for the 'numpy' backend (sorted unique integer arrays)
+BULK_NUMPY_OPERATION_DICT = {
+    "union": lambda int_arrays: _sorted_unique(np.concatenate(int_arrays))[0],
+    "intersection": _numpy_intersection,
+    "difference": lambda int_arrays: np.setdiff1d(int_arrays[0], 
+                                                  _sorted_unique(np.concatenate(int_arrays[1:]))[0],
+                                                  assume_unique=True)
+                                     if len(int_arrays) > 1 else int_arrays[0],
+    "symmetric_difference": _numpy_symmetric_difference,
+}
+
+# Bitwise reductions for the 'bitmap' backend
+BITMAP_REDUCERS = {
+    "union": np.bitwise_or,
+    "intersection": np.bitwise_and,
+    "symmetric_difference": np.bitwise_xor,
+}
@@ -13,15 +13,15 @@ from sys import maxsize
 
 # Third-party modules #
 from numpy import array, char, vectorize
-from pandas import DataFrame, Series
 
 #------------------------#
 # Import project modules # 
 #------------------------#
 
-from filewise.general.introspection_utils import get_caller_args, get_type_str
+from filewise.general.introspection_utils import get_caller_args
 from paramlib.global_parameters import FILESYSTEM_CONTEXT_MODULES
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 
 #------------------#
 # Define functions #
@@ -119,12 +119,12 @@ def find_substring_index(string,
                 return [first_index, last_index]
 
     
-    elif get_type_str(string) in ["list", "ndarray", "tuple"]:
+    elif type_key(string) in ["list", "ndarray", "tuple"]:
         if isinstance(substring, str):
     
             # Simple search without advanced features
             if not advanced_search:
-                if get_type_str(string) == "ndarray":
+                if type_key(string) == "ndarray":
                     if return_match_index == "lo":
                         match_indices = char.find(string, substring, start=start, end=end)
                         return [idx for idx in match_indices if idx != -1]
@@ -154,11 +154,9 @@ def find_substring_index(string,
       
                 return [n for n in match_indices if n != -1]
                 
-        elif get_type_str(substring) in ["list", "ndarray", "tuple"]:
+        elif type_key(substring) in ["list", "ndarray", "tuple"]:
             # Handle nested lists by flattening them first
-            if isinstance(substring, list):
-                if any(isinstance(item, list) for item in substring):
-                    substring = flatten_list(substring)
+            substring = normalise_flat_list(substring)
             
             if not advanced_search:
                 if return_match_index == "lo":
@@ -279,7 +277,7 @@ def _advanced_pattern_searcher(string, substring,
         iterator_considered
     ]
     
-    if get_type_str(string) in ["list", "ndarray", "tuple"]:        
+    if type_key(string) in ["list", "ndarray", "tuple"]:        
         match_obj_spec = vectorize(_return_search_obj_spec)(*format_args_list)
     else:
         match_obj_spec = _return_search_obj_spec(*format_args_list)
@@ -715,7 +713,7 @@ def substring_replacer(string, substr2find, substr2replace, count_std=-1,
       for all supported input types, enabling straightforward substring replacements.
     """
     
-    obj_type = get_type_str(string, lowercase=True)
+    obj_type = type_key(string)
     
     if obj_type not in STR_REPL_OBJ_TYPES:
         raise TypeError("Input object must be of type 'string', 'list', "
@@ -889,6 +887,6 @@ REPLACE_ACTIONS = {
     "str": lambda s, sb2find, sb2replace, count_std : s.replace(sb2find, sb2replace, count_std),
     "list": lambda s, sb2find, sb2replace, _ : char.replace(array(s), sb2find, sb2replace),
     "ndarray": lambda s, sb2find, sb2replace, _ : char.replace(s, sb2find, sb2replace),
-    "dataframe": lambda s, sb2find, sb2replace, _ : DataFrame.replace(s, sb2find, sb2replace),
-    "series": lambda s, sb2find, sb2replace, _ : Series.replace(s, sb2find, sb2replace),
+    "dataframe": lambda s, sb2find, sb2replace, _ : s.replace(sb2find, sb2replace),
+    "series": lambda s, sb2find, sb2replace, _ : s.replace(sb2find, sb2replace),
 } 
\ No newline at end of file
@@ -29,8 +29,8 @@ Functions
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.strings.string_handler import find_substring_index
 
 #-------------------------#
@@ -74,13 +74,14 @@ def format_string(string2format, arg_obj):
     
     num_brackets = len(bracket_index_list)
     
+    is_sequence = type_key(arg_obj) in MAIN_INPUT_DTYPE_LIST_STRFMT
+    
     try:               
-        if (get_type_str(arg_obj) in MAIN_INPUT_DTYPE_LIST_STRFMT\
-            and num_brackets >= 2):
+        if is_sequence and num_brackets >= 2:
             formatted_string = string2format.format(*arg_obj)
             
-        elif ((get_type_str(arg_obj) in MAIN_INPUT_DTYPE_LIST_STRFMT and num_brackets < 2)\
-            or (get_type_str(arg_obj) not in MAIN_INPUT_DTYPE_LIST_STRFMT\
+        elif ((is_sequence and num_brackets < 2)\
+            or (not is_sequence\
             and not isinstance(arg_obj, dict))):
             formatted_string = string2format.format(arg_obj)
         
@@ -456,8 +457,7 @@ def format_table_from_list(dict_list,
             dict_list = [dict_list]
     
     # Handle nested lists by flattening them first
-    if isinstance(dict_list, list) and any(isinstance(item, list) for item in dict_list):
-        dict_list = flatten_list(dict_list)
+    dict_list = normalise_flat_list(dict_list)
     
     # Ensure all dictionaries are of the same length
     first_len = len(dict_list[0])
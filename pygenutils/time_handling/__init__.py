@@ -9,6 +9,11 @@ __all__ = [
     'countdown',
     'date_and_time_maths',
     'date_and_time_utils',
+    'instrumentation',
     'program_snippet_exec_timers',
     'time_formatters'
-]
\ No newline at end of file
+]
+
+# Load the submodules on first access
+from pygenutils._lazy_imports import lazy_submodules
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -15,9 +15,9 @@ import pandas as pd
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str
 from filewise.pandas_utils.pandas_obj_handler import save2csv, save2excel
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.arrays_and_lists.patterns import unique_type_objects
 from pygenutils.strings.string_handler import modify_obj_specs
 from pygenutils.time_handling.date_and_time_utils import (
@@ -86,26 +86,22 @@ def standardise_calendar(obj,
     For Excel files, data will be saved with separate sheets for each variable (if applicable).
     """
 
-    obj_type = get_type_str(obj, lowercase=True)
+    obj_type = type_key(obj)
     
     # Validate extension if save_as_new_obj is True
     if save_as_new_obj and extension is not None:
-        if obj_type == "pandas" and extension not in SUPPORTED_FILE_EXTS_PANDAS:
+        if obj_type == "dataframe" and extension not in SUPPORTED_FILE_EXTS_PANDAS:
             raise ValueError(f"Unsupported file extension for pandas objects: '{extension}'. "
                            f"Supported extensions are: {SUPPORTED_FILE_EXTS_PANDAS}")
     
     # Handling pandas dataframes #
-    if obj_type == "pandas" \
-        or (obj_type == "list" and all(get_type_str(element) == "dataframe")
-            for element in obj):
+    if obj_type == "dataframe" \
+        or (obj_type == "list" and all(type_key(element) == "dataframe"
+                                       for element in obj)):
         
         obj = np.atleast_1d(obj)  # Ensure obj is list-like
-        file_path = np.atleast_1d(file_path)  # Ensure file_path is list-like
-        
-        # Handle nested lists by flattening them first
-        if isinstance(file_path, list):
-            if any(isinstance(item, list) for item in file_path):
-                file_path = flatten_list(file_path)
+        # Ensure file_path is list-like, flattening nested lists first
+        file_path = np.atleast_1d(normalise_flat_list(file_path))
         
         obj_std_calendar = []
         len_objects = len(obj)
@@ -172,7 +168,7 @@ def standardise_calendar(obj,
     # Handling xarray datasets or data arrays (no xarray/climarraykit at module import;
     # cftime_range and get_file_dimensions are loaded only for this branch)
     elif obj_type in ["dataarray", "dataset"] \
-        or (obj_type == "list" and all(get_type_str(element) in ["dataarray", "dataset"] 
+        or (obj_type == "list" and all(type_key(element) in ["dataarray", "dataset"] 
                                        for element in obj)):
         
         from xarray import cftime_range
@@ -11,6 +11,7 @@ Pandas, Numpy date and date/time objects.
 # Import modules #
 #----------------#
 
+from calendar import monthrange
 import datetime
 import numpy as np
 import pandas as pd
@@ -20,13 +21,12 @@ import pandas as pd
 #------------------------#
 
 from filewise.general.introspection_utils import get_caller_args, get_type_str
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.arrays_and_lists.patterns import select_elements
 from pygenutils.strings.text_formatters import format_string, print_format_string
 from pygenutils.strings.string_handler import find_substring_index
 from pygenutils.time_handling.time_formatters import (
-    datetime_obj_converter,
-    parse_float_dt,
+    dt_obj_converter,
     parse_dt_string
 )
 
@@ -88,16 +88,22 @@ def _validate_option(arg_iterable, error_class, error_str):
 def sum_dt_objects(dt_obj_list,
                    dt_fmt_str="%T",
                    operation="sum",
-                   output_format="standard"):
+                   output_format="default",
+                   by=None):
     """
     Calculate the sum or difference of a list of clock times
     and format the output accordingly.
+    
+    The whole collection is parsed at once and the time of day of each object
+    (its datetime64 value minus its day floor) is reduced as a
+    timedelta64[ns] array, so it scales to millions of records.
 
     Parameters
     ----------
-    dt_obj_list : list[str] | tuple[str] | np.ndarray[str]
-        A list, tuple, or numpy.ndarray containing time objects as strings 
-        that follow the format specified in 'time_fmt_str'.
+    dt_obj_list : list | tuple | numpy.ndarray | pandas.Series
+        Clock times, either as strings that follow the format specified
+        in 'dt_fmt_str' or as date/time objects (datetime64, datetime.datetime,
+        datetime.time, pandas.Timestamp or timedelta64 durations).
     operation : str, optional
         The operation to perform on the clock times. Supported operations 
         are "sum" (default) and "subtr" for subtraction.
@@ -106,21 +112,26 @@ def sum_dt_objects(dt_obj_list,
         Default is '%T'.
     output_format : str, optional
         The format of the output. Supported options:
-        - 'standard': Returns the total time as a pandas.Timedelta object (default).
+        - 'default': Returns the total time as a pandas.Timedelta object (default).
         - 'string': Returns the total time as a string.
         - 'time_only': Returns the total time as a datetime.time object.
         - 'tuple': Returns a tuple of (days, hours, minutes, seconds) from the total time.
+    by : array-like, optional
+        Group keys, one per clock time. If given, the operation is performed
+        within each group, like a groupby-sum over durations, in which case
+        subtraction takes the first clock time of each group minus the rest.
 
     Returns
     -------
-    object
+    object | pandas.Series
         The total time after performing the specified operation,
         formatted based on 'output_format'.
+        If 'by' is given, a Series of totals indexed by the group keys.
 
     Raises
     ------
     TypeError
-        If 'dt_obj_list' is not a list, tuple, or numpy.ndarray.
+        If 'dt_obj_list' is not a list, tuple, numpy.ndarray or pandas.Series.
     ValueError
         If 'dt_obj_list' contains fewer than 2 elements or if an unsupported 
         operation or output format is specified.
@@ -136,14 +147,13 @@ def sum_dt_objects(dt_obj_list,
     if isinstance(dt_obj_list, str):
         raise TypeError(f"Argument '{param_keys[obj_list_pos]}' "
                         f"(number {obj_list_pos}) must either be a "
-                        "list, tuple or numpy.ndarray.")
-    elif (isinstance(dt_obj_list, (list, tuple, np.ndarray)) and len(dt_obj_list) < 2):
+                        "list, tuple, numpy.ndarray or pandas.Series.")
+    elif (isinstance(dt_obj_list, ARRAY_LIKE_TYPES) and len(dt_obj_list) < 2):
         raise ValueError(f"Argument '{param_keys[obj_list_pos]}' "
                          "must contain at least two objects.")
     
     # Handle nested lists by flattening them first
-    if isinstance(dt_obj_list, list) and any(isinstance(item, list) for item in dt_obj_list):
-        dt_obj_list = flatten_list(dt_obj_list)
+    dt_obj_list = normalise_flat_list(dt_obj_list)
     
     # Operation argument control #        
     format_args_math_op = (operation, BASIC_MATH_OPT_LIST)
@@ -156,25 +166,149 @@ def sum_dt_objects(dt_obj_list,
     # Program progression #
     #######################
     
-    # Time delta object conversions #
-    timedelta_list = []
-    for dt_obj in dt_obj_list:
-        dt_obj = parse_dt_string(dt_obj, dt_fmt_str)
-        time_obj = extract_dt_part(dt_obj)
-        timedelta_obj = datetime_obj_converter(time_obj, "float")
-        timedelta_list.append(timedelta_obj)
-        
-    # Perform the arithmetical operations #
-    total_timedelta = OPERATION_DICT.get(operation)(timedelta_list)    
+    # Time of day of every object, as a single timedelta64[ns] array #
+    timedeltas = _clock_times_to_timedelta64(dt_obj_list, dt_fmt_str)
+    
+    # Perform the arithmetical operations, within groups if requested #
+    keys = np.zeros(len(timedeltas), dtype=np.int8) if by is None else np.asarray(by)
+    total_timedeltas = _sum_timedelta64(timedeltas, keys, operation)
     
     # Return the result in the specified output format #
-    total_timedelta_formatted = TIME_OUTPUT_FORMAT_DICT.get(output_format)(total_timedelta)
+    format_total = TIME_OUTPUT_FORMAT_DICT.get(output_format)
+    if by is not None:
+        return total_timedeltas.map(format_total)
+    
+    total_timedelta_formatted = format_total(total_timedeltas.iloc[0])
     return total_timedelta_formatted
     
 
 # Auxiliary methods #
 #-#-#-#-#-#-#-#-#-#-#
 
+def _clock_times_to_timedelta64(dt_objs, dt_fmt_str):
+    """
+    Time of day of every object as a timedelta64[ns] array,
+    parsing or converting the whole collection at once.
+    Objects that already are durations (timedelta64) are kept as they are,
+    and time zone aware objects give the clock time of their own time zone.
+    """
+    if isinstance(dt_objs, pd.Series) and isinstance(dt_objs.dtype, pd.DatetimeTZDtype):
+        dt_objs = dt_objs.dt.tz_localize(None)
+    values = np.asarray(dt_objs)
+    
+    if values.dtype.kind == "m":
+        return values.astype("timedelta64[ns]")
+    
+    # datetime.time objects carry no date, so read them as durations
+    if values.dtype == object and isinstance(values[0], datetime.time):
+        return pd.to_timedelta([t.isoformat() for t in values]).to_numpy("timedelta64[ns]")
+    
+    dt_arr = _to_datetime64_array(values, dt_fmt_str)
+    return (dt_arr - dt_arr.astype("datetime64[D]")).astype("timedelta64[ns]")
+
+
+def _sum_timedelta64(timedeltas, keys, operation):
+    """
+    Exact sum or difference of a timedelta64[ns] array within each group key.
+    
+    Subtraction negates every element but the first one of its group.
+    The nanosecond counts are split into whole seconds and remainders so that
+    their int64 sums cannot overflow, since the clock times of a few million
+    records already add up to centuries. Totals are given at nanosecond
+    resolution whenever they fit it, and at microsecond resolution otherwise.
+    NaT values are skipped.
+    """
+    ns_counts = timedeltas.view(np.int64).copy()
+    ns_counts[np.isnat(timedeltas)] = 0
+    
+    if operation == "subtr":
+        is_first = ~pd.Series(keys).duplicated().to_numpy()
+        ns_counts = np.where(is_first, ns_counts, -ns_counts)
+        
+    seconds, remainders = np.divmod(ns_counts, NS_PER_SECOND)
+    part_sums = pd.DataFrame({"seconds": seconds, "remainders": remainders}).groupby(keys).sum()
+    
+    extra_seconds, remainders = np.divmod(part_sums["remainders"].to_numpy(), NS_PER_SECOND)
+    seconds = part_sums["seconds"].to_numpy() + extra_seconds
+    
+    if (np.abs(seconds) < MAX_NS_TIMEDELTA_SECONDS).all():
+        totals = (seconds * NS_PER_SECOND + remainders).view("timedelta64[ns]")
+    else:
+        totals = seconds.astype("timedelta64[s]") + (remainders // 1000).astype("timedelta64[us]")
+    return pd.Series(totals, index=part_sums.index)
+
+
+def _to_datetime64_array(values, dt_fmt_str):
+    """
+    Convert an array of date/time strings or objects
+    to a datetime64 array in a single call.
+    The resolution is left as parsed, so that dates
+    outside the nanosecond range (e.g. year 1) are kept,
+    and time zone aware objects keep their wall time.
+    """
+    if values.dtype.kind == "M":
+        return values
+    
+    if values.dtype.kind in "US" or isinstance(values[0], str):
+        values = values.astype(str)
+        expanded_fmt_str = _expand_format_shorthands(dt_fmt_str)
+        
+        # Plain clock times are read by NumPy's ISO 8601 parser on the epoch day,
+        # which is several times faster than 'strptime'. That parser accepts
+        # any ISO clock time, so the strings must first follow the format exactly
+        if (expanded_fmt_str in CLOCK_TIME_LAYOUTS
+            and _follow_clock_layout(values, *CLOCK_TIME_LAYOUTS[expanded_fmt_str])):
+            try:
+                return np.strings.add(EPOCH_DATE_PREFIX, values).astype("datetime64[ns]")
+            except ValueError:
+                pass
+        parsed = parse_dt_string(values, expanded_fmt_str, module="pandas")
+    else:
+        try:
+            parsed = pd.to_datetime(values)
+        except ValueError:
+            # Objects in several time zones: take the wall time of each one
+            if getattr(values[0], "tzinfo", None) is None:
+                raise
+            parsed = pd.to_datetime([value.replace(tzinfo=None) for value in values])
+        if parsed.tz is not None:
+            parsed = parsed.tz_localize(None)
+    return np.asarray(parsed)
+
+
+def _follow_clock_layout(values, layout, max_fraction_digits):
+    """
+    Whether every string of a clock time array has the given layout,
+    'd' standing for a digit, followed by 1 to 'max_fraction_digits'
+    digits if that number is not 0.
+    """
+    n_fixed = len(layout)
+    width = n_fixed + max_fraction_digits
+    lengths = np.strings.str_len(values)
+    min_length = n_fixed + bool(max_fraction_digits)
+    if not ((lengths >= min_length) & (lengths <= width)).all():
+        return False
+    
+    # One row of character codes per string, padded with zeros
+    codes = values.astype(f"U{width}").view(np.uint32).reshape(-1, width)
+    is_digit = (codes >= ord("0")) & (codes <= ord("9"))
+    layout_codes = np.array([ord(char) for char in layout], dtype=np.uint32)
+    fixed_ok = np.where(layout_codes == ord("d"), is_digit[:, :n_fixed], codes[:, :n_fixed] == layout_codes)
+    fraction_ok = is_digit[:, n_fixed:] | (codes[:, n_fixed:] == 0)
+    return bool(fixed_ok.all() and fraction_ok.all())
+
+
+def _expand_format_shorthands(dt_fmt_str):
+    """
+    Expand the '%T' and '%F' shorthands, which 'strptime' does not accept.
+    """
+    if dt_fmt_str is None:
+        return None
+    for shorthand, expansion in FORMAT_SHORTHAND_DICT.items():
+        dt_fmt_str = dt_fmt_str.replace(shorthand, expansion)
+    return dt_fmt_str
+
+
 def extract_dt_part(datetime_obj, part="time", arg_list=None):
     """
     Return the time or date part of a datetime object.
@@ -219,14 +353,19 @@ def extract_dt_part(datetime_obj, part="time", arg_list=None):
 
 def dt_average(dt_obj_list, 
                time_fmt_str="%T",
-               output_format="standard"):
+               output_format="default"):
     """
     Calculate the average time from a list of time objects
     and format the output accordingly.
     
+    Times of day are averaged on the 24-hour circle (circular mean),
+    so that e.g. 23:00 and 01:00 average to midnight. The whole collection
+    is converted at once to seconds of the day, and the mean angle is the
+    arctangent of the mean sines and cosines.
+    
     Parameters
     ----------
-    dt_obj_list : list, tuple, or numpy.ndarray
+    dt_obj_list : list, tuple, numpy.ndarray or pandas.Series
         A collection of date and/or time objects or strings that follow 
         the format specified in 'time_fmt_str'.
     time_fmt_str : str, optional
@@ -236,37 +375,41 @@ def dt_average(dt_obj_list,
         specified by the given format string.
     output_format : str, optional
         The format of the output. Supported options:
-        - 'standard': Returns the total time as a pandas.Timedelta object (default).
-        - 'string': Returns the total time as a string.
-        - 'time_only': Returns the total time as a datetime.time object.
-        - 'tuple': Returns a tuple of (days, hours, minutes, seconds) from the total time.
+        - 'default': Returns the average time of day as a pandas.Timedelta
+          object since midnight (default).
+        - 'string': Returns the average time as a string.
+        - 'time_only': Returns the average time as a datetime.time object.
+        - 'tuple': Returns a tuple of (days, hours, minutes, seconds) from the average time.
     
     Returns
     -------
     object
-        The total time after performing the specified operation,
-        formatted based on 'output_format'.
+        The average time of day, formatted based on 'output_format'.
         
     Raises
     ------
     TypeError
-        If 'dt_obj_list' is not a list, tuple, or numpy.ndarray.
+        If 'dt_obj_list' is not a list, tuple, numpy.ndarray or pandas.Series.
     ValueError
         If 'dt_obj_list' contains fewer than 2 elements
         or if an unsupported output format is specified.
+        
+    See Also
+    --------
+    OnlineTimeOfDayMean : running version for streams and partial results.
     """    
     # Argument adecuacy controls #
     ##############################
 
     # Date and/or time list format control and its length #
     param_keys = get_caller_args()
-    obj_list_pos = find_substring_index("dt_obj_list")
+    obj_list_pos = param_keys.index("dt_obj_list")
     
     if isinstance(dt_obj_list, str):
         raise TypeError(f"Argument '{param_keys[obj_list_pos]}' "
                         f"(number {obj_list_pos}) must either be a "
-                        "list, tuple or numpy.ndarray.")
-    elif (isinstance(dt_obj_list, (list, tuple, np.ndarray)) and len(dt_obj_list) < 2):
+                        "list, tuple, numpy.ndarray or pandas.Series.")
+    elif (isinstance(dt_obj_list, ARRAY_LIKE_TYPES) and len(dt_obj_list) < 2):
         raise ValueError(f"Argument '{param_keys[obj_list_pos]}' "
                          "must contain at least two objects.")
         
@@ -277,7 +420,7 @@ def dt_average(dt_obj_list,
     # Program progression #
     #######################
         
-    angles = [_dt_to_radians(dt_obj, "datetime", time_fmt_str) for dt_obj in dt_obj_list]
+    angles = _dt_to_radians(dt_obj_list, time_fmt_str)
     avg_angle = _average_angle(angles)    
     time_average = _radians_to_time_of_day(avg_angle)
     
@@ -286,65 +429,164 @@ def dt_average(dt_obj_list,
     return time_average_formatted
 
 
+# Online accumulator #
+#-#-#-#-#-#-#-#-#-#-#-#
+
+class OnlineTimeOfDayMean:
+    """
+    Running circular mean of times of day.
+    
+    Only the sums of the sines and cosines of the time angles and the
+    number of times are kept, so the average can be updated batch by batch
+    over an unbounded stream. Accumulators filled separately (e.g. by
+    worker processes over chunks of the data) are combined with 'merge',
+    giving the same average as a single pass over all the data.
+    Instances hold plain numbers only, so they can be pickled.
+    
+    Parameters
+    ----------
+    time_fmt_str : str, optional
+        The format string of the time objects that are strings.
+        Default is "%T".
+    
+    Examples
+    --------
+    >>> acc = OnlineTimeOfDayMean().update(["22:00:00", "23:00:00"])
+    >>> other = OnlineTimeOfDayMean().update(["01:00:00", "02:00:00"])
+    >>> acc.merge(other).mean(output_format="string")
+    '0 days 00:00:00'
+    """
+    
+    def __init__(self, time_fmt_str="%T"):
+        self.time_fmt_str = time_fmt_str
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+        self.count = 0
+        
+    def __len__(self):
+        return self.count
+    
+    def __repr__(self):
+        return f"OnlineTimeOfDayMean(count={self.count})"
+        
+    def update(self, dt_objs):
+        """
+        Add a single time object or a collection of them to the running sums.
+        
+        Parameters
+        ----------
+        dt_objs : object | list | tuple | numpy.ndarray | pandas.Series
+            Time object(s), as accepted by 'dt_average'.
+            
+        Returns
+        -------
+        OnlineTimeOfDayMean
+            The accumulator itself, so that calls can be chained.
+        """
+        if not isinstance(dt_objs, ARRAY_LIKE_TYPES):
+            dt_objs = [dt_objs]
+        if len(dt_objs) == 0:
+            return self
+        
+        angles = _dt_to_radians(dt_objs, self.time_fmt_str)
+        self.sin_sum += float(np.sin(angles).sum())
+        self.cos_sum += float(np.cos(angles).sum())
+        self.count += len(angles)
+        return self
+        
+    def merge(self, other):
+        """
+        Combine the running sums of another accumulator into this one.
+        
+        Parameters
+        ----------
+        other : OnlineTimeOfDayMean
+            Accumulator filled with another part of the data.
+            
+        Returns
+        -------
+        OnlineTimeOfDayMean
+            The accumulator itself, so that calls can be chained.
+        """
+        if not isinstance(other, OnlineTimeOfDayMean):
+            raise TypeError("Only 'OnlineTimeOfDayMean' accumulators can be merged, "
+                            f"got '{get_type_str(other)}'.")
+        self.sin_sum += other.sin_sum
+        self.cos_sum += other.cos_sum
+        self.count += other.count
+        return self
+    
+    def mean_angle(self):
+        """
+        The average angle in radians on the 24-hour circle.
+        """
+        if self.count == 0:
+            raise ValueError("Cannot average an empty accumulator.")
+        return np.arctan2(self.sin_sum / self.count, self.cos_sum / self.count)
+        
+    def mean(self, output_format="default"):
+        """
+        The average time of day of all the times seen.
+        
+        Parameters
+        ----------
+        output_format : str, optional
+            The format of the output, as in 'dt_average'. Default is 'default'.
+            
+        Returns
+        -------
+        object
+            The average time of day, formatted based on 'output_format'.
+        """
+        arg_iterable_output_format = (output_format, TIME_OUTPUT_FORMAT_OPTIONS)
+        _validate_option(arg_iterable_output_format, ValueError, INVALID_OUTPUT_FORMAT_TEMPLATE)
+        
+        time_average = _radians_to_time_of_day(self.mean_angle())
+        return TIME_OUTPUT_FORMAT_DICT.get(output_format)(time_average)
+    
+
 # Auxiliary methods #
 #-#-#-#-#-#-#-#-#-#-#
 
-def _dt_to_radians(t, convert_to="datetime", time_fmt_str=None):
+def _dt_to_radians(dt_objs, time_fmt_str=None):
     """
-    Convert a time object to radians.
+    Convert a collection of time objects to radians.
     
     Parameters
     ----------
-    t : str, numpy.datetime64, time.struct_time, datetime.datetime, 
-        datetime.time, or pandas.Timestamp.
-        The input time object to be converted.
-    convert_to : str
-        The target type to convert `datetime_obj` to.
-        Accepted values depend on the input type, but as a first attempt,
-        default value 'datetime' has been established.
-        For example, if `datetime_obj` is a `datetime`, `convert_to` could be
-        `datetime64`, `Timestamp`, etc.
+    dt_objs : list | tuple | numpy.ndarray | pandas.Series
+        Strings, numpy.datetime64, datetime.datetime, datetime.time
+        or pandas.Timestamp objects to be converted.
     time_fmt_str : str
         The format string that specifies the format of the time objects. 
         This only affects objects that are strings.
         
     Returns
     -------
-    float
-        The angle in radians representing the input time on a 24-hour clock.
+    numpy.ndarray
+        The angles in radians representing the input times on a 24-hour clock.
     
     Note
     ----
     Radians are calculated using a 24-hour circle,
     starting at north (midnight) and moving clockwise.
     """
+    try:
+        timedeltas = _clock_times_to_timedelta64(dt_objs, time_fmt_str)
+    except Exception as e:
+        raise RuntimeError(f"Error during conversion of the times of day: {e}.")
     
-    if isinstance(t, str):
-        try:
-            dt_obj = parse_dt_string(t, dt_fmt_str=time_fmt_str, unit="s")
-        except Exception as e:
-            raise RuntimeError(f"Error during string time parse to a datetime object: {e}.")
-    else:
-        try:
-            dt_obj = datetime_obj_converter(t, convert_to)
-        except Exception as e:
-            obj_type = get_type_str(t)
-            convert_to = get_caller_args()[1]
-            raise RuntimeError("Error during parse of object type "
-                               f"'{obj_type}' to '{convert_to}': {e}.")
-    
-    seconds_from_midnight = \
-    datetime_obj_converter(extract_dt_part(dt_obj), "float")
-    radians = seconds_from_midnight / (24 * 60 * 60) * 2 * np.pi
+    seconds_from_midnight = timedeltas / np.timedelta64(1, "s")
+    radians = seconds_from_midnight / SECONDS_PER_DAY * 2 * np.pi
     return radians
 
 def _average_angle(angles):
     """
-    Calculate the average of a list of angles in RADIANS.
+    Calculate the average of an array of angles in RADIANS.
     
     Parameters
     ----------
-    angles : list[float]
+    angles : numpy.ndarray
         The angles in radians to average.
         
     Returns
@@ -352,12 +594,8 @@ def _average_angle(angles):
     float
         The average angle in radians.
     """
-    x_sum = np.sum([np.sin(x) for x in angles])
-    y_sum = np.sum([np.cos(x) for x in angles])
-    
-    x_mean = x_sum / len(angles)
-    y_mean = y_sum / len(angles)
-    
+    x_mean = np.sin(angles).mean()
+    y_mean = np.cos(angles).mean()
     return np.arctan2(x_mean, y_mean)  
  
 
@@ -372,10 +610,12 @@ def _radians_to_time_of_day(rads):
         
     Returns
     -------
-    datetime.time
-        The time of day corresponding to the input radians.
+    pandas.Timedelta
+        The time of day corresponding to the input radians,
+        as the time elapsed since midnight.
     """
-    seconds_from_midnight = rads / (2 * np.pi) * 24 * 60 * 60
+    # Angles west of north (negative) belong to the previous evening
+    seconds_from_midnight = (rads / (2 * np.pi) * SECONDS_PER_DAY) % SECONDS_PER_DAY
     
     # It cannot be considered the next second
     # until the decimal fraction equals to 1.
@@ -395,8 +635,7 @@ def _radians_to_time_of_day(rads):
     
     # If the seconds match the next day's midnight,
     # set the hour to zero instead of 24.
-    # Minutes and seconds are calculated on the 60th basis.
-    time_of_day = extract_dt_part(parse_float_dt(seconds_from_midnight_int))
+    time_of_day = pd.Timedelta(seconds=seconds_from_midnight_int % SECONDS_PER_DAY)
     return time_of_day
 
 #%%
@@ -410,16 +649,20 @@ def _radians_to_time_of_day(rads):
 def sum_date_objects(date_list,
                      operation="sum",
                      dt_fmt_str="%F",
-                     output_format="default"):
+                     output_format="default",
+                     by=None):
     """
     Calculate the sum or difference of a list of dates 
     and format the output accordingly.
+    
+    The dates are parsed at once and split into year, month and day
+    arrays; the calendar arithmetic is then applied to plain integers.
 
     Parameters
     ----------
-    date_list : list, tuple, or numpy.ndarray
-        A list, tuple, or numpy.ndarray containing date objects or strings 
-        that follow the format specified in 'time_fmt_str'.
+    date_list : list, tuple, numpy.ndarray or pandas.Series
+        A collection of date objects or strings 
+        that follow the format specified in 'dt_fmt_str'.
     operation : str, optional
         The operation to perform on the dates. Supported operations 
         are "sum" (default) and "subtr" for subtraction.
@@ -431,17 +674,21 @@ def sum_date_objects(date_list,
         - 'default': Returns the total date as a datetime.date object (default).
         - 'string': Returns the total date as a string in the format specified by 'time_fmt_str'.
         - 'tuple': Returns a tuple of (year, month, day) from the total date.
+    by : array-like, optional
+        Group keys, one per date. If given, the operation is performed
+        within each group, in order of appearance.
 
     Returns
     -------
-    object
+    object | pandas.Series
         The total date after performing the specified operation, 
         formatted based on 'output_format'.
+        If 'by' is given, a Series of totals indexed by the group keys.
 
     Raises
     ------
     TypeError
-        If 'date_list' is not a list, tuple, or numpy.ndarray.
+        If 'date_list' is not a list, tuple, numpy.ndarray or pandas.Series.
     ValueError
         If 'date_list' contains fewer than 2 elements or if an unsupported 
         operation or output format is specified.
@@ -457,8 +704,8 @@ def sum_date_objects(date_list,
     if isinstance(date_list, str):
         raise TypeError(f"Argument '{param_keys[date_list_pos]}' "
                         f"(number {date_list_pos}) must either be a "
-                        "list, tuple or numpy.ndarray.")
-    elif (isinstance(date_list, (list, tuple, np.ndarray)) and len(date_list) < 2):
+                        "list, tuple, numpy.ndarray or pandas.Series.")
+    elif (isinstance(date_list, ARRAY_LIKE_TYPES) and len(date_list) < 2):
         raise ValueError(format_string(TOO_FEW_ARG_ERROR_TEMPLATE, "time"))
     
     # Operation argument control #
@@ -466,22 +713,44 @@ def sum_date_objects(date_list,
     _validate_option(format_args_math_op, ValueError, INVALID_MATH_OPERATION_ERROR)
         
     # Output format parameter control #
-    arg_iterable_output_format = (output_format, TIME_OUTPUT_FORMAT_OPTIONS)
+    arg_iterable_output_format = (output_format, DATE_OUTPUT_FORMAT_OPTIONS)
     _validate_option(arg_iterable_output_format, ValueError, INVALID_OUTPUT_FORMAT_TEMPLATE)
     
     # Program progression #
     #######################
-   
-    # Perform the aritmethical operations #
-    total_date = parse_dt_string(date_list[0], dt_fmt_str)
-    for obj in date_list[1:]:
-        date_obj = extract_dt_part(obj, part="date")
-        total_date = _add_dates_with_year_gap(total_date, date_obj, operation=operation)
+    
+    # Year, month and day arrays of all dates #
+    dates = pd.DatetimeIndex(_to_datetime64_array(np.asarray(date_list), dt_fmt_str))
+    years, months, days = dates.year.to_numpy(), dates.month.to_numpy(), dates.day.to_numpy()
+    format_total = DATE_OUTPUT_FORMAT_DICT.get(output_format)
+    
+    # Perform the aritmethical operations, within groups if requested #
+    if by is not None:
+        group_indices = pd.Series(np.asarray(by)).groupby(np.asarray(by), sort=True).indices
+        total_dates = {
+            key : format_total(_reduce_date_parts(years[idx], months[idx], days[idx], operation))
+            for key, idx in group_indices.items()
+        }
+        return pd.Series(total_dates)
+    
+    total_date = _reduce_date_parts(years, months, days, operation)
     
     # Return the result in the specified output format #
-    total_date_formatted = DATE_OUTPUT_FORMAT_DICT.get(output_format)(total_date)
+    total_date_formatted = format_total(total_date)
     return total_date_formatted
         
+
+def _reduce_date_parts(years, months, days, operation):
+    """
+    Sum or subtract, in order, the dates given by their year, month and day arrays.
+    """
+    year, month, day = int(years[0]), int(months[0]), int(days[0])
+    for year2, month2, day2 in zip(years[1:].tolist(), months[1:].tolist(), days[1:].tolist()):
+        year, month, day = _add_date_parts_with_year_gap((year, month, day),
+                                                         (year2, month2, day2),
+                                                         operation)
+    return datetime.date(year, month, day)
+        
         
 def return_date_part(datetime_obj, arg_list=None):
     """
@@ -535,9 +804,23 @@ def _add_dates_with_year_gap(date1, date2, operation):
     and handles overflow/underflow of months and days when necessary.
     """
     
+    date_parts = _add_date_parts_with_year_gap((date1.year, date1.month, date1.day),
+                                               (date2.year, date2.month, date2.day),
+                                               operation)
+    return datetime.date(*date_parts)
+
+
+def _add_date_parts_with_year_gap(date_parts1, date_parts2, operation):
+    """
+    Core of '_add_dates_with_year_gap' working on (year, month, day) tuples,
+    so that long runs of dates can be reduced without building date objects.
+    Days falling outside the resulting month are clamped
+    to its first or last day.
+    """
+    
     # Extract year, month, and day from both dates
-    year1, month1, day1 = date1.year, date1.month, date1.day
-    year2, month2, day2 = date2.year, date2.month, date2.day
+    year1, month1, day1 = date_parts1
+    year2, month2, day2 = date_parts2
 
     # Calculate the gap in years
     year_gap = abs(year2 - year1)
@@ -554,15 +837,9 @@ def _add_dates_with_year_gap(date1, date2, operation):
         while new_month > 12:
             new_month -= 12
             year_gap += 1
-    
-        # Create a dummy date to handle day overflow
-        while True:
-            try:
-                result_date = datetime.date(year1 + year_gap, new_month, new_day)
-                break
-            except ValueError:
-                new_day -= 1
-                
+            
+        new_year = year1 + year_gap
+        new_day = min(new_day, monthrange(new_year, new_month)[1])
                 
     elif operation == "subtr":
         # Subtract the months and days
@@ -573,16 +850,11 @@ def _add_dates_with_year_gap(date1, date2, operation):
         while new_month < 1:
             new_month += 12
             year_gap += 1
-    
-        # Create a dummy date to handle day underflow
-        while True:
-            try:
-                result_date = datetime.date(year1 - year_gap, new_month, new_day)
-                break
-            except ValueError:
-                new_day += 1
+            
+        new_year = year1 - year_gap
+        new_day = min(max(new_day, 1), monthrange(new_year, new_month)[1])
 
-    return result_date
+    return new_year, new_month, new_day
 
 
 # Natural years #
@@ -651,8 +923,8 @@ def natural_year(dt_start, dt_end, dt_fmt_str=None,
     # Convert input objects to datetime objects #
     #############################################
     
-    dt_start_std = datetime_obj_converter(dt_start, method, dt_fmt_str=dt_fmt_str)
-    dt_end_std = datetime_obj_converter(dt_end, method, dt_fmt_str=dt_fmt_str)       
+    dt_start_std = dt_obj_converter(dt_start, method, dt_fmt_str=dt_fmt_str)
+    dt_end_std = dt_obj_converter(dt_end, method, dt_fmt_str=dt_fmt_str)       
 
     # Check if there is at least a whole year gap between the two objects #  
     #######################################################################
@@ -738,6 +1010,14 @@ ERROR_CLASS_LIST = [TypeError, ValueError]
 # Abbreviated mathematical operations #
 BASIC_MATH_OPT_LIST = ["sum", "subtr"]
 
+# Accepted collections of date/time objects #
+ARRAY_LIKE_TYPES = (list, tuple, np.ndarray, pd.Series)
+
+# Nanosecond-resolution duration bounds #
+SECONDS_PER_DAY = 86_400
+NS_PER_SECOND = 1_000_000_000
+MAX_NS_TIMEDELTA_SECONDS = np.iinfo(np.int64).max // NS_PER_SECOND
+
 # Time object output formatting options #
 TIME_OUTPUT_FORMAT_OPTIONS = ["default", "string", "time_only", "tuple"]
 DATE_OUTPUT_FORMAT_OPTIONS = \
@@ -783,22 +1063,31 @@ v
 {dt_start_natural} -- {dt_end_natural}
 """
 
-# Switch case dictionaries #
-#--------------------------#
+# Clock time formats readable as ISO 8601 once a date is prepended #
+CLOCK_TIME_LAYOUTS = {
+    "%H:%M" : ("dd:dd", 0),
+    "%H:%M:%S" : ("dd:dd:dd", 0),
+    "%H:%M:%S.%f" : ("dd:dd:dd.", 6)
+}
+EPOCH_DATE_PREFIX = "1970-01-01T"
 
-OPERATION_DICT = {
-    BASIC_MATH_OPT_LIST[0] : np.sum,
-    BASIC_MATH_OPT_LIST[1] : lambda tds: tds[0] - np.sum(tds[1:])
+# Format string shorthands not understood by 'strptime' #
+FORMAT_SHORTHAND_DICT = {
+    "%T" : "%H:%M:%S",
+    "%F" : "%Y-%m-%d"
 }
 
+# Switch case dictionaries #
+#--------------------------#
+
 TIME_OUTPUT_FORMAT_DICT = {
     TIME_OUTPUT_FORMAT_OPTIONS[0] : lambda t_obj: t_obj,
     TIME_OUTPUT_FORMAT_OPTIONS[1] : lambda t_obj: str(t_obj),
-    TIME_OUTPUT_FORMAT_OPTIONS[2] : lambda t_obj: t_obj.time(),
-    TIME_OUTPUT_FORMAT_OPTIONS[3] : lambda t_obj: (t_obj.days,
-                                                   t_obj.hours, 
-                                                   t_obj.minutes, 
-                                                   t_obj.seconds)
+    TIME_OUTPUT_FORMAT_OPTIONS[2] : lambda t_obj: (datetime.datetime.min + t_obj.to_pytimedelta()).time(),
+    TIME_OUTPUT_FORMAT_OPTIONS[3] : lambda t_obj: (t_obj.components.days,
+                                                   t_obj.components.hours, 
+                                                   t_obj.components.minutes, 
+                                                   t_obj.components.seconds)
 }
 
 DATE_OUTPUT_FORMAT_DICT = {
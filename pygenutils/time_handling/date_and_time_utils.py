@@ -22,7 +22,8 @@ import pandas as pd
 #------------------------#
 
 from filewise.general.introspection_utils import get_caller_args, get_type_str
-from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils._type_dispatch import type_key
+from pygenutils.arrays_and_lists.data_manipulation import normalise_flat_list
 from pygenutils.strings.string_handler import find_substring_index
 from pygenutils.strings.text_formatters import format_string, print_format_string
 from pygenutils.time_handling.time_utils import datetime_obj_converter
@@ -40,11 +41,10 @@ def _is_xarray_dataset_or_dataarray(obj):
     Return True if *obj* is an xarray Dataset or DataArray without importing xarray.
 
     Used so this module can be imported without loading xarray unless a caller
-    passes xarray objects or NetCDF paths into the helpers that need it.
+    passes xarray objects or NetCDF paths into the helpers that need it;
+    xarray types are registered lazily in the type keys.
     """
-    cls = type(obj)
-    mod = getattr(cls, "__module__", "") or ""
-    return mod.startswith("xarray.") and cls.__name__ in ("Dataset", "DataArray")
+    return type_key(obj) in ("dataset", "dataarray")
 
 
 #------------------#
@@ -228,7 +228,7 @@ def find_dt_key(data):
         return any(name_lower.startswith(prefix.lower()) for prefix in time_keywords['prefix'])
     
     # Handle pandas DataFrame
-    obj_type = get_type_str(data, lowercase=True)
+    obj_type = type_key(data)
     if obj_type == "dataframe":
         # Try exact matches first
         df_cols = data.columns.tolist()
@@ -507,7 +507,7 @@ def infer_frequency(data):
     """
     # Check input data type #
     #########################
-    obj_type = get_type_str(data, lowercase=True)
+    obj_type = type_key(data)
     
     # Section 1: Handling Pandas DataFrame, Series, DatetimeIndex, or TimedeltaIndex #
     ##################################################################################
@@ -581,7 +581,7 @@ def infer_dt_range(data):
       (requires ``pip install 'pygenutils[climate]'``); xarray is not loaded at module import time.
     """
     # Check input data type #
-    obj_type = get_type_str(data, lowercase=True)
+    obj_type = type_key(data)
     
     # Section 1: Handling Pandas DataFrame or Series
     if obj_type in ["dataframe", "series"]:
@@ -669,9 +669,8 @@ def get_obj_operation_datetime(obj_list,
         obj_list = [obj_list]
     
     # Handle nested lists by flattening them first
-    elif isinstance(obj_list, list):
-        if any(isinstance(item, list) for item in obj_list):
-            obj_list = flatten_list(obj_list)
+    else:
+        obj_list = normalise_flat_list(obj_list)
     
     # Retrieve operation times #
     obj_timestamp_container = []
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in instrumentation of the public pygenutils functions.
+
+Once enabled, every public function of the pygenutils subpackages is
+replaced, in its module and in every pygenutils module that imported it,
+by a wrapper recording its call count, cumulative and self wall time,
+input size (length or size of the first argument, when it has one) and
+raised exceptions, together with the self time of each call stack.
+Nothing is wrapped until then, so the disabled mode costs nothing.
+
+It is enabled either by calling 'enable_instrumentation' or by setting the
+PYGENUTILS_INSTRUMENT environment variable to 1 (or to a comma-separated
+list of subpackages) before pygenutils is imported. If
+PYGENUTILS_INSTRUMENT_DIR is also set, every process writes its profile
+there on exit, as 'pygenutils_profile_<pid>.json' and '.folded' files;
+since the environment is inherited, this covers subprocesses and
+multiprocessing workers too (as long as they exit normally: workers
+killed by 'Pool.terminate' write nothing), and 'load_call_profiles'
+merges the files.
+
+Call stacks are local to each thread or asyncio task.
+"""
+
+#----------------#
+# Import modules #
+#----------------#
+
+import ast
+import atexit
+from contextvars import ContextVar
+from functools import wraps
+import importlib.util
+from inspect import iscoroutinefunction, isfunction
+import json
+import multiprocessing.util
+import os
+import pkgutil
+import sys
+import threading
+import time
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+import pygenutils
+from pygenutils.time_handling.program_snippet_exec_timers import TIMER_UNIT_FACTORS
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Call registry #
+#---------------#
+
+class CallRegistry:
+    """
+    In-process registry of the calls made to instrumented functions.
+
+    For every function, the number of calls, the cumulative time (counted
+    once for recursive calls), the self time (excluding the instrumented
+    functions it called), the input sizes and the exceptions raised by type
+    are kept, as well as the self time of every distinct call stack.
+    Times are stored in nanoseconds, so that registries from several
+    processes can be merged exactly.
+    """
+
+    def __init__(self):
+        self._functions = {}
+        self._stacks = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"CallRegistry(functions={len(self._functions)}, stacks={len(self._stacks)})"
+
+    def record(self, path, elapsed_ns, self_ns, size=None, exception=None):
+        """
+        Add a call of the function 'path[-1]', made through the call
+        stack 'path' (a tuple of function names).
+        """
+        name = path[-1]
+        with self._lock:
+            stats = self._functions.get(name)
+            if stats is None:
+                stats = self._functions[name] = _CallStats()
+            stats.calls += 1
+            stats.self_ns += self_ns
+            if name not in path[:-1]:
+                stats.cumulative_ns += elapsed_ns
+            if size is not None:
+                stats.sized_calls += 1
+                stats.size_total += size
+                stats.size_max = max(stats.size_max, size)
+            if exception is not None:
+                stats.exceptions[exception] = stats.exceptions.get(exception, 0) + 1
+            self._stacks[path] = self._stacks.get(path, 0) + self_ns
+
+    def reset(self):
+        """
+        Discard all the recorded calls.
+        """
+        with self._lock:
+            self._functions.clear()
+            self._stacks.clear()
+
+    def _reset_after_fork(self):
+        # The lock may have been held by another thread of the parent
+        self._lock = threading.Lock()
+        self._functions.clear()
+        self._stacks.clear()
+
+    def stats(self, unit="ms"):
+        """
+        Aggregated statistics per function, by decreasing self time.
+
+        Parameters
+        ----------
+        unit : {"ns", "us", "ms", "s"}, optional
+            Time unit of the results. Default is "ms".
+
+        Returns
+        -------
+        dict
+            Mapping of each function name to a dictionary with the number
+            of calls, cumulative and self times, mean and maximum input
+            sizes (None if no input had a size) and exception counts.
+        """
+        if unit not in TIMER_UNIT_FACTORS:
+            raise ValueError(f"Time unit '{unit}' not supported for this operation. "
+                             f"Choose one from {list(TIMER_UNIT_FACTORS)}.")
+        factor = TIMER_UNIT_FACTORS[unit]
+
+        with self._lock:
+            snapshot = [(name, stats.to_dict()) for name, stats in self._functions.items()]
+
+        stats_dict = {}
+        for name, stats in sorted(snapshot, key=lambda item: -item[1]["self_ns"]):
+            stats_dict[name] = dict(
+                calls=stats["calls"],
+                cumulative=stats["cumulative_ns"] / factor,
+                self=stats["self_ns"] / factor,
+                mean_size=(stats["size_total"] / stats["sized_calls"]
+                           if stats["sized_calls"] else None),
+                max_size=stats["size_max"] if stats["sized_calls"] else None,
+                exceptions=stats["exceptions"]
+            )
+        return stats_dict
+
+    def report(self, unit="ms", limit=None):
+        """
+        Table of the function statistics, by decreasing self time.
+
+        Parameters
+        ----------
+        unit : {"ns", "us", "ms", "s"}, optional
+            Time unit of the table. Default is "ms".
+        limit : int, optional
+            Maximum number of functions shown. All of them by default.
+
+        Returns
+        -------
+        str
+            The formatted table.
+        """
+        stats_items = list(self.stats(unit).items())[:limit]
+        name_width = max([len("function")] + [len(name) for name, _ in stats_items])
+        lines = [f"{'function':<{name_width}}{'calls':>10}{'cumulative':>14}{'self':>14}"
+                 f"{'mean size':>12}{'errors':>8}  ({unit})"]
+        for name, stats in stats_items:
+            mean_size = "" if stats["mean_size"] is None else f"{stats['mean_size']:.4g}"
+            lines.append(f"{name:<{name_width}}{stats['calls']:>10d}{stats['cumulative']:>14.4g}"
+                         f"{stats['self']:>14.4g}{mean_size:>12}"
+                         f"{sum(stats['exceptions'].values()):>8d}")
+        return "\n".join(lines)
+
+    def to_dict(self):
+        """
+        Raw content of the registry, in nanoseconds, as saved by 'dump_json'.
+        """
+        with self._lock:
+            return dict(
+                pid=os.getpid(),
+                functions={name: stats.to_dict() for name, stats in self._functions.items()},
+                stacks={";".join(path): self_ns for path, self_ns in self._stacks.items()}
+            )
+
+    def merge(self, registry_dict):
+        """
+        Add the content of another registry, e.g. one loaded from the
+        JSON file of another process.
+        """
+        with self._lock:
+            for name, stats in registry_dict["functions"].items():
+                own_stats = self._functions.get(name)
+                if own_stats is None:
+                    own_stats = self._functions[name] = _CallStats()
+                own_stats.add_dict(stats)
+            for path, self_ns in registry_dict["stacks"].items():
+                path = tuple(path.split(";"))
+                self._stacks[path] = self._stacks.get(path, 0) + self_ns
+
+    def dump_json(self, path):
+        """
+        Write the registry to a JSON file.
+        """
+        with open(path, "w") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
+
+    def dump_collapsed(self, path):
+        """
+        Write the self time of every call stack, in microseconds, in the
+        collapsed-stack format read by flame graph tools
+        ('outer;inner <microseconds>' lines).
+        """
+        with self._lock:
+            stacks = sorted(self._stacks.items())
+        with open(path, "w") as collapsed_file:
+            for stack, self_ns in stacks:
+                self_us = self_ns // 1000
+                if self_us:
+                    collapsed_file.write(f"{';'.join(stack)} {self_us}\n")
+
+
+class _CallStats:
+    """
+    Call count, times, input sizes and exceptions of one function.
+    """
+
+    __slots__ = ("calls", "cumulative_ns", "self_ns",
+                 "sized_calls", "size_total", "size_max", "exceptions")
+
+    def __init__(self):
+        self.calls = 0
+        self.cumulative_ns = 0
+        self.self_ns = 0
+        self.sized_calls = 0
+        self.size_total = 0
+        self.size_max = 0
+        self.exceptions = {}
+
+    def to_dict(self):
+        stats_dict = {attr: getattr(self, attr) for attr in self.__slots__}
+        stats_dict["exceptions"] = self.exceptions.copy()
+        return stats_dict
+
+    def add_dict(self, stats_dict):
+        for attr in ("calls", "cumulative_ns", "self_ns", "sized_calls", "size_total"):
+            setattr(self, attr, getattr(self, attr) + stats_dict[attr])
+        self.size_max = max(self.size_max, stats_dict["size_max"])
+        for exception, count in stats_dict["exceptions"].items():
+            self.exceptions[exception] = self.exceptions.get(exception, 0) + count
+
+
+def load_call_profiles(paths):
+    """
+    Merge the JSON profiles written by several processes into one registry.
+
+    Parameters
+    ----------
+    paths : str | list[str]
+        JSON files written by 'CallRegistry.dump_json', or a directory
+        whose 'pygenutils_profile_*.json' files are all read.
+
+    Returns
+    -------
+    CallRegistry
+        The merged registry.
+    """
+    if isinstance(paths, str):
+        if os.path.isdir(paths):
+            paths = [os.path.join(paths, file_name) for file_name in sorted(os.listdir(paths))
+                     if file_name.startswith(PROFILE_FILE_PREFIX) and file_name.endswith(".json")]
+        else:
+            paths = [paths]
+
+    registry = CallRegistry()
+    for path in paths:
+        with open(path) as json_file:
+            registry.merge(json.load(json_file))
+    return registry
+
+# Function wrappers #
+#-------------------#
+
+def _input_size(args):
+    """
+    Length or size of the first positional argument, None if it has none.
+    """
+    if not args:
+        return None
+    obj = args[0]
+    size = getattr(obj, "size", None)
+    if isinstance(size, int):
+        return size
+    try:
+        return len(obj)
+    except TypeError:
+        return None
+
+
+def _instrument(func, name, registry):
+    """
+    Wrap a function so that every call is recorded in 'registry' under 'name'.
+    """
+    def enter():
+        stack = _CALL_STACK.get()
+        path = (stack[-1][0] if stack else ()) + (name,)
+        frame = [path, 0]
+        token = _CALL_STACK.set(stack + (frame,))
+        return frame, stack, token
+
+    def leave(frame, stack, token, ti, size, exception):
+        elapsed_ns = time.perf_counter_ns() - ti
+        _CALL_STACK.reset(token)
+        if stack:
+            stack[-1][1] += elapsed_ns
+        registry.record(frame[0], elapsed_ns, elapsed_ns - frame[1], size, exception)
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_instrumented(*args, **kwargs):
+            frame, stack, token = enter()
+            exception = None
+            ti = time.perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as exc:
+                exception = type(exc).__name__
+                raise
+            finally:
+                leave(frame, stack, token, ti, _input_size(args), exception)
+        async_instrumented.__instrumented__ = func
+        return async_instrumented
+
+    @wraps(func)
+    def instrumented(*args, **kwargs):
+        frame, stack, token = enter()
+        exception = None
+        ti = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        except BaseException as exc:
+            exception = type(exc).__name__
+            raise
+        finally:
+            leave(frame, stack, token, ti, _input_size(args), exception)
+    instrumented.__instrumented__ = func
+    return instrumented
+
+# Switches #
+#----------#
+
+def _is_script(module_name):
+    """
+    Whether a module runs a program when imported, i.e. it has top-level
+    function calls (possibly inside a try block), as the interactive
+    scripts of some subpackages do. Such modules are not instrumented.
+    """
+    with open(importlib.util.find_spec(module_name).origin) as module_file:
+        tree = ast.parse(module_file.read())
+        
+    statements = []
+    for node in tree.body:
+        statements += node.body if isinstance(node, ast.Try) else [node]
+    return any(isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+               for node in statements)
+
+
+def enable_instrumentation(subpackages=None, registry=None):
+    """
+    Wrap the public functions of the pygenutils subpackages.
+
+    Every module of the selected subpackages is imported, and each public
+    function it defines is replaced by an instrumented wrapper, both in its
+    own module and in every imported pygenutils module holding a reference
+    to it. References taken beforehand from outside pygenutils
+    ('from pygenutils... import f' in user code) keep pointing to the plain
+    functions, so instrumentation is best enabled before such imports,
+    e.g. through the PYGENUTILS_INSTRUMENT environment variable.
+
+    Modules whose optional dependencies are missing are skipped, as well
+    as the modules that run a program when imported.
+
+    Parameters
+    ----------
+    subpackages : list[str], optional
+        Subpackages to instrument. All of them by default.
+    registry : CallRegistry, optional
+        Registry receiving the calls. Default is DEFAULT_CALL_REGISTRY.
+
+    Returns
+    -------
+    list[str]
+        Names of the modules that could not be imported.
+
+    Raises
+    ------
+    RuntimeError
+        If the instrumentation is already enabled.
+    """
+    if _INSTRUMENTED_FUNCTIONS:
+        raise RuntimeError("Instrumentation is already enabled; disable it first.")
+    if registry is None:
+        registry = DEFAULT_CALL_REGISTRY
+    if subpackages is None:
+        subpackages = pygenutils.__all__
+
+    skipped_modules = []
+    for subpackage in subpackages:
+        package = importlib.import_module(f"pygenutils.{subpackage}")
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+            module_name = module_info.name
+            if (module_name == __name__
+                or module_name.rsplit(".", 1)[-1].startswith("_")
+                or _is_script(module_name)):
+                continue
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                skipped_modules.append(module_name)
+                continue
+
+            for attr_name, obj in list(vars(module).items()):
+                if (not attr_name.startswith("_")
+                    and isfunction(obj)
+                    and obj.__module__ == module_name
+                    and id(obj) not in _INSTRUMENTED_FUNCTIONS):
+                    qualified_name = f"{module_name}.{obj.__qualname__}"
+                    _INSTRUMENTED_FUNCTIONS[id(obj)] = (obj, _instrument(obj, qualified_name, registry))
+
+    # Replace the functions wherever pygenutils imported them
+    for module in list(sys.modules.values()):
+        if getattr(module, "__name__", "").startswith("pygenutils.") and module.__name__ != __name__:
+            module_dict = vars(module)
+            for attr_name, obj in list(module_dict.items()):
+                replacement = _INSTRUMENTED_FUNCTIONS.get(id(obj))
+                if replacement is not None and replacement[0] is obj:
+                    module_dict[attr_name] = replacement[1]
+                    _PATCHED_ATTRIBUTES.append((module_dict, attr_name, obj))
+    return skipped_modules
+
+
+def disable_instrumentation():
+    """
+    Restore the plain functions replaced by 'enable_instrumentation'.
+    The recorded calls are kept in the registry.
+    """
+    for module_dict, attr_name, func in reversed(_PATCHED_ATTRIBUTES):
+        module_dict[attr_name] = func
+    _PATCHED_ATTRIBUTES.clear()
+    _INSTRUMENTED_FUNCTIONS.clear()
+
+
+def is_instrumentation_enabled():
+    """
+    Whether the pygenutils functions are currently instrumented.
+    """
+    return bool(_INSTRUMENTED_FUNCTIONS)
+
+# Environment variable set-up and per-process dumps #
+#---------------------------------------------------#
+
+def _enable_from_environment():
+    """
+    Enable the instrumentation as requested by the PYGENUTILS_INSTRUMENT
+    and PYGENUTILS_INSTRUMENT_DIR environment variables.
+    """
+    instrument = os.environ.get(INSTRUMENT_ENV_VAR, "").strip()
+    if instrument.lower() in ("", "0", "false", "no", "off") or is_instrumentation_enabled():
+        return
+
+    subpackages = None
+    if instrument.lower() not in ("1", "true", "yes", "on", "all"):
+        subpackages = [subpackage.strip() for subpackage in instrument.split(",")]
+    enable_instrumentation(subpackages)
+
+    output_dir = os.environ.get(INSTRUMENT_DIR_ENV_VAR)
+    if output_dir:
+        _register_exit_dump(output_dir)
+
+
+def _register_exit_dump(output_dir):
+    """
+    Have the current process and its children write their profiles to
+    'output_dir' on exit.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    atexit.register(_dump_profile, output_dir)
+
+    # Children forked with os.fork start from an empty registry and exit through atexit
+    os.register_at_fork(after_in_child=DEFAULT_CALL_REGISTRY._reset_after_fork)
+
+    # multiprocessing workers leave through os._exit, skipping atexit,
+    # but run the multiprocessing finalisers
+    multiprocessing.util.register_after_fork(
+        DEFAULT_CALL_REGISTRY,
+        lambda registry: multiprocessing.util.Finalize(None, _dump_profile,
+                                                       args=(output_dir,), exitpriority=0)
+        )
+
+
+def _dump_profile(output_dir):
+    """
+    Write the default registry to the JSON and collapsed-stack files
+    of the current process, once per process.
+    """
+    global _DUMPED_PID
+    pid = os.getpid()
+    if _DUMPED_PID == pid:
+        return
+    _DUMPED_PID = pid
+
+    path_noext = os.path.join(output_dir, f"{PROFILE_FILE_PREFIX}{pid}")
+    DEFAULT_CALL_REGISTRY.dump_json(f"{path_noext}.json")
+    DEFAULT_CALL_REGISTRY.dump_collapsed(f"{path_noext}.folded")
+
+#%%
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Environment variables #
+INSTRUMENT_ENV_VAR = "PYGENUTILS_INSTRUMENT"
+INSTRUMENT_DIR_ENV_VAR = "PYGENUTILS_INSTRUMENT_DIR"
+
+# File name prefix of the per-process profiles #
+PROFILE_FILE_PREFIX = "pygenutils_profile_"
+
+# Instrumentation state #
+#-----------------------#
+
+# Registry receiving the calls unless another one is given #
+DEFAULT_CALL_REGISTRY = CallRegistry()
+
+# Open instrumented calls, per thread or asyncio task: [path, child time] frames #
+_CALL_STACK = ContextVar("instrumented_call_stack", default=())
+
+# Original and instrumented function per original function id #
+_INSTRUMENTED_FUNCTIONS = {}
+
+# (module namespace, attribute name, original function) of every replacement #
+_PATCHED_ATTRIBUTES = []
+
+# Process whose profile has already been written at exit #
+_DUMPED_PID = None
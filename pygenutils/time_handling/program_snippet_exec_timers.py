@@ -5,11 +5,20 @@
 # Import modules #
 #----------------#
 
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+import gc
+from inspect import iscoroutinefunction
+import json
 import os
+import platform
+from random import random
+import threading
 import time
 import timeit
 
-from numpy import round as np_round
+from numpy import array, percentile, round as np_round
 
 #------------------------#
 # Import project modules #
@@ -78,6 +87,11 @@ def program_exec_timer(mode, module="time", frac_precision=3):
     """
     General purpose method that measures and returns the execution time
     of a code snippet based on the specified module.
+    
+    Start times are kept in a stack local to the current thread or
+    asyncio task, so timings can be nested (each "stop" closes the latest
+    "start") and run concurrently without overwriting each other.
+    For named timers with aggregated statistics, see 'TimerRegistry'.
 
     Parameters
     ----------
@@ -97,9 +111,9 @@ def program_exec_timer(mode, module="time", frac_precision=3):
     ------
     ValueError
         If the specified module is not supported or if the mode is invalid.
+    RuntimeError
+        If the timer is stopped without having been started.
     """
-
-    global ti
    
     # Input validations #
     #-#-#-#-#-#-#-#-#-#-#
@@ -115,9 +129,16 @@ def program_exec_timer(mode, module="time", frac_precision=3):
     
     if mode == "start":
         ti = MODULE_OPERATION_DICT[module]()
+        _PROGRAM_TIMER_STARTS.set(_PROGRAM_TIMER_STARTS.get() + (ti,))
         
     elif mode == "stop":
         tf = MODULE_OPERATION_DICT[module]()
+        start_times = _PROGRAM_TIMER_STARTS.get()
+        if not start_times:
+            raise RuntimeError("Timer stopped without having been started.")
+        
+        *start_times, ti = start_times
+        _PROGRAM_TIMER_STARTS.set(tuple(start_times))
         elapsed_time = abs(ti - tf)
        
         elapsed_time_kwargs = dict(
@@ -137,7 +158,43 @@ def snippet_exec_timer(snippet_str,
                        trials=int(1e4), 
                        decimal_places=None,
                        format_time_str=False,
-                       return_best_time=False):
+                       return_best_time=False,
+                       setup="pass",
+                       globals=None):
+    """
+    Print the execution time of a code snippet over a number of trials,
+    optionally repeated several times.
+    
+    Parameters
+    ----------
+    snippet_str : str | callable
+        The code snippet (or callable) to time.
+    repeats : int | None, optional
+        Number of times the trials are repeated. Default is None (no repeats).
+    trials : int, optional
+        Number of executions of the snippet per measurement. Default is 10 000.
+    decimal_places : int | None, optional
+        Decimal places to round the times to. Default is None (no rounding).
+    format_time_str : bool, optional
+        Whether to format the times as elapsed time strings. Default is False.
+    return_best_time : bool, optional
+        Whether to also print the best time out of the repeats. Default is False.
+    setup : str | callable, optional
+        Code executed once before each measurement, which is not timed.
+        Default is "pass".
+    globals : dict | None, optional
+        Namespace in which the snippet and setup are executed.
+        Default is None, meaning an empty namespace.
+        
+    Raises
+    ------
+    TypeError
+        If 'decimal_places' is neither an integer nor None.
+        
+    See Also
+    --------
+    benchmark : statistical benchmark harness returning machine-readable results.
+    """
         
     # Decimal places validation #
     #-#-#-#-#-#-#-#-#-#-#-#-#-#-#
@@ -145,7 +202,7 @@ def snippet_exec_timer(snippet_str,
     param_keys = get_caller_args()
     decimal_places_arg_pos = find_substring_index(param_keys, "decimal_places")
     
-    if not isinstance(decimal_places, int):
+    if decimal_places is not None and not isinstance(decimal_places, int):
         raise TypeError(format_string(TYPE_ERROR_TEMPLATE, f'{param_keys[decimal_places_arg_pos]}'))
     
     # Set keyword argument dictionary for float time parsing #
@@ -161,9 +218,10 @@ def snippet_exec_timer(snippet_str,
     #-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-
 
     if repeats is None:
-        exec_time_norep = timeit.timeit(setup=snippet_str,
+        exec_time_norep = timeit.timeit(snippet_str,
+                                        setup=setup,
                                         number=trials,
-                                        globals=globals())
+                                        globals=globals)
         """
         Equivalent to the following
         ---------------------------
@@ -187,10 +245,11 @@ def snippet_exec_timer(snippet_str,
     #-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-#-
 
     else:
-        exec_time_rep = timeit.repeat(setup=snippet_str, 
+        exec_time_rep = timeit.repeat(snippet_str, 
+                                      setup=setup,
                                       repeat=repeats,
                                       number=trials,
-                                      globals=globals())
+                                      globals=globals)
         
         if decimal_places is not None:
             exec_time_rep = np_round(exec_time_rep, decimal_places)
@@ -208,7 +267,7 @@ def snippet_exec_timer(snippet_str,
             time_unit_str = DEFAULT_TIME_UNIT_STR
           
         # Complete and display the corresponding output information table
-        format_args_exec_timer2 = (time_unit_str, repeats, trials, exec_time_rep)
+        format_args_exec_timer2 = (time_unit_str, trials, repeats, exec_time_rep)
         exec_timer2_str = format_string(REP_EXEC_TIME_INFO_TEMPLATE, format_args_exec_timer2)
         
         if not return_best_time:
@@ -216,6 +275,592 @@ def snippet_exec_timer(snippet_str,
         else:
             format_args_exec_timer3 = (exec_timer2_str, best_time)
             print_format_string(REP_EXEC_TIME_INFO_BEST_TEMPLATE, format_args_exec_timer3)
+
+
+# Benchmark harness #
+#-------------------#
+
+def benchmark(stmt,
+              setup="pass",
+              globals=None,
+              name=None,
+              repeats=7,
+              number=None,
+              min_time=0.2,
+              warmups=1,
+              disable_gc=True,
+              cpu=None,
+              outlier_factor=1.5):
+    """
+    Time a statement or callable statistically.
+    
+    The number of loops per repeat is calibrated so that each repeat lasts
+    at least 'min_time', some warm-up repeats are discarded, and the
+    per-loop times of the remaining repeats are summarised with their
+    minimum, median, interquartile range (IQR) and standard deviation.
+    Repeats outside the Tukey fences (quartiles -/+ 'outlier_factor' IQRs)
+    are flagged as outliers.
+    
+    Parameters
+    ----------
+    stmt : str | callable
+        The statement or callable to time.
+    setup : str | callable, optional
+        Code executed once before each repeat, which is not timed.
+        Default is "pass".
+    globals : dict | None, optional
+        Namespace in which string statements are executed. Default is None.
+    name : str | None, optional
+        Name of the benchmark. Default is the callable's qualified name,
+        or the statement itself.
+    repeats : int, optional
+        Number of measured repeats. Default is 7.
+    number : int | None, optional
+        Loops per repeat. Default is None, meaning calibrated with 'min_time'.
+    min_time : float, optional
+        Minimum duration in seconds of a calibrated repeat. Default is 0.2.
+    warmups : int, optional
+        Repeats run and discarded before measuring. Default is 1.
+    disable_gc : bool, optional
+        Whether to disable the garbage collector while timing. Default is True.
+    cpu : int | None, optional
+        CPU to pin the process to during the benchmark (platforms with
+        os.sched_setaffinity only). Default is None (no pinning).
+    outlier_factor : float, optional
+        Width of the Tukey fences in IQRs. Default is 1.5.
+        
+    Returns
+    -------
+    BenchmarkResult
+        The per-loop times and their statistics.
+        
+    Raises
+    ------
+    ValueError
+        If 'repeats' is less than 2, or 'number' or 'min_time' are not positive.
+    RuntimeError
+        If CPU pinning is requested where it is not supported.
+    """
+    
+    # Input validations #
+    #-#-#-#-#-#-#-#-#-#-#
+    
+    if repeats < 2:
+        raise ValueError("At least 2 repeats are needed for the statistics.")
+    if number is not None and number < 1:
+        raise ValueError("'number' must be a positive integer.")
+    if min_time <= 0:
+        raise ValueError("'min_time' must be positive.")
+    if cpu is not None and not hasattr(os, "sched_setaffinity"):
+        raise RuntimeError("CPU pinning is not supported on this platform.")
+        
+    if name is None:
+        name = stmt if isinstance(stmt, str) else getattr(stmt, "__qualname__", repr(stmt))
+    
+    # timeit disables the garbage collector itself; re-enable it in the setup if asked
+    if not disable_gc:
+        setup = _prepend_gc_enable(setup)
+    timer = timeit.Timer(stmt, setup=setup, globals=globals)
+    
+    # Program progression #
+    #-#-#-#-#-#-#-#-#-#-#-#
+    
+    original_cpus = None
+    if cpu is not None:
+        original_cpus = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {cpu})
+        
+    try:
+        if number is None:
+            number = _calibrate_loops(timer, min_time)
+        for _ in range(warmups):
+            timer.timeit(number)
+        repeat_times = timer.repeat(repeat=repeats, number=number)
+    finally:
+        if original_cpus is not None:
+            os.sched_setaffinity(0, original_cpus)
+            
+    loop_times = [repeat_time / number for repeat_time in repeat_times]
+    metadata = dict(
+        timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        cpu=cpu,
+        gc_disabled=disable_gc,
+        warmups=warmups
+    )
+    return BenchmarkResult(name, loop_times, number, outlier_factor, metadata)
+
+
+def _calibrate_loops(timer, min_time):
+    """
+    Smallest loop count of the 1-2-5 sequence for which
+    a repeat lasts at least 'min_time' seconds.
+    """
+    scale = 1
+    while True:
+        for step in (1, 2, 5):
+            number = step * scale
+            if timer.timeit(number) >= min_time:
+                return number
+        scale *= 10
+        
+        
+def _prepend_gc_enable(setup):
+    """
+    Setup that enables the garbage collector before running the original one.
+    """
+    if callable(setup):
+        def gc_setup():
+            gc.enable()
+            setup()
+        return gc_setup
+    return f"import gc; gc.enable()\n{setup}"
+
+
+class BenchmarkResult:
+    """
+    Per-loop times of a benchmark and their summary statistics.
+    
+    Parameters
+    ----------
+    name : str
+        Name of the benchmark.
+    times : list[float]
+        Time per loop of each measured repeat, in seconds.
+    number : int
+        Loops per repeat.
+    outlier_factor : float, optional
+        Width of the Tukey fences in IQRs. Default is 1.5.
+    metadata : dict | None, optional
+        Information about the run (date, Python version, platform...).
+        
+    Attributes
+    ----------
+    min, median, mean, std, q1, q3, iqr : float
+        Statistics of the per-loop times, in seconds.
+    outliers : list[int]
+        Indices of the repeats outside the Tukey fences.
+    """
+    
+    def __init__(self, name, times, number, outlier_factor=1.5, metadata=None):
+        self.name = name
+        self.times = [float(t) for t in times]
+        self.number = number
+        self.outlier_factor = outlier_factor
+        self.metadata = metadata or {}
+        
+        times_arr = array(self.times)
+        self.q1, self.median, self.q3 = (float(q) for q in percentile(times_arr, [25, 50, 75]))
+        self.iqr = self.q3 - self.q1
+        self.min = float(times_arr.min())
+        self.mean = float(times_arr.mean())
+        self.std = float(times_arr.std(ddof=1))
+        
+        lower_fence = self.q1 - outlier_factor * self.iqr
+        upper_fence = self.q3 + outlier_factor * self.iqr
+        self.outliers = [i for i, t in enumerate(self.times) if not lower_fence <= t <= upper_fence]
+        
+    def __repr__(self):
+        return (f"BenchmarkResult(name={self.name!r}, median={self.median:.4g} s, "
+                f"iqr={self.iqr:.3g} s, repeats={len(self.times)}, number={self.number})")
+    
+    def to_dict(self):
+        """
+        Machine-readable dictionary of the result.
+        """
+        return dict(
+            name=self.name,
+            number=self.number,
+            times=self.times,
+            min=self.min,
+            median=self.median,
+            mean=self.mean,
+            std=self.std,
+            q1=self.q1,
+            q3=self.q3,
+            iqr=self.iqr,
+            outliers=self.outliers,
+            outlier_factor=self.outlier_factor,
+            metadata=self.metadata
+        )
+    
+    @classmethod
+    def from_dict(cls, result_dict):
+        """
+        Rebuild a result from the output of 'to_dict'.
+        """
+        return cls(result_dict["name"],
+                   result_dict["times"],
+                   result_dict["number"],
+                   result_dict.get("outlier_factor", 1.5),
+                   result_dict.get("metadata"))
+    
+    def to_json(self, indent=2):
+        """
+        JSON string of the result.
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+    
+    
+def save_benchmarks(results, path):
+    """
+    Write benchmark results to a JSON file, to be used as a baseline.
+    
+    Parameters
+    ----------
+    results : BenchmarkResult | list[BenchmarkResult]
+        The results to save.
+    path : str
+        Path of the JSON file.
+    """
+    if isinstance(results, BenchmarkResult):
+        results = [results]
+    with open(path, "w") as json_file:
+        json.dump([result.to_dict() for result in results], json_file, indent=2)
+        
+        
+def load_benchmarks(path):
+    """
+    Read the benchmark results saved with 'save_benchmarks'.
+    
+    Returns
+    -------
+    list[BenchmarkResult]
+        The saved results.
+    """
+    with open(path) as json_file:
+        result_dicts = json.load(json_file)
+    if isinstance(result_dicts, dict):
+        result_dicts = [result_dicts]
+    return [BenchmarkResult.from_dict(result_dict) for result_dict in result_dicts]
+
+
+def compare_to_baseline(results, baseline, threshold=0.05):
+    """
+    Compare benchmark results against a baseline and flag regressions.
+    
+    A benchmark regresses when its median time exceeds the baseline median
+    by more than 'threshold' (relative) and its interquartile range lies
+    entirely above the baseline one, so that noise alone is not flagged.
+    Improvements are detected symmetrically.
+    
+    Parameters
+    ----------
+    results : BenchmarkResult | list[BenchmarkResult]
+        The current results.
+    baseline : str | list[BenchmarkResult | dict]
+        Path of a JSON file written by 'save_benchmarks',
+        or the baseline results themselves. They are matched by name.
+    threshold : float, optional
+        Relative change of the median to be considered. Default is 0.05.
+        
+    Returns
+    -------
+    list[dict]
+        One entry per result with a baseline: name, baseline and current
+        medians, their ratio and the 'regression' and 'improvement' flags.
+    """
+    if isinstance(results, BenchmarkResult):
+        results = [results]
+    if isinstance(baseline, str):
+        baseline = load_benchmarks(baseline)
+    baseline = {base.name: base for base in
+                (BenchmarkResult.from_dict(base) if isinstance(base, dict) else base
+                 for base in baseline)}
+    
+    comparisons = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        ratio = result.median / base.median
+        comparisons.append(dict(
+            name=result.name,
+            baseline_median=base.median,
+            median=result.median,
+            ratio=ratio,
+            regression=(ratio > 1 + threshold and result.q1 > base.q3),
+            improvement=(ratio < 1 - threshold and result.q3 < base.q1)
+        ))
+    return comparisons
+    
+
+# Timer registry #
+#----------------#
+
+class TimerRegistry:
+    """
+    Registry of named, nestable timers with aggregated statistics.
+    
+    Timers are based on time.perf_counter_ns and can be used as context
+    managers, as decorators (of plain or coroutine functions) or through
+    the manual 'start'/'stop' API. Open timers are kept in a stack local to
+    the current thread or asyncio task (a context variable), so a timer
+    started inside another one is recorded under its path, e.g.
+    'pipeline/load', and concurrent timings never overwrite each other.
+    
+    For every path, the count, total, minimum and maximum times are kept,
+    together with a fixed-size random sample of the times (reservoir
+    sampling) from which the percentiles are estimated.
+    
+    Parameters
+    ----------
+    reservoir_size : int, optional
+        Maximum number of times sampled per path for the percentiles.
+        Default is 1024.
+    
+    Examples
+    --------
+    >>> timers = TimerRegistry()
+    >>> with timers.timer("pipeline"):
+    ...     with timers.timer("load"):
+    ...         pass
+    >>> @timers.timer("step")
+    ... def step():
+    ...     pass
+    >>> step()
+    >>> timers.start("manual")
+    >>> elapsed_ns = timers.stop("manual")
+    >>> sorted(timers.stats())
+    ['manual', 'pipeline', 'pipeline/load', 'step']
+    """
+    
+    def __init__(self, reservoir_size=1024):
+        if reservoir_size < 1:
+            raise ValueError("'reservoir_size' must be a positive integer.")
+        self.reservoir_size = reservoir_size
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._open_timers = ContextVar(f"open_timers_{id(self)}", default=())
+        
+    def __repr__(self):
+        return f"TimerRegistry(paths={len(self._stats)})"
+        
+    def timer(self, name):
+        """
+        Named timer to be used as a context manager or as a decorator.
+        
+        The returned object holds no state, so it can be shared
+        across threads, tasks and recursive calls.
+        """
+        return _Timer(self, name)
+    
+    def start(self, name):
+        """
+        Start a timer nested inside the currently open ones.
+        """
+        open_timers = self._open_timers.get()
+        parent_path = open_timers[-1][0] if open_timers else ()
+        self._open_timers.set(open_timers + ((parent_path + (name,), time.perf_counter_ns()),))
+        
+    def stop(self, name=None):
+        """
+        Stop the innermost open timer and record its time.
+        
+        Parameters
+        ----------
+        name : str, optional
+            Name of the timer expected to be stopped, checked if given.
+            
+        Returns
+        -------
+        int
+            The elapsed time in nanoseconds.
+            
+        Raises
+        ------
+        RuntimeError
+            If no timer is open, or the innermost one is not 'name'.
+        """
+        tf = time.perf_counter_ns()
+        open_timers = self._open_timers.get()
+        if not open_timers:
+            raise RuntimeError("No timer has been started.")
+            
+        path, ti = open_timers[-1]
+        if name is not None and name != path[-1]:
+            raise RuntimeError(f"Cannot stop timer '{name}': "
+                               f"the innermost open timer is '{path[-1]}'.")
+        
+        self._open_timers.set(open_timers[:-1])
+        elapsed_ns = tf - ti
+        
+        with self._lock:
+            stats = self._stats.get(path)
+            if stats is None:
+                stats = self._stats[path] = _TimerStats(self.reservoir_size)
+            stats.add(elapsed_ns)
+        return elapsed_ns
+    
+    def record(self, path, elapsed_ns):
+        """
+        Add a time, in nanoseconds, to the statistics of a path
+        (a timer name or a tuple of nested names).
+        """
+        if isinstance(path, str):
+            path = (path,)
+        with self._lock:
+            stats = self._stats.get(path)
+            if stats is None:
+                stats = self._stats[path] = _TimerStats(self.reservoir_size)
+            stats.add(elapsed_ns)
+            
+    def reset(self):
+        """
+        Discard all the recorded statistics.
+        """
+        with self._lock:
+            self._stats.clear()
+            
+    def stats(self, unit="ms", percentiles=(50, 90, 99)):
+        """
+        Aggregated statistics per timer path.
+        
+        Parameters
+        ----------
+        unit : {"ns", "us", "ms", "s"}, optional
+            Time unit of the results. Default is "ms".
+        percentiles : tuple[int | float], optional
+            Percentiles to estimate. Default is (50, 90, 99).
+            
+        Returns
+        -------
+        dict
+            Mapping of each path, joined with '/', to a dictionary with
+            the count, total, mean, min, max and 'p<q>' percentile times.
+        """
+        _validate_option("Time unit", unit, list(TIMER_UNIT_FACTORS))
+        factor = TIMER_UNIT_FACTORS[unit]
+        
+        with self._lock:
+            snapshot = [(path, stats.copy()) for path, stats in self._stats.items()]
+            
+        stats_dict = {}
+        for path, stats in sorted(snapshot):
+            path_stats = dict(
+                count=stats.count,
+                total=stats.total_ns / factor,
+                mean=stats.total_ns / stats.count / factor,
+                min=stats.min_ns / factor,
+                max=stats.max_ns / factor,
+            )
+            for q, value in zip(percentiles, percentile(stats.samples, percentiles)):
+                path_stats[f"p{q:g}"] = float(value) / factor
+            stats_dict["/".join(path)] = path_stats
+        return stats_dict
+    
+    def report(self, unit="ms", percentiles=(50, 90, 99)):
+        """
+        Hierarchical table of the timer statistics, nested timers
+        being indented under the timer they ran in.
+        
+        Parameters
+        ----------
+        unit : {"ns", "us", "ms", "s"}, optional
+            Time unit of the table. Default is "ms".
+        percentiles : tuple[int | float], optional
+            Percentiles to show. Default is (50, 90, 99).
+            
+        Returns
+        -------
+        str
+            The formatted table.
+        """
+        stats_dict = self.stats(unit, percentiles)
+        columns = ["count", "total", "mean", "min"] + [f"p{q:g}" for q in percentiles] + ["max"]
+        
+        name_width = max([len("timer")] + [2 * path.count("/") + len(path.rsplit("/", 1)[-1])
+                                           for path in stats_dict])
+        lines = [f"{'timer':<{name_width}}" + "".join(f"{col:>12}" for col in columns)
+                 + f"  ({unit})"]
+        for path, path_stats in stats_dict.items():
+            label = "  " * path.count("/") + path.rsplit("/", 1)[-1]
+            values = [f"{path_stats['count']:>12d}"]
+            values += [f"{path_stats[col]:>12.4g}" for col in columns[1:]]
+            lines.append(f"{label:<{name_width}}" + "".join(values))
+        return "\n".join(lines)
+    
+
+class _Timer:
+    """
+    Context manager and decorator timing a block under a given name.
+    """
+    
+    __slots__ = ("registry", "name")
+    
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+        
+    def __enter__(self):
+        self.registry.start(self.name)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.registry.stop(self.name)
+        return False
+    
+    def __call__(self, func):
+        registry, name = self.registry, self.name
+        
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_timed(*args, **kwargs):
+                registry.start(name)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    registry.stop(name)
+            return async_timed
+        
+        @wraps(func)
+        def timed(*args, **kwargs):
+            registry.start(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                registry.stop(name)
+        return timed
+    
+    
+class _TimerStats:
+    """
+    Count, total, extremes and a reservoir sample of the times of one timer path.
+    """
+    
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "samples", "reservoir_size")
+    
+    def __init__(self, reservoir_size):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+        self.samples = []
+        self.reservoir_size = reservoir_size
+        
+    def add(self, elapsed_ns):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if self.max_ns is None or elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+            
+        # Reservoir sampling (algorithm R)
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(elapsed_ns)
+        else:
+            slot = int(random() * self.count)
+            if slot < self.reservoir_size:
+                self.samples[slot] = elapsed_ns
+                
+    def copy(self):
+        stats = _TimerStats(self.reservoir_size)
+        stats.count, stats.total_ns = self.count, self.total_ns
+        stats.min_ns, stats.max_ns = self.min_ns, self.max_ns
+        stats.samples = self.samples.copy()
+        return stats
     
 #%%
 
@@ -230,6 +875,18 @@ MODULE_LIST = ["os", "time", "timeit"]
 SEC_TIME_UNIT_STR = 's'
 DEFAULT_TIME_UNIT_STR = 'formatted'
 
+# Nanoseconds per time unit of the timer registry reports #
+TIMER_UNIT_FACTORS = {"ns": 1, "us": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
+
+# Timer state #
+#-------------#
+
+# Start times of 'program_exec_timer', per thread or asyncio task #
+_PROGRAM_TIMER_STARTS = ContextVar("program_timer_starts", default=())
+
+# Registry for timers shared across the program #
+DEFAULT_TIMER_REGISTRY = TimerRegistry()
+
 # Template strings #
 #------------------#
 
@@ -238,7 +895,7 @@ NOREP_EXEC_TIME_INFO_TEMPLATE = \
 """Snippet execution time ({}), for {} trials with no repeats: {}"""
 
 REP_EXEC_TIME_INFO_TEMPLATE = \
-"""Snippet execution time ({}), for {} trials with and {} repeats:\n{}"""
+"""Snippet execution time ({}), for {} trials with {} repeats:\n{}"""
 
 REP_EXEC_TIME_INFO_BEST_TEMPLATE = \
 """{}\nBest: {}"""
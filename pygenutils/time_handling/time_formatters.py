@@ -6,30 +6,31 @@
 #----------------#
 
 # Standard modules #
+import re
 import time
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import import_module
 
 # Third-party modules #
 import numpy as np
-import pandas as pd
-from dateutil.parser import parse
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_func_name, get_type_str
+from filewise.general.introspection_utils import get_func_name
 from paramlib.global_parameters import (
     NUMPY_DATE_UNIT_LIST,
     PANDAS_DATE_UNIT_LIST,
     UNIT_FACTOR_DICT
 )
+from pygenutils._lazy_imports import is_pandas_instance
+from pygenutils._type_dispatch import TYPE_KEYS, type_key
 from pygenutils.arrays_and_lists.data_manipulation import flatten_list
 from pygenutils.strings.text_formatters import format_string
-from pygenutils.time_handling.time_utils import (
-    get_datetime_object_unit,
-    get_nano_datetime,
-)
+from pygenutils.time_handling.time_utils import get_datetime_object_unit
 
 #------------------#
 # Define functions #
@@ -82,7 +83,7 @@ def _validate_precision(frac_precision, option, min_prec=0, max_prec=9):
     """
     if ((frac_precision is not None) and not (min_prec <= frac_precision <= max_prec)):
         raise ValueError(f"Fractional precision must be between {min_prec} and {max_prec}.")
-    if ((7 <= frac_precision <= max_prec) and option != "pandas"):
+    if ((frac_precision is not None) and (7 <= frac_precision <= max_prec) and option != "pandas"):
         raise ValueError(f"Only option 'pandas' supports precision={frac_precision}.")
         
 def _validate_unit(unit, module):
@@ -93,8 +94,8 @@ def _validate_unit(unit, module):
     ----------
     unit : str
         Time unit for the floated time. 
-        Only applicable if the module is 'numpy' or 'pandas'.
-    module : {"numpy", "pandas"}
+        Only applicable if the module is 'numpy', 'pandas' or 'str'.
+    module : {"numpy", "pandas", "str"}
         The module used for parsing the floated time.
 
     Raises
@@ -104,7 +105,7 @@ def _validate_unit(unit, module):
     """
     
     # Define allowed date units for each module    
-    if module == "numpy" and unit not in NUMPY_DATE_UNIT_LIST:
+    if module in ["numpy", "str"] and unit not in NUMPY_DATE_UNIT_LIST:
         raise ValueError("Unsupported date unit for numpy.datetime64 objects. "
                          f"Choose one from {NUMPY_DATE_UNIT_LIST}.")
         
@@ -153,8 +154,9 @@ def parse_dt_string(datetime_str, dt_fmt_str=None, module="datetime", unit="ns",
     
     Parameters
     ----------
-    datetime_str : str | object
-        A string representing the date and/or time.
+    datetime_str : str | list | tuple | numpy.ndarray | pandas.Series | object
+        A string representing the date and/or time,
+        or an array-like of them, parsed at once in every module mode.
         If ``module="pandas"``, this can also be:
             - Python datetime objects
             - NumPy datetime64 objects
@@ -166,6 +168,9 @@ def parse_dt_string(datetime_str, dt_fmt_str=None, module="datetime", unit="ns",
         A format string that defines the structure of `datetime_str`. 
         Must follow the format required by the chosen module.
         If None and module is 'pandas', pandas will try to infer the format.
+        If None and module is either 'pandas' or 'dateutil', the format of
+        array-likes of strings is inferred once on a sample and cached
+        (see Notes); 'dateutil' ignores it otherwise.
         If empty and module is 'pandas' with a numeric timestamp, it will use the unit parameter.
     module : {"datetime", "dateutil", "pandas", "numpy", "arrow"}, default 'datetime'
         Specifies the library used for conversion.
@@ -195,12 +200,32 @@ def parse_dt_string(datetime_str, dt_fmt_str=None, module="datetime", unit="ns",
     -------
     datetime_obj : object
         The converted date/time object, as per the chosen module.
+        For array-like inputs:
+            - 'numpy': an array of dtype datetime64[unit]
+            - 'pandas': a DatetimeIndex
+            - Others: a list (for lists and tuples) or an object array
+              of the module's date/time objects.
+        Series inputs keep their index and name.
     
     Raises
     ------
     ValueError
         - If the module is not supported
         - If no time string is provided or if it does not match the provided format.
+        
+    Notes
+    -----
+    Array-like inputs are first parsed as a whole, directly with NumPy for 'numpy'
+    and with ``pandas.to_datetime(format=dt_fmt_str, cache=True)`` for 'datetime'
+    and 'pandas'. Only the elements that this vectorised path could not parse
+    fall back to the per-element parser, compiled once per format string.
+    
+    With ``dt_fmt_str=None`` and the 'pandas' or 'dateutil' modules, the format
+    of an array-like is inferred from its first value and validated on a sample
+    of the column. It is then stored in a bounded cache keyed by the column
+    fingerprint (Series name, shape of the first value and parsing options),
+    so that columns sharing a layout skip the inference, and the column takes
+    the fixed-format vectorised path.
     """
     
     # Input validation #
@@ -211,34 +236,262 @@ def parse_dt_string(datetime_str, dt_fmt_str=None, module="datetime", unit="ns",
     _validate_option("Module", module, allowed_modules)
     
     # Formatting string #
-    if dt_fmt_str is None and module != "pandas":
-        raise ValueError("A datetime format string must be provided for non-pandas modules.")
+    if dt_fmt_str is None and module not in FORMAT_INFERENCE_MODULES:
+        raise ValueError("A datetime format string must be provided "
+                         f"for modules other than {FORMAT_INFERENCE_MODULES}.")
         
     # Time string parsing #
     #-#-#-#-#-#-#-#-#-#-#-#
     
     try:
-        parse_func = TIME_STR_PARSING_DICT.get(module)
+        # Array-likes are parsed at once
+        if type_key(datetime_str) in ARRAY_LIKE_STR_TYPES:
+            datetime_obj = _parse_dt_string_array(datetime_str, dt_fmt_str, module, unit, dayfirst, yearfirst)
         
         # Special handling for pandas module
-        if module == "pandas":
+        elif module == "pandas" and dt_fmt_str is None:
+            import pandas as pd
             # If datetime_str is a string and looks like a numeric timestamp, use unit
             if isinstance(datetime_str, str) and (datetime_str.isdigit() or (datetime_str.replace('.', '', 1).isdigit() and datetime_str.count('.') <= 1)):
                 datetime_obj = pd.to_datetime(datetime_str, unit=unit, dayfirst=dayfirst, yearfirst=yearfirst)
+            # Otherwise let pandas infer the format
             else:
-                # Otherwise use format if provided, or let pandas infer the format
-                if dt_fmt_str is None:
-                    datetime_obj = pd.to_datetime(datetime_str, dayfirst=dayfirst, yearfirst=yearfirst)
-                else:
-                    datetime_obj = parse_func(datetime_str, dt_fmt_str, unit, dayfirst, yearfirst)
+                datetime_obj = pd.to_datetime(datetime_str, dayfirst=dayfirst, yearfirst=yearfirst, cache=True)
+
         else:
-            # For other modules, use the parse_func as defined
-            datetime_obj = parse_func(datetime_str, dt_fmt_str, unit) if module == "numpy" else parse_func(datetime_str, dt_fmt_str)
+            parse_func = _compile_dt_parser(module, dt_fmt_str, unit, dayfirst, yearfirst)
+            datetime_obj = parse_func(datetime_str)
     except ValueError as e:
         raise ValueError(f"The time string does not match the format string provided: {str(e)}")
     else:
         return datetime_obj
     
+# Auxiliary functions #
+#~~~~~~~~~~~~~~~~~~~~~#
+
+@lru_cache(maxsize=128)
+def _compile_dt_parser(module, dt_fmt_str, unit="ns", dayfirst=False, yearfirst=False):
+    """
+    Build the single-string parser for a module and format string.
+    
+    Parsers are cached per argument combination, so that repeated calls
+    skip the dispatch. For the 'datetime' module and strict ISO 8601 formats,
+    strings matching the format are parsed with ``datetime.fromisoformat``,
+    several times faster than ``datetime.strptime``, which handles the rest.
+    
+    Parameters
+    ----------
+    module : {"datetime", "dateutil", "pandas", "numpy", "arrow"}
+        Library used for conversion.
+    dt_fmt_str : str | None
+        Format string of the strings to parse.
+    unit : str
+        Date unit, only used by 'numpy'.
+    dayfirst, yearfirst : bool
+        Date parse order, only used by 'pandas'.
+        
+    Returns
+    -------
+    callable
+        Function parsing a single date/time string.
+    """
+    parse_func = TIME_STR_PARSING_DICT.get(module)
+    
+    if module == "numpy":
+        return lambda datetime_str: parse_func(datetime_str, dt_fmt_str, unit)
+    elif module == "pandas":
+        return lambda datetime_str: parse_func(datetime_str, dt_fmt_str, unit, dayfirst, yearfirst)
+    
+    iso_regex = _iso_format_regex(dt_fmt_str)
+    if module == "datetime" and iso_regex is not None:
+        def parse_iso_str(datetime_str):
+            if iso_regex.fullmatch(datetime_str):
+                return datetime.fromisoformat(datetime_str)
+            return datetime.strptime(datetime_str, dt_fmt_str)
+        return parse_iso_str
+    
+    return lambda datetime_str: parse_func(datetime_str, dt_fmt_str)
+
+
+@lru_cache(maxsize=128)
+def _iso_format_regex(dt_fmt_str):
+    """
+    Compile the regular expression matching strings written in a strict
+    ISO 8601 format string, or return None if the format is not one of them.
+    """
+    if dt_fmt_str not in ISO_8601_FORMATS:
+        return None
+    pattern = re.escape(dt_fmt_str)
+    for directive, directive_pattern in ISO_DIRECTIVE_PATTERNS.items():
+        pattern = pattern.replace(re.escape(directive), directive_pattern)
+    return re.compile(pattern)
+
+
+def _parse_dt_string_array(datetime_strs, dt_fmt_str, module, unit, dayfirst, yearfirst):
+    """
+    Parse an array-like of date/time strings at once.
+    
+    The vectorised path is tried first ('numpy', 'datetime' and 'pandas'
+    modules); the elements it leaves unparsed fall back to the
+    per-element parser, which raises for those not matching the format.
+    
+    Parameters
+    ----------
+    datetime_strs : list | tuple | numpy.ndarray | pandas.Series
+        Date/time strings to parse.
+    dt_fmt_str : str | None
+        Format string of the strings to parse.
+    module : {"datetime", "dateutil", "pandas", "numpy", "arrow"}
+        Library used for conversion.
+    unit : str
+        Date unit, only used by 'numpy'.
+    dayfirst, yearfirst : bool
+        Date parse order, only used by 'pandas'.
+        
+    Returns
+    -------
+    numpy.ndarray | pandas.DatetimeIndex | pandas.Series | list
+        Parsed objects, in a container following the input (see 'parse_dt_string').
+    """
+    import pandas as pd
+    values = np.asarray(datetime_strs, dtype=object).ravel()
+    unparsed = np.ones(values.size, dtype=bool)
+    
+    # Format inference #
+    vector_fmt_str = dt_fmt_str
+    if dt_fmt_str is None:
+        source = datetime_strs.name if isinstance(datetime_strs, pd.Series) else None
+        vector_fmt_str = _infer_column_format(values, source, module, dayfirst, yearfirst)
+        
+        # Let pandas handle the whole input if no format could be settled
+        if vector_fmt_str is None and module == "pandas":
+            return pd.to_datetime(datetime_strs, dayfirst=dayfirst, yearfirst=yearfirst, cache=True)
+    
+    # Vectorised parsing #
+    if module == "numpy":
+        parsed = np.empty(values.size, dtype=f"datetime64[{unit}]")
+        try:
+            parsed = values.astype(f"datetime64[{unit}]")
+        except ValueError:
+            pass
+        else:
+            unparsed[:] = False
+            
+    elif (module in ["datetime", "dateutil", "pandas"] 
+          and vector_fmt_str is not None
+          and not _has_tz_directive(vector_fmt_str)):
+        dt_index = pd.to_datetime(values, format=vector_fmt_str, errors="coerce", 
+                                  dayfirst=dayfirst, yearfirst=yearfirst, cache=True)
+        unparsed = np.asarray(dt_index.isna())
+        parsed = dt_index.to_numpy() if module == "pandas" else dt_index.to_pydatetime()
+        
+    else:
+        parsed = np.empty(values.size, dtype=object)
+        
+    # Per-element fallback #
+    if unparsed.any():
+        parse_func = _compile_dt_parser(module, dt_fmt_str, unit, dayfirst, yearfirst)
+        if module == "pandas" and parsed.dtype != object:
+            parsed = parsed.astype(object)
+        for pos in np.flatnonzero(unparsed):
+            parsed[pos] = parse_func(values[pos])
+            
+    # Restore the input container #
+    return _restore_parsed_container(parsed, datetime_strs, module)
+
+
+def _infer_column_format(values, source, module, dayfirst, yearfirst):
+    """
+    Infer the strftime format of a column of date/time strings, using the cache.
+    
+    The format is guessed from the first value and kept only if it parses
+    every value of an evenly spaced sample, with the same result as the
+    module's own parser for 'dateutil'. Only validated formats are cached,
+    so that a column with mixed layouts does not disable the fast path
+    for later columns sharing its fingerprint.
+    
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Flat object array of the column values.
+    source : hashable
+        Name of the column source (e.g. the Series name), part of the fingerprint.
+    module : {"pandas", "dateutil"}
+        Library used for conversion.
+    dayfirst, yearfirst : bool
+        Date parse order.
+        
+    Returns
+    -------
+    str | None
+        The inferred format string, or None if none applies.
+    """
+    from dateutil.parser import parse
+    import pandas as pd
+    from pandas.tseries.api import guess_datetime_format
+    if values.size == 0 or not isinstance(values[0], str):
+        return None
+    
+    # Column fingerprint #
+    first_value_shape = values[0].translate(VALUE_SHAPE_TABLE)
+    fingerprint = (source, first_value_shape, module, dayfirst, yearfirst)
+    
+    try:
+        _FORMAT_INFERENCE_CACHE.move_to_end(fingerprint)
+        return _FORMAT_INFERENCE_CACHE[fingerprint]
+    except KeyError:
+        pass
+    
+    # Inference and validation on a sample #
+    dt_fmt_str = guess_datetime_format(values[0], dayfirst=dayfirst)
+    if dt_fmt_str is not None and not _has_tz_directive(dt_fmt_str):
+        step = max(1, values.size // FORMAT_INFERENCE_SAMPLE_SIZE)
+        sample = values[::step][:FORMAT_INFERENCE_SAMPLE_SIZE]
+        try:
+            sample_parsed = pd.to_datetime(sample, format=dt_fmt_str).to_pydatetime()
+            if module == "dateutil" and list(sample_parsed) != [parse(value) for value in sample]:
+                dt_fmt_str = None
+        except (ValueError, TypeError, OverflowError):
+            dt_fmt_str = None
+    else:
+        dt_fmt_str = None
+        
+    # Bounded cache update #
+    if dt_fmt_str is not None:
+        _FORMAT_INFERENCE_CACHE[fingerprint] = dt_fmt_str
+        if len(_FORMAT_INFERENCE_CACHE) > FORMAT_INFERENCE_CACHE_SIZE:
+            _FORMAT_INFERENCE_CACHE.popitem(last=False)
+    return dt_fmt_str
+
+
+def _has_tz_directive(dt_fmt_str):
+    """
+    Check whether a format string carries time zone information,
+    which the vectorised path leaves to the per-element parser.
+    """
+    return dt_fmt_str is not None and ("%z" in dt_fmt_str or "%Z" in dt_fmt_str)
+
+
+def _restore_parsed_container(parsed, datetime_strs, module):
+    """
+    Place the parsed values in a container matching the input one.
+    """
+    import pandas as pd
+    if module == "pandas":
+        parsed = pd.to_datetime(parsed)
+    
+    if isinstance(datetime_strs, pd.Series):
+        dtype = None if module in ["numpy", "pandas"] else object
+        return pd.Series(parsed, index=datetime_strs.index, name=datetime_strs.name, dtype=dtype)
+    elif module == "pandas":
+        return parsed
+    elif isinstance(datetime_strs, np.ndarray):
+        return parsed.reshape(datetime_strs.shape)
+    elif module == "numpy":
+        return parsed
+    else:
+        return list(parsed)
+
 # %% 
 
 # Input format: int, float #
@@ -250,7 +503,7 @@ def parse_dt_string(datetime_str, dt_fmt_str=None, module="datetime", unit="ns",
 def parse_float_dt(datetime_float, 
                    frac_precision=None,
                    origin="unix", 
-                   unit="us", 
+                   unit=None, 
                    dt_fmt_str=None, 
                    module="datetime",
                    dayfirst=False,
@@ -259,8 +512,11 @@ def parse_float_dt(datetime_float,
     Converts an integer or float time to a date/time object.
     It also converts to a string representation if requested.
     
-    datetime_float : int or float
-        Time representing a time unit relative to an origin.
+    Parameters
+    ----------
+    datetime_float : int | float | list | tuple | numpy.ndarray | pandas.Series
+        Time representing a time unit relative to an origin,
+        or an array-like of them (see Notes).
     frac_precision : int [0,9] or None 
         Precision of the fractional part of the seconds.
         If not None, this part is rounded to the desired number of decimals,
@@ -275,12 +531,12 @@ def parse_float_dt(datetime_float,
         the moment of execution, whereas for clock times, seconds are counted 
         from the epoch time.
     unit : str, optional
-        Applies only if ``origin='unix'`` and ``convert_to={'numpy', 'pandas'}``.
-        Denotes which unit ``datetime_str`` is expressed in. 
+        Applies only if ``origin='unix'`` and ``module={'numpy', 'pandas', 'str'}``.
+        Denotes which unit ``datetime_float`` is expressed in. 
         
         For Pandas, allowed units are {'D', 's', 'ms', 'us', 'ns'}.
-        For NumPy, allowed units are {'Y', 'M', 'D', 'h', 'm', 's', 'ms', 'us', 'ns'}.
-        Defaults to 'ns' for Pandas and 'us' for NumPy.
+        For NumPy and strings, allowed units are {'Y', 'M', 'D', 'h', 'm', 's', 'ms', 'us', 'ns'}.
+        Defaults to 's' for strings and 'us' for Pandas and NumPy.
     dt_fmt_str : str
         Format string to convert the date/time object to a string.
     module : {"datetime", "time", "pandas", "numpy", "arrow", "str"}, default 'datetime'.
@@ -300,11 +556,29 @@ def parse_float_dt(datetime_float,
     -------
     object
         The converted date/time object or string representation.
+        For array-likes, depending on `module`:
+            - 'numpy': an array of dtype datetime64
+            - 'pandas': a DatetimeIndex
+            - 'str': a string array
+            - Others: an object array of the module's date/time objects
+        Series inputs keep their index and name.
     
     Raises
     ------
     ValueError
         If parameters are invalid or the conversion fails.
+        
+    Notes
+    -----
+    Array-likes relative to the Unix epoch are converted with a single cast
+    to datetime64: integers directly in `unit`, floats to microseconds
+    (nanoseconds if `unit` is 'ns'), or to the resolution of `frac_precision`. The fractional seconds are
+    rounded with integer arithmetic, and strings are formatted at once,
+    composing the digits of numeric directives (%Y, %y, %m, %d, %H, %M, %S, %f)
+    directly and through ``DatetimeIndex.strftime`` for any other.
+    
+    Times converted to strings, scalars included, are taken in `unit`
+    and as UTC, as the 'numpy' and 'pandas' modules do.
     """        
     
     # Input validation #
@@ -314,8 +588,12 @@ def parse_float_dt(datetime_float,
     allowed_modules = ["str"] + list(FLOATED_TIME_PARSING_DICT.keys())
     _validate_option("Object type conversion", module, allowed_modules)
     
-    # Time formatting string #
-    if module == "str" and not dt_fmt_str:
+    # Date unit, defaulting to seconds for strings #
+    if unit is None:
+        unit = "s" if module == "str" else "us"
+    
+    # Time formatting string (elapsed times have their own format) #
+    if module == "str" and origin != "arbitrary" and not dt_fmt_str:
         raise ValueError("You must provide a formatting string.")
 
     # Fractional second precision #
@@ -327,7 +605,16 @@ def parse_float_dt(datetime_float,
     # Floated time parsing #
     #-#-#-#-#-#-#-#-#-#-#-#-
 
-    if module == "str":
+    if type_key(datetime_float) in ARRAY_LIKE_STR_TYPES:
+        return _parse_float_dt_array(datetime_float,
+                                     frac_precision,
+                                     origin,
+                                     unit,
+                                     dt_fmt_str,
+                                     module,
+                                     dayfirst,
+                                     yearfirst)
+    elif module == "str":
         return _parse_float_to_string(datetime_float,
                                       frac_precision, 
                                       origin,
@@ -366,7 +653,7 @@ def _parse_float_to_string(floated_time,
     dt_fmt_str : str
         Format string for the string representation.
     unit : str, optional
-        Time unit for `floated_time` if `origin='unix'` and `module` in {'numpy', 'pandas'}.
+        Time unit for `floated_time` if `origin='unix'`.
     module : {"datetime", "time", "pandas", "numpy", "arrow"}
         Module used for parsing.
     dayfirst : bool, default False
@@ -389,18 +676,9 @@ def _parse_float_to_string(floated_time,
         return _format_arbitrary_dt(floated_time, frac_precision)
        
     elif origin == "unix":
-        # Accommodation of the fractional second #
-        if frac_precision is not None:
-            if frac_precision <= 6:
-                dt_seconds = round(floated_time)
-                dt_obj = _float_dt_parser(dt_seconds, module, unit, dayfirst, yearfirst)
-                dt_str = dt_obj.strftime(dt_fmt_str)
-            elif 7 <= frac_precision <= 9:
-                return get_nano_datetime(floated_time, module)
-        # Keep the original precision #
-        else:
-            dt_str = _float_dt_parser(floated_time, module, unit, dayfirst, yearfirst).strftime(dt_fmt_str)
-    
+        # Same path as array-likes, fractional second rounding included #
+        dt_arr = _float_to_dt64_array(np.asarray([floated_time]), unit, frac_precision)
+        dt_str = str(_format_dt64_array(dt_arr, dt_fmt_str)[0])
         return dt_str  
 
     
@@ -449,6 +727,256 @@ def _float_dt_parser(floated_time, module, unit, dayfirst, yearfirst):
     return datetime_obj
 
 
+
+# Array-like inputs #
+#~~~~~~~~~~~~~~~~~~~#
+
+def _parse_float_dt_array(floated_times, 
+                          frac_precision,
+                          origin,
+                          unit, 
+                          dt_fmt_str,
+                          module,
+                          dayfirst,
+                          yearfirst):
+    """
+    Converts an array-like of floated times at once.
+    
+    Parameters
+    ----------
+    floated_times : list | tuple | numpy.ndarray | pandas.Series
+        Times representing a time unit relative to an origin.
+    frac_precision : int [0,9] or None
+        Precision of the fractional seconds.
+    origin : {"arbitrary", "unix"}
+        Origin of the time measurement.
+    unit : str
+        Time unit of `floated_times`.
+    dt_fmt_str : str
+        Format string for the string representation.
+    module : {"datetime", "time", "pandas", "numpy", "arrow", "str"}
+        Module or class used to parse the floated times.
+    dayfirst, yearfirst : bool
+        Date parse order, passed to the per-element parsers.
+        
+    Returns
+    -------
+    numpy.ndarray | pandas.DatetimeIndex | pandas.Series
+        Converted objects (see 'parse_float_dt').
+    """
+    import pandas as pd
+    values = np.asarray(floated_times)
+    
+    # Elapsed times are formatted one by one #
+    if module == "str" and origin == "arbitrary":
+        result = np.array([_format_arbitrary_dt(floated_time, frac_precision)
+                           for floated_time in values.ravel()]).reshape(values.shape)
+    
+    # Epoch times, converted by casting #
+    elif module in ["numpy", "pandas", "str"]:
+        dt_arr = _float_to_dt64_array(values, unit, frac_precision)
+        if module == "numpy":
+            result = dt_arr
+        elif module == "pandas":
+            result = pd.DatetimeIndex(dt_arr.ravel())
+        else:
+            result = _format_dt64_array(dt_arr, dt_fmt_str)
+            
+    # Modules producing Python objects, one by one #
+    else:
+        parse_func = FLOATED_TIME_PARSING_DICT.get(module)
+        result = np.empty(values.size, dtype=object)
+        for pos, floated_time in enumerate(values.ravel().tolist()):
+            result[pos] = parse_func(floated_time, unit, dayfirst, yearfirst)
+        result = result.reshape(values.shape)
+        
+    if isinstance(floated_times, pd.Series):
+        return pd.Series(result, index=floated_times.index, name=floated_times.name)
+    return result
+
+
+def _float_to_dt64_array(values, unit, frac_precision=None):
+    """
+    Cast epoch numbers to datetime64, rounding the fractional seconds.
+    
+    Integer arrays are cast directly in `unit`. Float arrays are cast through
+    integer microseconds (nanoseconds if `unit` is 'ns' or `frac_precision` > 6),
+    and the result is given in the resolution that `frac_precision` calls for,
+    so that no fraction is silently truncated.
+    
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Epoch numbers in `unit`.
+    unit : str
+        Time unit of `values`.
+    frac_precision : int [0,9] or None
+        Number of decimals kept in the seconds, rounded half up.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Array of dtype datetime64.
+    """
+    is_float = np.issubdtype(values.dtype, np.floating)
+    
+    if not is_float:
+        dt_arr = values.astype(f"datetime64[{unit}]")
+    elif unit in NS_PER_UNIT:
+        fine_unit = "ns" if (unit == "ns" or (frac_precision or 0) > 6) else "us"
+        fine_values = np.rint(values * (NS_PER_UNIT[unit] / NS_PER_UNIT[fine_unit]))
+        nan_mask = np.isnan(fine_values)
+        if nan_mask.any():
+            fine_values[nan_mask] = 0
+        dt_arr = fine_values.astype(np.int64).view(f"datetime64[{fine_unit}]")
+        if nan_mask.any():
+            dt_arr[nan_mask] = np.datetime64("NaT")
+    elif np.all(values == np.floor(values)):
+        dt_arr = values.astype(np.int64).astype(f"datetime64[{unit}]")
+    else:
+        raise ValueError(f"Fractional times are not supported for calendar unit '{unit}'.")
+        
+    if frac_precision is None:
+        return dt_arr
+    
+    # Round in integer arithmetic at the precision's resolution #
+    arr_unit = np.datetime_data(dt_arr.dtype)[0]
+    if arr_unit not in NS_PER_UNIT:
+        return dt_arr
+    step_ns = 10**(9 - frac_precision)
+    unit_ns = NS_PER_UNIT[arr_unit]
+    if unit_ns < step_ns:
+        step = step_ns // unit_ns
+        ints = dt_arr.view(np.int64)
+        rounded = (ints + step // 2) // step * step
+        dt_arr = np.where(np.isnat(dt_arr), ints, rounded).view(dt_arr.dtype)
+        
+    # Drop the resolution beyond the precision for floats #
+    if is_float:
+        dt_arr = dt_arr.astype(f"datetime64[{FRAC_PRECISION_UNITS[frac_precision]}]")
+    return dt_arr
+
+
+def _format_dt64_array(dt_arr, dt_fmt_str):
+    """
+    Format a datetime64 array into strings at once.
+    
+    Format strings made only of numeric directives (see FIELD_DIRECTIVE_WIDTHS)
+    are rendered by computing the calendar fields with integer arithmetic and
+    writing their digits straight into a character array. Any other
+    format string, or years outside [1000, 9999] (which strftime does not
+    zero-pad consistently), are left to ``DatetimeIndex.strftime``.
+    NaT values are rendered as 'NaT' either way.
+    
+    Parameters
+    ----------
+    dt_arr : numpy.ndarray
+        Array of dtype datetime64.
+    dt_fmt_str : str
+        Format string for the string representation.
+        
+    Returns
+    -------
+    numpy.ndarray
+        Array of formatted strings, with the shape of `dt_arr`.
+    """
+    import pandas as pd
+    fmt_tokens = _tokenise_numeric_format(dt_fmt_str)
+    if fmt_tokens is not None:
+        dt_strs = _compose_dt_strings(dt_arr.ravel(), fmt_tokens)
+        if dt_strs is not None:
+            return dt_strs.reshape(dt_arr.shape)
+    
+    dt_strs = np.asarray(pd.DatetimeIndex(dt_arr.ravel()).strftime(dt_fmt_str), dtype=str)
+    is_nat = np.isnat(dt_arr.ravel())
+    if is_nat.any():
+        dt_strs = np.where(is_nat, "NaT", dt_strs)
+    return dt_strs.reshape(dt_arr.shape)
+
+
+@lru_cache(maxsize=128)
+def _tokenise_numeric_format(dt_fmt_str):
+    """
+    Split a format string into literals and numeric directives,
+    or return None if it contains any other directive.
+    """
+    fmt_tokens = []
+    for token in re.findall(r"%.|[^%]+|%", dt_fmt_str):
+        if token == "%%":
+            fmt_tokens.append("%")
+        elif token.startswith("%"):
+            if token not in FIELD_DIRECTIVE_WIDTHS:
+                return None
+            fmt_tokens.append(token)
+        else:
+            fmt_tokens.append(token)
+    return tuple(fmt_tokens)
+
+
+def _compose_dt_strings(dt_arr, fmt_tokens):
+    """
+    Render a flat datetime64 array following a tokenised numeric format.
+    
+    Returns None if any year lies outside [1000, 9999].
+    """
+    # Calendar fields, in integer arithmetic #
+    is_nat = np.isnat(dt_arr)
+    us_values = np.where(is_nat, 0, dt_arr.astype("datetime64[us]").view(np.int64))
+    days, us_of_day = np.divmod(us_values, 86_400 * 10**6)
+    year, month, day = (field.astype(np.int32) for field in _civil_from_days(days))
+    if year.size and (year.min() < 1000 or year.max() > 9999):
+        return None
+    
+    seconds_of_day, microsecond = (field.astype(np.int32) for field in np.divmod(us_of_day, 10**6))
+    hour, seconds_of_hour = np.divmod(seconds_of_day, 3600)
+    minute, second = np.divmod(seconds_of_hour, 60)
+    fields = {
+        "%Y": year, "%y": year % 100, "%m": month, "%d": day,
+        "%H": hour, "%M": minute, "%S": second, "%f": microsecond
+    }
+    
+    # Write the characters' code points, one contiguous row per position #
+    width = sum(FIELD_DIRECTIVE_WIDTHS.get(token, len(token)) for token in fmt_tokens)
+    if not width:
+        return np.full(dt_arr.size, "")
+    
+    codes = np.empty((width, dt_arr.size), dtype=np.uint32)
+    pos = 0
+    for token in fmt_tokens:
+        if token in FIELD_DIRECTIVE_WIDTHS:
+            field = fields[token]
+            n_digits = FIELD_DIRECTIVE_WIDTHS[token]
+            for k in range(n_digits):
+                codes[pos + k] = 48 + field // 10**(n_digits - 1 - k) % 10
+            pos += n_digits
+        else:
+            codes[pos:pos + len(token)] = np.array([ord(char) for char in token])[:, np.newaxis]
+            pos += len(token)
+    
+    # Transposed, each row of code points is one string #
+    dt_strs = np.ascontiguousarray(codes.T).view(f"<U{width}").ravel()
+    if is_nat.any():
+        dt_strs = np.where(is_nat, "NaT", dt_strs)
+    return dt_strs
+
+
+def _civil_from_days(days):
+    """
+    Convert days since the Unix epoch into proleptic Gregorian
+    year, month and day arrays (H. Hinnant's algorithm).
+    """
+    z = days + 719_468
+    era = z // 146_097
+    day_of_era = z - era * 146_097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36_524 - day_of_era // 146_096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
 def _format_arbitrary_dt(floated_time, frac_precision):
     """
     Formats an arbitrary time into a string representation
@@ -487,7 +1015,7 @@ def _format_arbitrary_dt(floated_time, frac_precision):
     minutes, seconds = divmod(floated_time % 3600, 60)
     
     # Maintain precisions higher than 6 in the upper bound #
-    if frac_precision > 6:
+    if frac_precision is not None and frac_precision > 6:
         frac_precision = 6
         
     seconds = round(seconds, frac_precision)
@@ -601,30 +1129,100 @@ def dt_obj_converter(datetime_obj,
     - If the input object is whichever of types [`DataFrame`, `Series`, `ndarray`]
       and ``convert_to={'float', 'str'``}, the resulting object type will also be array-like,
       but an attempt will be made to convert its all values accordingly.
+    - The validated conversion plan is cached per object type and option set.
+      For repeated conversions of a known type, 'make_converter' returns
+      the plan itself, skipping the type resolution as well.
     """
 
+    # Object type #
+    obj_type = type_key(datetime_obj)
+    
+    # Conversion, through a cached plan validated once per option set #
+    converter = _cached_converter(obj_type, convert_to, unit, float_class, int_class,
+                                  dt_fmt_str, dayfirst, yearfirst)
+    try:
+        return converter(datetime_obj)
+    except Exception as err:
+        raise RuntimeError(f"Error during conversion to '{convert_to}': {err}")
+    
+
+def make_converter(from_type,
+                   convert_to,
+                   unit="s",
+                   float_class="d", 
+                   int_class="int",
+                   dt_fmt_str=None,
+                   dayfirst=False,
+                   yearfirst=False):
+    """
+    Build a converter of date/time objects of a given type to another.
+    
+    The options are validated and the conversion function is looked up only
+    once, here, so that the returned callable performs the conversion alone.
+    Use it instead of 'dt_obj_converter' in per-record loops, where the
+    validation and dispatch would otherwise be repeated on every call.
+    
+    Parameters
+    ----------
+    from_type : str | type
+        Type of the objects to convert, either as a class
+        (e.g. `datetime.datetime`, `pandas.Timestamp`, `numpy.datetime64`)
+        or as its lowercase name (e.g. "datetime", "timestamp", "datetime64").
+    convert_to : str
+        The target type, among those supported for `from_type`
+        (see the table in 'dt_obj_converter').
+    unit : str
+        The date unit for conversion. Default is `"s"` (seconds).
+    float_class : str | numpy float class
+        The float precision class. Default is `"d"` (double precision).
+    int_class : str | numpy int class
+        The integer precision class. Default is `"int"` (signed integer type).
+    dt_fmt_str : str
+        Format string to convert the date/time objects to strings.
+    dayfirst : bool, default False
+        Date parse order, for conversions to pandas objects.
+    yearfirst : bool, default False
+        Date parse order, for conversions to pandas objects.
+        
+    Returns
+    -------
+    converter : callable
+        Function converting one object of type `from_type`.
+        It also takes lists and tuples (returning a list) and object arrays
+        (returning an object array) of such objects, converted element-wise.
+        Arrays of dtype datetime64 are converted at once to 'float', 'str',
+        'pandas' (DatetimeIndex) and 'datetime'.
+        Conversion errors are raised as they are, without wrapping.
+        
+    Raises
+    ------
+    ValueError
+        If an option is not supported, or `convert_to`
+        is not a valid target type for `from_type`.
+        
+    Examples
+    --------
+    >>> to_float = make_converter(datetime, "float")
+    >>> timestamps = [to_float(dt_obj) for dt_obj in records]
+    >>> to_str = make_converter("datetime64", "str", dt_fmt_str="%Y-%m-%d")
+    >>> to_str(np.array(["2024-01-31", "2024-02-29"], dtype="datetime64[D]"))
+    array(['2024-01-31', '2024-02-29'], dtype='<U10')
+    """
+    
     # Input validation #
     #-#-#-#-#-#-#-#-#-#-
     
-    # Object type to convert to #
+    # Object type to convert from and to #
+    if isinstance(from_type, type):
+        from_type = TYPE_KEYS.resolve(from_type)
+    _validate_option("Object type", from_type, list(CONVERSION_OPT_DICT.keys()))
+        
     if not convert_to:
         raise ValueError("Argument 'convert_to' not provided.")
-        
-    # Helper function to perform conversion and handle exceptions
-    def perform_conversion(conversion_dict, obj, **kwargs):
-        try:
-            return conversion_dict.get(convert_to)(
-                obj,
-                kwargs.get("unit"),
-                kwargs.get("float_class"),
-                kwargs.get("int_class"),
-                kwargs.get("dt_fmt_str"),
-                kwargs.get("dayfirst"),
-                kwargs.get("yearfirst"),
-            )
-        except Exception as err:
-            raise RuntimeError(f"Error during conversion to '{convert_to}': {err}")
-              
+    _validate_option(f"Object type conversion for object type '{from_type}' where", 
+                     convert_to, 
+                     list(CONVERSION_OPT_DICT[from_type].keys()))
+    
     # Date unit factor #
     allowed_factors = list(UNIT_FACTOR_DICT.keys())
     _validate_option("Time unit factor", unit, allowed_factors)
@@ -633,23 +1231,37 @@ def dt_obj_converter(datetime_obj,
     _validate_option("Numpy float precision class", float_class, _FLOAT_CLASS_LIST)
     _validate_option("Numpy integer precision class", int_class, _INT_CLASS_LIST)
     
-    # Program progression #
-    #-#-#-#-#-#-#-#-#-#-#-#
+    # Conversion plan #
+    #-#-#-#-#-#-#-#-#-#
     
-    # Get the object type's name #
-    obj_type = get_type_str(datetime_obj, lowercase=True)    
+    conversion_func = CONVERSION_OPT_DICT[from_type][convert_to]
+    conversion_args = (unit, float_class, int_class, dt_fmt_str, dayfirst, yearfirst)
+    dt64_array_func = DT64_ARRAY_CONVERSION_DICT.get(convert_to) if from_type == "datetime64" else None
+    is_array_type = from_type in ARRAY_LIKE_DT_TYPES
     
-    # Validate here the type to convert to, according the input data type # 
-    _validate_option(f"Object type conversion for object type '{obj_type}' where", 
-                     convert_to, 
-                     list(CONVERSION_OPT_DICT[obj_type].keys()))
-    
-    # Perform the conversion # 
-    conversion_dict = CONVERSION_OPT_DICT[obj_type]
-    return perform_conversion(conversion_dict, datetime_obj, unit=unit, 
-                              float_class=float_class, int_class=int_class,
-                              dt_fmt_str=dt_fmt_str, dayfirst=dayfirst, yearfirst=yearfirst)
+    def converter(datetime_obj):
+        if not is_array_type:
+            if isinstance(datetime_obj, (list, tuple)):
+                return [conversion_func(obj, *conversion_args) for obj in datetime_obj]
+            if isinstance(datetime_obj, np.ndarray):
+                if dt64_array_func is not None and datetime_obj.dtype.kind == "M":
+                    return dt64_array_func(datetime_obj, unit, float_class, dt_fmt_str)
+                converted = np.empty(datetime_obj.size, dtype=object)
+                for pos, obj in enumerate(datetime_obj.ravel()):
+                    converted[pos] = conversion_func(obj, *conversion_args)
+                return converted.reshape(datetime_obj.shape)
+        return conversion_func(datetime_obj, *conversion_args)
     
+    return converter
+
+
+@lru_cache(maxsize=256)
+def _cached_converter(from_type, convert_to, unit, float_class, int_class, dt_fmt_str, dayfirst, yearfirst):
+    """
+    Cached 'make_converter', keeping one conversion plan per option set.
+    """
+    return make_converter(from_type, convert_to, unit, float_class, int_class,
+                          dt_fmt_str, dayfirst, yearfirst)
         
 # Auxiliary functions #
 #---------------------#
@@ -699,7 +1311,7 @@ def _total_dt_unit(datetime_obj, unit, float_class=None, int_class=None):
     #######################
     
     unit_factor = UNIT_FACTOR_DICT.get(unit)
-    obj_type = get_type_str(datetime_obj, lowercase=True)    
+    obj_type = type_key(datetime_obj)
     try:
         conversion_func = _TOTAL_TIME_UNIT_DICT.get(obj_type)
         if conversion_func is None:
@@ -710,25 +1322,29 @@ def _total_dt_unit(datetime_obj, unit, float_class=None, int_class=None):
         
         
 # Array-like complex data #
-def _total_dt_complex_data(datetime_obj, int_class, unit_factor):
+def _total_dt_complex_data(datetime_obj, unit, float_class):
     """
     Calculate total time in a given unit for complex data types,
-    such as Series and DataFrames, by converting all values to float.
+    such as Series and DataFrames, converting whole columns at once.
+    
+    Each column is normalised to naive datetime64 (see '_column_to_datetime64'),
+    its int64 values are scaled to `unit` in one multiplication, and NaT
+    values become NaN. Only the datetime-typed columns of a DataFrame are
+    converted, the rest being kept as they are.
 
     Parameters
     ----------
     datetime_obj : pandas.{DataFrame, Series}
         The complex data object to be processed.
-    int_class : str
-        Specifies the precision class to use for integer results.
-    unit_factor : str
-        The factor by which to multiply the converted values to get the
-        total time in the specified unit.
+    unit : str
+        The time unit of the totals, elapsed since the Unix epoch.
+    float_class : str | numpy float class
+        Specifies the precision class to use for the results.
 
     Returns
     -------
     pd.Series or pd.DataFrame
-        The input data object with all values converted to total time in the specified unit.
+        The input data object with its date/time values converted to total time in the specified unit.
 
     Raises
     ------
@@ -737,29 +1353,68 @@ def _total_dt_complex_data(datetime_obj, int_class, unit_factor):
         `Series` or `DataFrame` type objects.
     """
     # Input validation #
+    import pandas as pd
     current_function = get_func_name()
     
     # Operations #
-    dt_obj_aux = datetime_obj.copy()
-    
     if isinstance(datetime_obj, pd.Series):
         try:
-            return dt_obj_aux.astype(int_class) * unit_factor
-        except (ValueError, Exception) as err:
+            return _column_total_dt_unit(datetime_obj, unit, float_class)
+        except Exception as err:
             raise RuntimeError(f"Error in '{current_function}' function "
                                f"for 'Series' type object:\n{err}.")
 
     elif isinstance(datetime_obj, pd.DataFrame):
         try:
+            dt_obj_aux = datetime_obj.copy()
             for col in datetime_obj.columns:
-                try:
-                    dt_obj_aux[col] = dt_obj_aux[col].astype(int_class) * unit_factor
-                except ValueError:
-                    pass
+                if _is_datetime_column(datetime_obj[col]):
+                    dt_obj_aux[col] = _column_total_dt_unit(datetime_obj[col], unit, float_class)
             return dt_obj_aux
         except Exception as err:
             raise RuntimeError(f"Error in '{current_function}' function "
                                f"for 'DataFrame' type object:\n{err}.")
+            
+
+def _column_total_dt_unit(series, unit, float_class):
+    """
+    Time elapsed since the Unix epoch in `unit` for a Series of date/time values.
+    """
+    import pandas as pd
+    dt_arr = _column_to_datetime64(series).to_numpy()
+    col_unit = np.datetime_data(dt_arr.dtype)[0]
+    
+    totals = dt_arr.view(np.int64) * (NS_PER_UNIT[col_unit] / NS_PER_UNIT[unit])
+    is_nat = np.isnat(dt_arr)
+    if is_nat.any():
+        totals[is_nat] = np.nan
+    return pd.Series(totals.astype(float_class), index=series.index, name=series.name)
+
+
+def _column_to_datetime64(series, unit=None):
+    """
+    Normalise a Series of date/time values to naive datetime64 at once.
+    
+    Time zone aware columns lose their time zone with ``tz_localize(None)``
+    (keeping the wall time), numeric columns are read as epoch numbers
+    in `unit` (seconds by default), and object columns of Python
+    date/time objects or strings are converted in a single
+    ``pandas.to_datetime`` call.
+    """
+    import pandas as pd
+    if not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            series = pd.to_datetime(series, unit=unit or "s")
+        else:
+            try:
+                series = pd.to_datetime(series)
+            except ValueError:
+                # Mixed time zones: strip them value by value
+                series = pd.to_datetime(series.map(_tzinfo_remover))
+    
+    if getattr(series.dtype, "tz", None) is not None:
+        series = series.dt.tz_localize(None)
+    return series
 
 
 # Timezone aware information #
@@ -793,6 +1448,10 @@ def _to_string(dt_obj, unit, dt_fmt_str):
     Converts a datetime-like object to its string representation. 
     Handles various datetime types including pd.DataFrame, pd.Series, 
     np.ndarray, np.datetime64, and datetime.datetime.
+    
+    Arrays, Series and DataFrame columns are formatted as a whole
+    (see '_format_dt64_array'), not value by value. Only the datetime-typed
+    columns of a DataFrame are formatted, the rest being kept as they are.
 
     Parameters
     ----------
@@ -801,11 +1460,12 @@ def _to_string(dt_obj, unit, dt_fmt_str):
     dt_fmt_str : str
         Format string for the string representation.
     unit : str, optional
-        Time unit for np.datetime64 conversion if applicable.
+        Time unit for np.datetime64 conversion if applicable,
+        and of the epoch numbers of numeric arrays.
 
     Returns
     -------
-    str | pd.DataFrame | pd.Series
+    str | np.ndarray | pd.DataFrame | pd.Series
         The string representation, or object with string values.
     """
     
@@ -820,31 +1480,78 @@ def _to_string(dt_obj, unit, dt_fmt_str):
 
     # Handle np.ndarray with datetime-like objects
     if isinstance(dt_obj, np.ndarray):
+        import pandas as pd
         try:
-            dt_obj = np.vectorize(lambda x: _to_datetime_aux(x, unit).strftime(dt_fmt_str))(dt_obj)
+            if dt_obj.dtype.kind == "M":
+                return _format_dt64_array(dt_obj, dt_fmt_str)
+            elif dt_obj.dtype.kind in "iuf":
+                dt_arr = pd.to_datetime(dt_obj.ravel(), unit=unit).to_numpy()
+                return _format_dt64_array(dt_arr, dt_fmt_str).reshape(dt_obj.shape)
+            else:
+                dt_strs = _format_dt_column(pd.Series(dt_obj.ravel()), dt_fmt_str)
+                return np.asarray(dt_strs, dtype=str).reshape(dt_obj.shape)
         except Exception as e:
             raise ValueError(f"Error in converting np.ndarray to string: {e}")
-        return dt_obj
 
     # Handle pd.Series
-    if isinstance(dt_obj, pd.Series):
+    if is_pandas_instance(dt_obj, "Series"):
         try:
-            return dt_obj.apply(lambda dfs_col: dfs_col.strftime(dt_fmt_str)
-                                if hasattr(dfs_col, 'strftime') else str(dfs_col))
+            return _format_dt_column(dt_obj, dt_fmt_str)
         except Exception as e:
             raise ValueError(f"Error in converting pd.Series to string: {e}")
 
     # Handle pd.DataFrame
-    if isinstance(dt_obj, pd.DataFrame):
+    if is_pandas_instance(dt_obj, "DataFrame"):
         try:
-            return dt_obj.map(lambda df_col: df_col.strftime(dt_fmt_str)
-                              if hasattr(df_col, 'strftime') else str(df_col))
+            dt_obj_aux = dt_obj.copy()
+            for col in dt_obj.columns:
+                if _is_datetime_column(dt_obj[col]):
+                    dt_obj_aux[col] = _format_dt_column(dt_obj[col], dt_fmt_str)
+            return dt_obj_aux
         except Exception as e:
             raise ValueError(f"Error in converting pd.DataFrame to string: {e}")
 
     # Default case
     else:
         return str(dt_obj)
+    
+    
+def _is_datetime_column(series):
+    """
+    Check whether a Series holds date/time values, either with a datetime64
+    dtype (time zone aware or not) or as Python datetime objects.
+    """
+    import pandas as pd
+    return (pd.api.types.is_datetime64_any_dtype(series.dtype)
+            or (series.dtype == object 
+                and pd.api.types.infer_dtype(series, skipna=True) == "datetime"))
+
+
+def _format_dt_column(series, dt_fmt_str):
+    """
+    Format a Series of date/time values into strings at once.
+    
+    Naive datetime64 columns, and object columns of naive datetimes,
+    are formatted by '_format_dt64_array'; time zone aware ones through
+    ``Series.dt.strftime``, missing values being rendered as 'NaT' in both
+    cases. Other columns keep the per-value conversion, formatting the
+    values that can be and turning the rest into strings.
+    """
+    import pandas as pd
+    if series.dtype == object and _is_datetime_column(series):
+        try:
+            series = pd.to_datetime(series)
+        except (ValueError, TypeError):
+            pass
+    
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        if getattr(series.dtype, "tz", None) is not None:
+            return series.dt.strftime(dt_fmt_str).where(series.notna(), "NaT")
+        dt_strs = _format_dt64_array(series.to_numpy(), dt_fmt_str)
+        return pd.Series(dt_strs, index=series.index, name=series.name, dtype=object)
+    
+    return series.apply(lambda value: value.strftime(dt_fmt_str)
+                        if hasattr(value, 'strftime') else str(value))
 
 
 def _to_float(dt_obj, unit=None, float_class=None):
@@ -865,9 +1572,11 @@ def _to_float(dt_obj, unit=None, float_class=None):
     float
         The converted value in the specified unit.
     """
-    obj_type = get_type_str(dt_obj, lowercase=True)
-    if obj_type == "datetime64":
-        return dt_obj.astype(f"timedelta64[{unit}]").astype(float_class) if unit and float_class else dt_obj.astype(float)
+    obj_type = type_key(dt_obj)
+    if obj_type in ("series", "dataframe"):
+        return _total_dt_complex_data(dt_obj, unit or "s", float_class or "d")
+    elif obj_type == "datetime64":
+        return _dt64_to_float(dt_obj, unit or "s", float_class or "d")
     elif obj_type == "time": # datetime.time
         return __time_component_to_float(dt_obj)
     if hasattr(dt_obj, 'timestamp'):
@@ -875,6 +1584,15 @@ def _to_float(dt_obj, unit=None, float_class=None):
     return float(dt_obj.float_timestamp)  # arrow
 
 
+def _dt64_to_float(dt_obj, unit, float_class):
+    """
+    Convert datetime64 objects (scalars or arrays) to the time elapsed
+    since the Unix epoch in the specified unit, whatever their own unit.
+    NaT values become NaN.
+    """
+    return ((dt_obj - np.datetime64(0, "s")) / np.timedelta64(1, unit)).astype(float_class)
+
+
 def __time_component_to_float(t):
     """
     Convert a time object to seconds since Unix epoch start.
@@ -919,18 +1637,18 @@ def _to_datetime(dt_obj, unit=None):
     Since the date is arbitrary, then to maintain some organisation,
     the current date will be placed in its date part.
     """
-    obj_type = get_type_str(dt_obj, lowercase=True)
+    obj_type = type_key(dt_obj)
     
-    # Array-like with datetime-like values
+    # Array-like with datetime-like values, normalised column by column
     if obj_type == "dataframe":
-        return dt_obj.map(lambda df_col: _to_datetime_aux(df_col, unit))
+        return dt_obj.apply(lambda df_col: _column_to_datetime64(df_col, unit))
     elif obj_type == "time":
         current_date = datetime.today().date()
         return datetime(current_date.year, current_date.month, current_date.day,
                         dt_obj.hour, dt_obj.minute, dt_obj.second, dt_obj.microsecond)
         
     elif obj_type == "series":
-        return dt_obj.apply(lambda df_col: _to_datetime_aux(df_col, unit))
+        return _column_to_datetime64(dt_obj, unit)
     
     # Handle scalar values
     else:
@@ -964,6 +1682,7 @@ def _to_datetime_aux(dt_obj, unit):
     datetime
         The converted Python datetime object.
     """
+    import pandas as pd
     return pd.to_datetime(dt_obj, unit=unit).to_pydatetime()
 
 
@@ -1008,6 +1727,7 @@ def _to_pandas(dt_obj, unit, dayfirst=False, yearfirst=False):
     pd.Timestamp
         The converted pandas Timestamp object.
     """
+    import pandas as pd
     return pd.to_datetime(_to_datetime(dt_obj), unit=unit, dayfirst=dayfirst, yearfirst=yearfirst)
 
 def _to_numpy(dt_obj, unit=None):
@@ -1058,6 +1778,65 @@ def _to_arrow(dt_obj):
 _FLOAT_CLASS_LIST = [np.float16, np.float32, "f", np.float64, "float", "d", np.float128]
 _INT_CLASS_LIST = [np.int8, np.int16, "i", np.float32, "int", np.int64]
 
+# String parsing #
+#----------------#
+
+# Array-like inputs parsed at once #
+ARRAY_LIKE_STR_TYPES = ["list", "tuple", "ndarray", "series"]
+
+# Modules parsing without a format string #
+FORMAT_INFERENCE_MODULES = ["pandas", "dateutil"]
+
+# Format inference for columns of strings #
+FORMAT_INFERENCE_SAMPLE_SIZE = 50
+FORMAT_INFERENCE_CACHE_SIZE = 256
+_FORMAT_INFERENCE_CACHE = OrderedDict()
+
+# Digits and letters are masked to get the shape of a value #
+VALUE_SHAPE_TABLE = str.maketrans("0123456789"
+                                  "abcdefghijklmnopqrstuvwxyz"
+                                  "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                                  "0" * 10 + "a" * 52)
+
+# Strict ISO 8601 format strings and their directives' patterns #
+ISO_8601_FORMATS = ["%Y-%m-%d"] + [
+    f"%Y-%m-%d{sep}{time_fmt}"
+    for sep in ["T", " "]
+    for time_fmt in ["%H:%M", "%H:%M:%S", "%H:%M:%S.%f"]
+]
+
+ISO_DIRECTIVE_PATTERNS = {
+    "%Y": r"\d{4}",
+    "%m": r"\d{2}",
+    "%d": r"\d{2}",
+    "%H": r"\d{2}",
+    "%M": r"\d{2}",
+    "%S": r"\d{2}",
+    "%f": r"(?:\d{3}|\d{6})"
+}
+
+# Floated time conversion #
+#-------------------------#
+
+# Nanoseconds per fixed-length time unit #
+NS_PER_UNIT = {
+    "D": 86_400 * 10**9,
+    "h": 3_600 * 10**9,
+    "m": 60 * 10**9,
+    "s": 10**9,
+    "ms": 10**6,
+    "us": 10**3,
+    "ns": 1
+}
+
+# Resolution of floated times for each fractional precision #
+FRAC_PRECISION_UNITS = ["s", "ms", "ms", "ms", "us", "us", "us", "ns", "ns", "ns"]
+
+# Zero-padded width of the numeric directives formatted without strftime #
+FIELD_DIRECTIVE_WIDTHS = {
+    "%Y": 4, "%y": 2, "%m": 2, "%d": 2, "%H": 2, "%M": 2, "%S": 2, "%f": 6
+}
+
 # Switch case dictionaries #
 #--------------------------#
 
@@ -1069,8 +1848,8 @@ _INT_CLASS_LIST = [np.int8, np.int16, "i", np.float32, "int", np.int64]
 
 TIME_STR_PARSING_DICT = {
     "datetime" : lambda datetime_str, dt_fmt_str: datetime.strptime(datetime_str, dt_fmt_str),
-    "dateutil" : lambda datetime_str, dt_fmt_str: parse(datetime_str),
-    "pandas"   : lambda datetime_str, dt_fmt_str, unit, dayfirst=False, yearfirst=False : pd.to_datetime(datetime_str, format=dt_fmt_str, dayfirst=dayfirst, yearfirst=yearfirst),
+    "dateutil" : lambda datetime_str, dt_fmt_str: import_module("dateutil.parser").parse(datetime_str),
+    "pandas"   : lambda datetime_str, dt_fmt_str, unit, dayfirst=False, yearfirst=False : import_module("pandas").to_datetime(datetime_str, format=dt_fmt_str, dayfirst=dayfirst, yearfirst=yearfirst, cache=True),
     "numpy"    : lambda datetime_str, _, unit : np.datetime64(datetime_str, unit),
     "arrow"    : lambda datetime_str, dt_fmt_str: _arrow_get_with_import(datetime_str, dt_fmt_str)
 }
@@ -1081,7 +1860,7 @@ TIME_STR_PARSING_DICT = {
 FLOATED_TIME_PARSING_DICT = {
     "datetime" : lambda floated_time, unit, dayfirst=False, yearfirst=False : datetime.fromtimestamp(floated_time),
     "time"     : lambda floated_time, unit, dayfirst=False, yearfirst=False : datetime(*tuple(time.localtime(floated_time))[:6]),
-    "pandas"   : lambda floated_time, unit, dayfirst=False, yearfirst=False : pd.to_datetime(floated_time, unit=unit, dayfirst=dayfirst, yearfirst=yearfirst),
+    "pandas"   : lambda floated_time, unit, dayfirst=False, yearfirst=False : import_module("pandas").to_datetime(floated_time, unit=unit, dayfirst=dayfirst, yearfirst=yearfirst),
     "numpy"    : lambda floated_time, unit, dayfirst=False, yearfirst=False : np.datetime64(floated_time, unit),
     "arrow"    : lambda floated_time, unit, dayfirst=False, yearfirst=False : _arrow_get_with_import(floated_time)
 }
@@ -1139,7 +1918,7 @@ ARROW_OBJ_CONVERSION_DICT = {
 TIME_STT_OBJ_CONVERSION_DICT = {
     "float"    : lambda dt_obj, unit, float_class, __, ___, _____, ______ : _to_float(dt_obj, unit, float_class),
     "datetime" : lambda dt_obj, unit, __, ___, ____, _____, ______ : _to_datetime(dt_obj, unit),
-    "pandas"   : lambda dt_obj, unit, __, ___, ____, _____, ______ : pd.Timestamp(*dt_obj[:6], unit=unit),
+    "pandas"   : lambda dt_obj, unit, __, ___, ____, _____, ______ : import_module("pandas").Timestamp(*dt_obj[:6], unit=unit),
     "numpy"    : lambda dt_obj, unit, __, ___, ____, _____, ______ : np.datetime64(datetime(*dt_obj[:6]), unit),
     "arrow"    : lambda dt_obj, _, __, ___, ____, _____, ______ : _to_arrow(dt_obj),
 }
@@ -1163,14 +1942,25 @@ CONVERSION_OPT_DICT = {
     "ndarray": _DT_LIKE_OBJ_CONVERSION_DICT
 } 
 
+# Arrays of datetime64 objects, converted at once #
+DT64_ARRAY_CONVERSION_DICT = {
+    "float"    : lambda dt_arr, unit, float_class, _ : _dt64_to_float(dt_arr, unit, float_class),
+    "datetime" : lambda dt_arr, _, __, ___ : dt_arr.astype("datetime64[us]").astype(object),
+    "pandas"   : lambda dt_arr, _, __, ___ : import_module("pandas").DatetimeIndex(dt_arr.ravel()),
+    "str"      : lambda dt_arr, _, __, dt_fmt_str : _format_dt64_array(dt_arr, dt_fmt_str)
+}
+
+# Object types holding several date/time objects #
+ARRAY_LIKE_DT_TYPES = ["dataframe", "series", "ndarray"]
+
 # Exclusively to floated time #
 _TOTAL_TIME_UNIT_DICT = {
     "datetime"    : lambda dt_obj, _, __, ___, ____ : dt_obj.timestamp(),
-    "datetime64"  : lambda dt_obj, unit, float_class, _, __ : dt_obj.astype(f"timedelta64[{unit}]").astype(float_class),
+    "datetime64"  : lambda dt_obj, unit, float_class, _, __ : _dt64_to_float(dt_obj, unit, float_class),
     "struct_time" : lambda dt_obj, _, __, ___, ____ : datetime(*dt_obj[:6]),
     "arrow"       : lambda dt_obj, _, __, ___, ____ : dt_obj.float_timestamp,
-    "dataframe"   : lambda dt_obj, _, __, int_class, unit_factor : _total_dt_complex_data(dt_obj, int_class, unit_factor),
-    "series"      : lambda dt_obj, _, __, int_class, unit_factor : _total_dt_complex_data(dt_obj, int_class, unit_factor),
+    "dataframe"   : lambda dt_obj, unit, float_class, _, __ : _total_dt_complex_data(dt_obj, unit, float_class),
+    "series"      : lambda dt_obj, unit, float_class, _, __ : _total_dt_complex_data(dt_obj, unit, float_class),
     "ndarray"     : lambda dt_obj, unit, float_class, _, __ : dt_obj.astype(f"datetime64[{unit}]").astype(float_class)  
 }
 
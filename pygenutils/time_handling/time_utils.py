@@ -11,17 +11,18 @@ Shared time utilities to avoid circular imports.
 
 # Standard modules #
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 
 # Third-party modules #
 import numpy as np
-import pandas as pd
 
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from filewise.general.introspection_utils import get_type_str
+from pygenutils._lazy_imports import is_pandas_instance
+from pygenutils._type_dispatch import type_key
 
 #------------------#
 # Define functions #
@@ -49,10 +50,10 @@ def get_datetime_object_unit(dt_obj):
     TypeError
         If the input is not a supported datetime object type.
     """
-    if isinstance(dt_obj, (datetime, time)):
-        return "us"  # datetime objects use microsecond precision
-    elif isinstance(dt_obj, pd.Timestamp):
+    if is_pandas_instance(dt_obj, "Timestamp"):
         return "ns"  # pandas timestamps use nanosecond precision
+    elif isinstance(dt_obj, datetime):
+        return "us"  # datetime objects use microsecond precision
     elif isinstance(dt_obj, np.datetime64):
         # Extract unit from dtype string (e.g., "datetime64[ns]" -> "ns")
         dtype_str = str(dt_obj.dtype)
@@ -64,103 +65,96 @@ def get_nano_datetime(t=None, module="datetime"):
     """
     Get the current or specified time in nanoseconds, formatted as a datetime string.
     
+    The time is kept as an integer number of nanoseconds throughout and split
+    into seconds and nanoseconds with divmod; the date/time part of each
+    second is formatted once and cached, so the function is cheap enough
+    for high-frequency event logging.
+    
     Parameters
     ----------
     t : int | float | None, optional
-        Time value in nanoseconds. If None, the current time is used.
+        Time since the Unix epoch. Integers are nanoseconds (as returned by
+        time.time_ns) and floats are seconds (as returned by time.time).
+        If None, the current time is used.
     module : {"datetime", "time", "pandas", "numpy", "arrow"}, default "datetime"
-        Module used to parse the floated time.
+        Module whose convention is followed: local time for all of them
+        except 'arrow', which gives UTC time.
 
     Returns
     -------
     nano_dt_str : str
-        The formatted datetime string with nanoseconds.
+        The formatted datetime string with nanoseconds,
+        e.g. '2024-10-19T17:54:00.123456789'.
+        
+    See Also
+    --------
+    get_nano_datetime_array : the same for arrays of nanosecond timestamps.
     """
-    if t is not None and not isinstance(t, (float, int)):
-        raise TypeError("Time value must either be integer or float.")
-    
     # Use current time if none is provided
     if t is None:
-        t = time.time_ns()  # Get current time in nanoseconds
+        t = time.time_ns()
+    elif isinstance(t, float):
+        t = _float_seconds_to_ns(t)
+    elif not isinstance(t, (int, np.integer)):
+        raise TypeError("Time value must either be integer or float.")
     
-    # Ensure we handle floating-point times by converting to int
-    if isinstance(t, float):
-        t = int(str(t).replace(".", ""))
-        
-    floated_nanotime_str = _nano_floated_time_str(t)
-    nano_dt_str = _convert_floated_time_to_datetime(floated_nanotime_str, module)
-    return nano_dt_str
+    seconds, nanoseconds = divmod(int(t), NS_PER_SECOND)
+    return f"{_format_epoch_second(seconds, module)}.{nanoseconds:09d}"
 
-def _convert_floated_time_to_datetime(floated_time, module):
-    """
-    Convert a floated time value to a datetime object with nanosecond precision.
 
+def get_nano_datetime_array(t_ns, module="datetime"):
+    """
+    Format an array of nanosecond timestamps as datetime strings.
+    
     Parameters
     ----------
-    floated_time : float | int
-        The floated time value to be converted.
-    module : str
-        Module used to parse the floated time.
+    t_ns : array-like of int
+        Nanoseconds since the Unix epoch, converted to int64.
+    module : {"datetime", "time", "pandas", "numpy", "arrow"}, default "datetime"
+        As in 'get_nano_datetime'.
 
     Returns
     -------
-    nano_dt_str : str
-        The formatted datetime string with nanoseconds.
+    numpy.ndarray
+        Strings in the format of 'get_nano_datetime'.
     """
-    # Convert to float if input is a string
-    if isinstance(floated_time, str):
-        floated_time = np.float128(floated_time)
-        
-    # Split into seconds and nanoseconds
-    seconds = int(floated_time)
-    nanoseconds = int((floated_time - seconds) * 1_000_000_000)
-
-    # Convert the seconds part into a datetime object using the specified module
-    if module == "datetime":
-        dt = datetime.fromtimestamp(seconds)
-    elif module == "pandas":
-        dt = pd.Timestamp.fromtimestamp(seconds).to_pydatetime()
-    elif module == "numpy":
-        dt = pd.Timestamp.fromtimestamp(seconds).to_pydatetime()  # Convert via pandas for compatibility
-    elif module == "arrow":
-        try:
-            import arrow
-        except ImportError:
-            raise ImportError("arrow package is required for arrow module conversion. Install with: pip install arrow")
-        dt = arrow.get(seconds).datetime
-    elif module == "time":
-        dt = datetime.fromtimestamp(seconds)  # time module uses same as datetime
-    else:
+    if module not in NANO_DATETIME_MODULES:
         raise ValueError(f"Unsupported module: {module}")
+        
+    t_ns = np.asarray(t_ns, dtype=np.int64)
+    if module == "arrow":
+        return np.datetime_as_string(t_ns.view("datetime64[ns]"), unit="ns")
     
-    # Add the nanoseconds part and return the formatted string
-    dt_with_nanos = dt + timedelta(microseconds=nanoseconds / 1_000)
-    dt_with_nanos_str = datetime_obj_converter(dt_with_nanos, 
-                                               convert_to="str",
-                                               dt_fmt_str='%FT%T')
-    nano_dt_str = f"{dt_with_nanos_str}.{nanoseconds:09d}"
-    return nano_dt_str
+    # Local offsets, looked up once per distinct second
+    seconds = t_ns // NS_PER_SECOND
+    unique_seconds, inverse = np.unique(seconds, return_inverse=True)
+    offsets = np.array([time.localtime(second).tm_gmtoff for second in unique_seconds.tolist()],
+                       dtype=np.int64)
+    
+    local_ns = t_ns + offsets[inverse.reshape(t_ns.shape)] * NS_PER_SECOND
+    return np.datetime_as_string(local_ns.view("datetime64[ns]"), unit="ns")
+
 
-def _nano_floated_time_str(time_ns):
+def _float_seconds_to_ns(t):
+    """
+    Convert a float number of seconds to integer nanoseconds,
+    splitting off the whole seconds first so that the fraction is exact.
     """
-    Convert a time value in nanoseconds to a formatted floating-point time string.
+    seconds = int(t // 1)
+    return seconds * NS_PER_SECOND + round((t - seconds) * NS_PER_SECOND)
 
-    Parameters
-    ----------
-    time_ns : int
-        Time value in nanoseconds.
 
-    Returns
-    -------
-    str
-        The floating-point time string with nanosecond precision.
+@lru_cache(maxsize=1024)
+def _format_epoch_second(seconds, module):
     """
-    # Convert nanoseconds to seconds and nanoseconds parts
-    seconds = time_ns // 1_000_000_000
-    nanoseconds = time_ns % 1_000_000_000
+    Date and time part of a timestamp, down to the second,
+    in local time or in UTC for the 'arrow' module.
+    """
+    if module not in NANO_DATETIME_MODULES:
+        raise ValueError(f"Unsupported module: {module}")
+    time_struct = time.gmtime(seconds) if module == "arrow" else time.localtime(seconds)
+    return time.strftime(NANO_DATETIME_FMT_STR, time_struct)
 
-    # Format the floating-point time with nanosecond precision
-    return f"{seconds}.{nanoseconds:09d}"
 
 def datetime_obj_converter(datetime_obj,
                            convert_to,
@@ -218,8 +212,8 @@ def datetime_obj_converter(datetime_obj,
     if not convert_to:
         raise ValueError("Argument 'convert_to' not provided.")
     
-    # Get the object type's name
-    obj_type = get_type_str(datetime_obj, lowercase=True)
+    # Get the object type's key
+    obj_type = type_key(datetime_obj)
     
     # Convert to string if requested
     if convert_to == "str":
@@ -229,19 +223,20 @@ def datetime_obj_converter(datetime_obj,
     
     # Convert to datetime if requested
     if convert_to == "datetime":
+        if is_pandas_instance(datetime_obj, "Timestamp"):
+            return datetime_obj.to_pydatetime()
         if isinstance(datetime_obj, datetime):
             return datetime_obj
-        if isinstance(datetime_obj, pd.Timestamp):
-            return datetime_obj.to_pydatetime()
         if isinstance(datetime_obj, np.datetime64):
-            return pd.Timestamp(datetime_obj).to_pydatetime()
-        # Check if the object is an Arrow object using string comparison to avoid import
+            return datetime_obj.astype("datetime64[us]").item()
+        # Check if the object is an Arrow object through its type key, to avoid importing arrow
         if obj_type == "arrow":
             return datetime_obj.datetime
         raise ValueError(f"Cannot convert {obj_type} to datetime")
     
     # Convert to pandas Timestamp if requested
     if convert_to == "timestamp":
+        import pandas as pd
         if isinstance(datetime_obj, pd.Timestamp):
             return datetime_obj
         if isinstance(datetime_obj, datetime):
@@ -256,7 +251,7 @@ def datetime_obj_converter(datetime_obj,
     if convert_to == "datetime64":
         if isinstance(datetime_obj, np.datetime64):
             return datetime_obj.astype(f'datetime64[{unit}]')
-        if isinstance(datetime_obj, (datetime, pd.Timestamp)):
+        if isinstance(datetime_obj, datetime):
             return np.datetime64(datetime_obj, unit)
         if obj_type == "arrow":
             return np.datetime64(datetime_obj.datetime, unit)
@@ -271,12 +266,12 @@ def datetime_obj_converter(datetime_obj,
         
         if obj_type == "arrow":
             return datetime_obj
+        if is_pandas_instance(datetime_obj, "Timestamp"):
+            return arrow.get(datetime_obj.to_pydatetime())
         if isinstance(datetime_obj, datetime):
             return arrow.get(datetime_obj)
-        if isinstance(datetime_obj, pd.Timestamp):
-            return arrow.get(datetime_obj.to_pydatetime())
         if isinstance(datetime_obj, np.datetime64):
-            return arrow.get(pd.Timestamp(datetime_obj).to_pydatetime())
+            return arrow.get(datetime_obj.astype("datetime64[us]").item())
         raise ValueError(f"Cannot convert {obj_type} to arrow")
     
     # Convert to float if requested
@@ -328,3 +323,12 @@ def datetime_obj_converter(datetime_obj,
             return np.dtype(int_class).type(timestamp)
     
     raise ValueError(f"Unsupported conversion target: {convert_to}") 
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Nanosecond timestamps #
+NS_PER_SECOND = 1_000_000_000
+NANO_DATETIME_FMT_STR = "%Y-%m-%dT%H:%M:%S"
+NANO_DATETIME_MODULES = ["datetime", "time", "pandas", "numpy", "arrow"]
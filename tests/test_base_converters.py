@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import random
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases.base_converters import (
+    arbitrary2dec,
+    base2bin_array,
+    base2hex_array,
+    base2oct_array,
+    bin2dec_array,
+    convert_among_arbitraries,
+    hex2dec_array
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Vectorised base conversions #
+#-----------------------------#
+
+VALUES = np.array([0, 1, 5, 10, 255, 2**32 + 7, 2**64 - 1], dtype=np.uint64)
+
+
+def test_base2x_array_match_python_formatting():
+    bin_strs = base2bin_array(VALUES, zero_pad=0)
+    oct_strs = base2oct_array(VALUES, zero_pad=0)
+    hex_strs = base2hex_array(VALUES, zero_pad=0)
+
+    width = len(bin_strs[0])
+    assert bin_strs.tolist() == [format(int(value), f"0{width}b") for value in VALUES]
+    assert [int(oct_str, 8) for oct_str in oct_strs] == VALUES.tolist()
+    assert [int(hex_str, 16) for hex_str in hex_strs] == VALUES.tolist()
+    assert base2hex_array([255], uppercase=True).tolist() == ["00FF"]
+
+
+def test_array_round_trips():
+    assert bin2dec_array(base2bin_array(VALUES)).tolist() == VALUES.tolist()
+    assert bin2dec_array(base2bin_array(VALUES, output="bits")).tolist() == VALUES.tolist()
+    assert hex2dec_array(base2hex_array(VALUES)).tolist() == VALUES.tolist()
+
+
+def test_array_prefixes_and_padding():
+    assert bin2dec_array(np.array(["0b101", "11", "0B1"])).tolist() == [5, 3, 1]
+    assert hex2dec_array(np.array(["0xff", "A", "0X10"])).tolist() == [255, 10, 16]
+
+
+@pytest.mark.parametrize("converter, strings", [
+    (bin2dec_array, ["102"]),
+    (bin2dec_array, ["10é"]),
+    (hex2dec_array, ["fg"]),
+    (hex2dec_array, ["ffü"]),
+    (bin2dec_array, ["1" * 65]),
+    (hex2dec_array, ["1" * 17]),
+])
+def test_array_invalid_digits_raise_value_error(converter, strings):
+    with pytest.raises(ValueError):
+        converter(np.array(strings))
+
+
+def test_array_rejects_negative_values():
+    with pytest.raises(ValueError):
+        base2bin_array(np.array([-1]))
+
+# Arbitrary base conversions of very large integers #
+#---------------------------------------------------#
+
+DIGIT_CHARS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _reference_base_str(n, base):
+    """Schoolbook rendering, quadratic but independent of the tested code."""
+    if n == 0:
+        return "0"
+    sign, n = ("-", -n) if n < 0 else ("", n)
+    chunk_digits = 50
+    chunk_base = base ** chunk_digits
+    chunks = []
+    while n:
+        n, chunk = divmod(n, chunk_base)
+        chunks.append(chunk)
+    
+    def render(chunk, width):
+        digits = []
+        while chunk:
+            chunk, digit = divmod(chunk, base)
+            digits.append(DIGIT_CHARS[digit])
+        return "".join(reversed(digits)).rjust(width, "0")
+    
+    return sign + render(chunks[-1], 0) + "".join(render(chunk, chunk_digits)
+                                                  for chunk in reversed(chunks[:-1]))
+
+
+@pytest.mark.parametrize("n_bits", [1, 64, 5_000, 60_000])
+@pytest.mark.parametrize("base, target_base", [(10, 2), (3, 10), (16, 36), (7, 8), (36, 5)])
+def test_convert_among_arbitraries_large_integers(n_bits, base, target_base):
+    rng = random.Random(n_bits * base + target_base)
+    n = rng.getrandbits(n_bits) * rng.choice([-1, 1])
+    x_str = _reference_base_str(n, base)
+
+    # Beyond the default str/int conversion digit limit for the largest inputs
+    assert arbitrary2dec(x_str, base) == n
+    assert convert_among_arbitraries(x_str, base) == n
+    assert convert_among_arbitraries(x_str, base, target_base=target_base) \
+           == _reference_base_str(n, target_base)
+    assert convert_among_arbitraries(n, None, target_base=base) == x_str
+
+
+def test_convert_among_arbitraries_prefixes_and_errors():
+    assert convert_among_arbitraries("0xff", 16, target_base=2) == "11111111"
+    assert convert_among_arbitraries("-0", 10, target_base=3) == "0"
+    for bad_base in [1, 37, 2.0]:
+        with pytest.raises(ValueError):
+            arbitrary2dec("10", bad_base)
+    with pytest.raises(ValueError):
+        arbitrary2dec("19", 8)
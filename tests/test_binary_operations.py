@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import struct
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases.binary_operations import (
+    buffer_to_array,
+    buffer_to_str_chunks,
+    str_to_buffer,
+    struct_format_to_dtype,
+    unpack_records
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+def _flatten_record(record):
+    values = []
+    for field_name in record.dtype.names:
+        field_value = np.asarray(record[field_name]).tolist()
+        values.extend(field_value if isinstance(field_value, list) else [field_value])
+    return tuple(values)
+
+# Struct-formatted records #
+#--------------------------#
+
+RECORD_CASES = [
+    ("<Ih", [(7, -2), (8, 5)]),
+    ("<2ci", [(b"a", b"b", 3), (b"c", b"d", -4)]),
+    ("<c3xd", [(b"z", 1.5)]),
+    (">4s2H?", [(b"abcd", 1, 2, True), (b"wxyz", 3, 4, False)]),
+    ("@bq3f", [(-1, 2**40, 0.5, 1.0, 2.0)]),
+    ("=e2Bx", [(0.25, 1, 255)]),
+]
+
+
+@pytest.mark.parametrize("fmt, records", RECORD_CASES)
+def test_struct_format_to_dtype_matches_struct_layout(fmt, records):
+    record_dtype = struct_format_to_dtype(fmt)
+    assert record_dtype.itemsize == struct.calcsize(fmt)
+
+    raw = b"".join(struct.pack(fmt, *record) for record in records)
+    unpacked = unpack_records(raw, fmt)
+    expected = [struct.unpack(fmt, raw[pos:pos + struct.calcsize(fmt)])
+                for pos in range(0, len(raw), struct.calcsize(fmt))]
+    assert [_flatten_record(record) for record in unpacked] == expected
+
+
+def test_struct_format_to_dtype_names_and_errors():
+    assert struct_format_to_dtype("<Ih", names=["id", "flag"]).names == ("id", "flag")
+    with pytest.raises(ValueError):
+        struct_format_to_dtype("<Ih", names=["id"])
+    with pytest.raises(ValueError):
+        struct_format_to_dtype("<3p")
+
+
+def test_buffer_to_array_byte_order():
+    raw = struct.pack(">2H", 1, 256)
+    assert buffer_to_array(raw, dtype="uint16", byteorder=">").tolist() == [1, 256]
+    with pytest.raises(TypeError):
+        buffer_to_array("not a buffer")
+
+# Chunked text encoding #
+#-----------------------#
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16", "latin-1"])
+def test_str_buffer_round_trip(encoding):
+    text = "Café naïve " * 50 if encoding == "latin-1" else "Neño € \U0001F600 " * 50
+    written = str_to_buffer(text, encoding=encoding, chunk_size=7)
+    assert bytes(written) == text.encode(encoding)
+    assert "".join(buffer_to_str_chunks(written, encoding=encoding, chunk_size=5)) == text
+
+
+@pytest.mark.parametrize("encoding", ["unicode_escape", "raw_unicode_escape", "utf-32"])
+def test_str_to_buffer_grows_its_own_buffer(encoding):
+    text = "€\U0001F600" * 100
+    for chunk_size in (1, 7, 1 << 20):
+        assert bytes(str_to_buffer(text, encoding=encoding, chunk_size=chunk_size)) == text.encode(encoding)
+
+
+def test_str_to_buffer_given_buffer():
+    out = bytearray(16)
+    written = str_to_buffer("abc€", out=out)
+    assert bytes(written) == "abc€".encode() and written.obj is out
+    with pytest.raises(ValueError):
+        str_to_buffer("€" * 10, out=bytearray(16), encoding="unicode_escape")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases.bitwise_operators import (
+    bitwise_and,
+    bitwise_or,
+    bitwise_xor,
+    extract_bit_field,
+    is_bit_set,
+    leftwards_bitshift,
+    popcount,
+    rightwards_bitshift
+)
+from pygenutils.number_bases.base_converters import base2bin
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Bitwise operators #
+#-------------------#
+
+VALUES = np.array([0, 1, 5, 12, 255, 1023, 2**40 + 3], dtype=np.int64)
+OPERANDS = np.array([3, 6, 0, 10, 128, 512, 2**40], dtype=np.int64)
+
+OPERATOR_CASES = [
+    (bitwise_and, lambda a, b: a & b),
+    (bitwise_or, lambda a, b: a | b),
+    (bitwise_xor, lambda a, b: a ^ b),
+    (rightwards_bitshift, lambda a, b: a >> (b % 8)),
+    (leftwards_bitshift, lambda a, b: a << (b % 8)),
+]
+
+
+@pytest.mark.parametrize("operator, reference", OPERATOR_CASES)
+def test_operators_arrays_match_scalars(operator, reference):
+    second = OPERANDS % 8 if operator.__name__.endswith("bitshift") else OPERANDS
+    expected = [reference(int(a), int(b)) for a, b in zip(VALUES, OPERANDS)]
+
+    result = operator(VALUES, second)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == expected
+
+    scalar_results = [operator(int(a), int(b)) for a, b in zip(VALUES, second)]
+    assert [decimal for _, decimal in scalar_results] == expected
+    assert [binary for binary, _ in scalar_results] == [base2bin(value) for value in expected]
+
+
+def test_operators_broadcast_and_binary_rendering():
+    assert bitwise_and(VALUES, 1).tolist() == (VALUES & 1).tolist()
+    assert bitwise_or(5, 2, return_binary=False) == 7
+
+    binary, decimal = bitwise_xor(np.array([5, 6]), 3, return_binary=True)
+    assert decimal.tolist() == [6, 5]
+    assert list(binary) == [base2bin(6), base2bin(5)]
+
+# Bit inspection #
+#----------------#
+
+def test_popcount():
+    assert popcount(VALUES).tolist() == [bin(int(value)).count("1") for value in VALUES]
+    assert popcount(0b1011) == 3
+    assert popcount(-0b1011) == 3
+
+
+def test_is_bit_set():
+    bits = np.arange(12)
+    expected = [[bool(int(value) >> bit & 1) for bit in bits] for value in VALUES]
+    assert is_bit_set(VALUES[:, None], bits).tolist() == expected
+    assert is_bit_set(0b100, 2) is True
+    assert is_bit_set(0b100, 1) is False
+
+
+@pytest.mark.parametrize("start, width", [(0, 1), (2, 3), (5, 8), (60, 8), (0, 64), (70, 2)])
+def test_extract_bit_field(start, width):
+    expected = [(int(value) >> start) & ((1 << width) - 1) for value in VALUES]
+    assert extract_bit_field(VALUES, start, width).tolist() == expected
+    assert [extract_bit_field(int(value), start, width) for value in VALUES] == expected
+
+
+def test_extract_bit_field_invalid_arguments():
+    with pytest.raises(ValueError):
+        extract_bit_field(5, -1, 2)
+    with pytest.raises(ValueError):
+        extract_bit_field(5, 0, 0)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import pickle
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.arrays_and_lists.data_manipulation import (
+    extract_1d_unique_basic,
+    flatten_list,
+    normalise_flat_list,
+    revert_1d_basic,
+    sort_1d_basic
+)
+from pygenutils.arrays_and_lists.patterns import find_duplicated_elements
+from pygenutils.dictionaries.dict_handler import merge_dictionaries
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Input normalisation #
+#---------------------#
+
+@pytest.mark.parametrize("obj, expected", [
+    ([1, [2, 3], [4, [5, 6]]], [1, 2, 3, 4, 5, 6]),
+    ([[[]], 1, [], [[2]]], [1, 2]),
+    ([1, 2, 3], [1, 2, 3]),
+    ([], []),
+])
+def test_normalise_flat_list(obj, expected):
+    assert normalise_flat_list(obj) == expected
+    assert flatten_list(obj) == expected
+    assert list(flatten_list(obj, return_list=False)) == expected
+
+
+def test_normalise_flat_list_copies_and_passes_through():
+    flat = [1, 2, 3]
+    assert normalise_flat_list(flat) is flat
+    assert normalise_flat_list(flat, copy=True) is not flat
+
+    for obj in ("abc", (1, [2]), np.array([[1, 2]])):
+        assert normalise_flat_list(obj) is obj
+
+
+def test_flatten_list_always_flattens_its_outputs():
+    flat = flatten_list([1, [2, 3]])
+    flat.append([4, 5])
+    assert type(flat) is list
+    assert flatten_list(flat) == [1, 2, 3, 4, 5]
+
+    nested = [flatten_list([[6], 7]), [flat]]
+    assert flatten_list(nested) == [6, 7, 1, 2, 3, 4, 5]
+    assert normalise_flat_list(nested) == [6, 7, 1, 2, 3, 4, 5]
+
+def test_frozen_lists_are_not_scanned_again(monkeypatch):
+    frozen_list = normalise_flat_list([3, [1, 2], [[3]]], freeze=True)
+    assert frozen_list == [3, 1, 2, 3] and isinstance(frozen_list, list)
+    assert normalise_flat_list([3, 1], freeze=True) == [3, 1]
+
+    # Any scan of the frozen list would go through its iterator
+    monkeypatch.setattr(type(frozen_list), "__iter__", lambda self: pytest.fail("scanned"))
+    assert normalise_flat_list(frozen_list) is frozen_list
+    monkeypatch.undo()
+
+    copied = normalise_flat_list(frozen_list, copy=True)
+    assert type(copied) is list and copied == frozen_list
+    assert pickle.loads(pickle.dumps(frozen_list)) == frozen_list
+    assert flatten_list([frozen_list, [4]]) == [3, 1, 2, 3, 4]
+
+
+def test_frozen_lists_are_immutable():
+    frozen_list = normalise_flat_list([1, [2]], freeze=True)
+    mutations = [lambda: frozen_list.append([3]),
+                 lambda: frozen_list.extend([[3]]),
+                 lambda: frozen_list.__setitem__(0, [3]),
+                 lambda: frozen_list.__init__([[3]]),
+                 lambda: type(frozen_list)([[3]]),
+                 frozen_list.sort,
+                 frozen_list.clear]
+    for mutation in mutations:
+        with pytest.raises(TypeError):
+            mutation()
+    with pytest.raises(TypeError):
+        frozen_list += [[3]]
+    assert frozen_list == [1, 2]
+
+
+def test_entry_points_accept_frozen_lists():
+    values = [[i % 7, [i % 5]] for i in range(40)]
+    dicts = [[{i: i}, [{i + 1: -i}]] for i in range(0, 10, 2)]
+    frozen_values = normalise_flat_list(values, freeze=True)
+    frozen_dicts = normalise_flat_list(dicts, freeze=True)
+
+    assert extract_1d_unique_basic(frozen_values, sort=True) == extract_1d_unique_basic(values, sort=True)
+    assert sort_1d_basic(frozen_values) == sort_1d_basic(values)
+    assert revert_1d_basic(frozen_values) == revert_1d_basic(values)
+    assert str(find_duplicated_elements(frozen_values)) == str(find_duplicated_elements(values))
+    assert merge_dictionaries(frozen_dicts) == merge_dictionaries(dicts)
+    assert frozen_values == flatten_list(values)
+
+# Sorting, reverting and unique values #
+#--------------------------------------#
+
+def test_basic_operations_leave_inputs_untouched():
+    values = [3, [1, 2], 5, 1]
+    assert sort_1d_basic(values) == [1, 1, 2, 3, 5]
+    assert sort_1d_basic(values, reverse=True) == [5, 3, 2, 1, 1]
+    assert flatten_list(values, sort=True, reverse=True) == [5, 3, 2, 1, 1]
+    assert extract_1d_unique_basic(values, sort=True) == [1, 2, 3, 5]
+
+    flat = [3, 1, 2]
+    assert sort_1d_basic(flat) == [1, 2, 3]
+    assert flat == [3, 1, 2]
+
+
+@pytest.mark.parametrize("values", [[1, 2, 3, 4], [1, [2, 3], 4, 5]])
+@pytest.mark.parametrize("procedure", ["iterative", "index"])
+def test_revert_1d_basic(values, procedure):
+    expected = flatten_list(values)[::-1]
+    assert revert_1d_basic(values, procedure=procedure) == expected
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import datetime
+from functools import reduce
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.time_handling import date_and_time_maths
+from pygenutils.time_handling.date_and_time_maths import (
+    OnlineTimeOfDayMean,
+    dt_average,
+    sum_date_objects,
+    sum_dt_objects
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Clock time sums #
+#-----------------#
+
+CLOCK_TIMES = ["01:02:03", "23:59:59", "12:00:00", "00:00:01"]
+CLOCK_TIMEDELTAS = [pd.Timedelta(clock_time) for clock_time in CLOCK_TIMES]
+
+
+@pytest.mark.parametrize("container", [list, tuple, np.array, pd.Series])
+def test_sum_dt_objects_strings(container):
+    assert sum_dt_objects(container(CLOCK_TIMES)) == sum(CLOCK_TIMEDELTAS, pd.Timedelta(0))
+    assert sum_dt_objects(container(CLOCK_TIMES), operation="subtr") \
+           == CLOCK_TIMEDELTAS[0] - sum(CLOCK_TIMEDELTAS[1:], pd.Timedelta(0))
+
+
+def test_sum_dt_objects_object_inputs():
+    expected = sum(CLOCK_TIMEDELTAS, pd.Timedelta(0))
+    times = [datetime.time.fromisoformat(clock_time) for clock_time in CLOCK_TIMES]
+    datetimes = pd.Series(pd.to_datetime([f"20{day:02d}-01-0{day} {clock_time}"
+                                          for day, clock_time in enumerate(CLOCK_TIMES, 1)]))
+
+    assert sum_dt_objects(times) == expected
+    assert sum_dt_objects(datetimes) == expected
+    assert sum_dt_objects(np.array(CLOCK_TIMEDELTAS, dtype="timedelta64[ns]")) == expected
+    assert sum_dt_objects(["01:02:03.25", "00:00:00.75"], dt_fmt_str="%H:%M:%S.%f") \
+           == pd.Timedelta("01:02:04")
+
+
+def test_sum_dt_objects_time_zone_aware_inputs():
+    madrid_times = pd.Series(pd.to_datetime(["2020-01-01 10:00", "2020-07-01 11:30"])).dt.tz_localize("Europe/Madrid")
+    expected = pd.Timedelta("21:30:00")
+    assert sum_dt_objects(madrid_times) == expected
+    assert sum_dt_objects(list(madrid_times)) == expected
+
+    # Every object keeps the clock time of its own time zone
+    mixed_times = [madrid_times[0], pd.Timestamp("2020-01-01 11:30", tz="UTC"),
+                   datetime.datetime(2020, 1, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=-5)))]
+    assert sum_dt_objects(mixed_times) == pd.Timedelta("23:30:00")
+    assert sum_dt_objects(np.array(mixed_times, dtype=object)) == pd.Timedelta("23:30:00")
+
+
+@pytest.mark.parametrize("clock_times, dt_fmt_str", [
+    (["10:00", "11:00"], "%T"),
+    (["10:00:00", "11:00"], "%H:%M:%S"),
+    (["10:00+01", "11:00:00"], "%H:%M:%S"),
+    (["10:00:00", "11:00:00.5"], "%H:%M"),
+])
+def test_sum_dt_objects_strings_must_follow_the_format(clock_times, dt_fmt_str):
+    with pytest.raises(ValueError):
+        sum_dt_objects(clock_times, dt_fmt_str=dt_fmt_str)
+
+
+def test_sum_dt_objects_clock_time_formats():
+    assert sum_dt_objects(["10:00", "11:00"], dt_fmt_str="%H:%M") == pd.Timedelta("21:00:00")
+    assert sum_dt_objects(["9:05:00", "11:00:00"]) == pd.Timedelta("20:05:00")
+    assert sum_dt_objects(["10:00:00.5", "11:00:00.250001"], dt_fmt_str="%H:%M:%S.%f") \
+           == pd.Timedelta("21:00:00.750001")
+
+
+def test_sum_dt_objects_groups_and_output_formats():
+    totals = sum_dt_objects(CLOCK_TIMES, by=["a", "b", "a", "b"])
+    assert totals.to_dict() == {"a" : CLOCK_TIMEDELTAS[0] + CLOCK_TIMEDELTAS[2],
+                                "b" : CLOCK_TIMEDELTAS[1] + CLOCK_TIMEDELTAS[3]}
+
+    two_times = CLOCK_TIMES[:2]
+    assert sum_dt_objects(two_times, output_format="string") == "1 days 01:02:02"
+    assert sum_dt_objects(two_times, output_format="time_only") == datetime.time(1, 2, 2)
+    assert sum_dt_objects(two_times, output_format="tuple") == (1, 1, 2, 2)
+
+
+def test_sum_dt_objects_large_totals_do_not_overflow():
+    # Beyond the range of timedelta64[ns], about 292 years
+    n_records = 3_000_000
+    clock_time = np.timedelta64(23 * 3600 + 1, "s")
+    totals = sum_dt_objects(np.full(n_records, clock_time, dtype="timedelta64[ns]"))
+    assert totals == n_records * clock_time
+
+
+def test_sum_dt_objects_invalid_inputs():
+    with pytest.raises(TypeError):
+        sum_dt_objects("01:02:03")
+    with pytest.raises(ValueError):
+        sum_dt_objects(["01:02:03"])
+    with pytest.raises(ValueError):
+        sum_dt_objects(CLOCK_TIMES, operation="mult")
+
+# Time of day averages #
+#----------------------#
+
+def _reference_circular_mean(clock_times):
+    seconds = np.array([pd.Timedelta(clock_time).total_seconds() for clock_time in clock_times])
+    angles = seconds / 86400 * 2 * np.pi
+    mean_seconds = np.arctan2(np.sin(angles).mean(), np.cos(angles).mean()) / (2 * np.pi) * 86400
+    # Whole seconds, truncated as in dt_average
+    return pd.Timedelta(seconds=int(mean_seconds % 86400 + 1e-9) % 86400)
+
+
+@pytest.mark.parametrize("clock_times", [
+    ["23:00:00", "01:00:00"],
+    ["22:00:00", "23:00:00", "01:00:00", "02:00:00"],
+    ["06:15:00", "07:45:30", "08:00:00"],
+    ["12:00:00", "12:00:00", "13:30:00"],
+])
+def test_dt_average_circular_mean(clock_times):
+    expected = _reference_circular_mean(clock_times)
+    assert dt_average(clock_times) == expected
+    assert dt_average(np.array(clock_times)) == expected
+    assert dt_average([datetime.time.fromisoformat(clock_time) for clock_time in clock_times]) == expected
+
+
+def test_dt_average_output_formats_and_errors():
+    clock_times = ["10:00:00", "12:30:00"]
+    assert dt_average(clock_times, output_format="time_only") == datetime.time(11, 15)
+    assert dt_average(clock_times, output_format="tuple") == (0, 11, 15, 0)
+    with pytest.raises(TypeError):
+        dt_average("10:00:00")
+    with pytest.raises(ValueError):
+        dt_average(["10:00:00"])
+
+
+def test_online_time_of_day_mean_matches_dt_average():
+    clock_times = ["22:00:00", "23:30:00", "00:15:00", "01:00:00", "03:20:00", "21:05:00"]
+
+    acc = OnlineTimeOfDayMean()
+    for clock_time in clock_times[:2]:
+        acc.update(clock_time)
+    acc.update(clock_times[2:4]).update([])
+    assert len(acc) == 4
+
+    other = pickle.loads(pickle.dumps(OnlineTimeOfDayMean().update(np.array(clock_times[4:]))))
+    assert acc.merge(other).mean() == dt_average(clock_times)
+    assert acc.mean(output_format="string") == str(dt_average(clock_times))
+
+
+def test_online_time_of_day_mean_errors():
+    with pytest.raises(ValueError):
+        OnlineTimeOfDayMean().mean()
+    with pytest.raises(TypeError):
+        OnlineTimeOfDayMean().merge(["12:00:00"])
+    with pytest.raises(ValueError):
+        OnlineTimeOfDayMean().update("12:00:00").mean(output_format="weeks")
+
+# Date sums #
+#-----------#
+
+DATES = ["2020-01-31", "2021-03-01", "2022-11-30", "2020-06-15"]
+
+
+def _reference_date_reduction(date_strs, operation):
+    dates = [datetime.date.fromisoformat(date_str) for date_str in date_strs]
+    return reduce(lambda date1, date2: date_and_time_maths._add_dates_with_year_gap(date1, date2, operation),
+                  dates)
+
+
+@pytest.mark.parametrize("operation", ["sum", "subtr"])
+def test_sum_date_objects_matches_pairwise_reduction(operation):
+    expected = _reference_date_reduction(DATES, operation)
+    assert sum_date_objects(DATES, operation) == expected
+    assert sum_date_objects(np.array(DATES, dtype="datetime64[D]"), operation) == expected
+    assert sum_date_objects(DATES, operation, output_format="tuple") \
+           == (expected.year, expected.month, expected.day)
+
+
+def test_sum_date_objects_groups():
+    totals = sum_date_objects(DATES, by=[2, 1, 2, 1], output_format="string")
+    assert totals.to_dict() == {1 : str(_reference_date_reduction(DATES[1::2], "sum")),
+                                2 : str(_reference_date_reduction(DATES[0::2], "sum"))}
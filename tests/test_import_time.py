@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import subprocess
+import sys
+
+import pytest
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+def _imported_modules(statement):
+    """
+    Modules loaded by 'statement' in a fresh interpreter,
+    as listed by '-X importtime'.
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                               capture_output=True, text=True, check=True)
+    modules = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative_us, module_name = line.split("|")
+            if cumulative_us.strip().isdigit():
+                modules.add(module_name.strip())
+    return modules
+
+# Import-time guards #
+#--------------------#
+
+# Imports to check and the top-level modules they must not load #
+IMPORT_CHECKS = [
+    ("import pygenutils", ["numpy", "pandas"]),
+    ("import pygenutils.strings", ["numpy", "pandas"]),
+    ("import pygenutils.strings.string_handler, pygenutils.strings.text_formatters", ["pandas", "dateutil"]),
+    ("import pygenutils.arrays_and_lists.data_manipulation", ["pandas"]),
+    ("import pygenutils.time_handling.time_formatters", ["pandas", "dateutil"]),
+]
+
+
+@pytest.mark.parametrize("statement, forbidden_modules", IMPORT_CHECKS)
+def test_import_does_not_load_heavy_modules(statement, forbidden_modules):
+    modules = _imported_modules(statement)
+    assert statement.split()[1].split(",")[0] in modules
+
+    loaded = {module_name.split(".")[0] for module_name in modules}
+    assert not loaded.intersection(forbidden_modules)
+
+# Lazy submodules #
+#-----------------#
+
+def test_submodules_load_on_first_access():
+    statement = ("import sys, pygenutils; "
+                 "assert 'pygenutils.strings' not in sys.modules; "
+                 "assert 'strings' in dir(pygenutils); "
+                 "assert pygenutils.strings.string_handler.__name__ == 'pygenutils.strings.string_handler'; "
+                 "assert 'pygenutils.strings.text_formatters' not in sys.modules")
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+    import pygenutils
+    with pytest.raises(AttributeError):
+        pygenutils.not_a_subpackage
+
+
+def test_is_pandas_instance():
+    statement = ("import sys; from pygenutils._lazy_imports import is_pandas_instance; "
+                 "assert not is_pandas_instance([1], 'Series'); "
+                 "assert 'pandas' not in sys.modules; "
+                 "import pandas as pd; "
+                 "assert is_pandas_instance(pd.Series([1]), 'DataFrame', 'Series'); "
+                 "assert not is_pandas_instance(pd.Series([1]), 'DataFrame')")
+    subprocess.run([sys.executable, "-c", statement], check=True)
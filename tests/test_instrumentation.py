@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import asyncio
+from itertools import count
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.arrays_and_lists import data_manipulation
+from pygenutils.time_handling import instrumentation
+from pygenutils.time_handling.instrumentation import (
+    CallRegistry,
+    disable_instrumentation,
+    enable_instrumentation,
+    is_instrumentation_enabled,
+    load_call_profiles
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Clock advancing by 1 us on every reading."""
+    ticks = count(step=1000)
+    monkeypatch.setattr(instrumentation, "time",
+                        SimpleNamespace(perf_counter_ns=lambda: next(ticks)))
+
+
+@pytest.fixture
+def instrumented_registry():
+    registry = CallRegistry()
+    yield registry
+    disable_instrumentation()
+
+# Function wrappers #
+#-------------------#
+
+def test_nested_calls_split_self_and_cumulative_times(fake_clock):
+    registry = CallRegistry()
+    inner = instrumentation._instrument(lambda values: sum(values), "inner", registry)
+    outer = instrumentation._instrument(lambda values: inner(values) * 2, "outer", registry)
+
+    assert outer(np.arange(4)) == 12
+    assert outer([1, 2]) == 6
+    assert inner(5 for _ in range(2)) == 10
+
+    stats = registry.stats(unit="us")
+    assert list(stats) == ["outer", "inner"]
+    assert stats["outer"] == dict(calls=2, cumulative=6, self=4, mean_size=3,
+                                  max_size=4, exceptions={})
+    assert stats["inner"] == dict(calls=3, cumulative=3, self=3, mean_size=3,
+                                  max_size=4, exceptions={})
+    assert registry.to_dict()["stacks"] == {"outer": 4000, "outer;inner": 2000, "inner": 1000}
+
+
+def test_recursion_and_exceptions(fake_clock):
+    registry = CallRegistry()
+
+    def countdown(n):
+        if n < 0:
+            raise ValueError("negative")
+        return 0 if n == 0 else countdown(n - 1)
+    countdown = instrumentation._instrument(countdown, "countdown", registry)
+
+    countdown(2)
+    with pytest.raises(ValueError):
+        countdown(-1)
+
+    stats = registry.stats(unit="us")["countdown"]
+    # The outermost call lasts 5 us, the failing one 1 us;
+    # nested recursive calls only add to the self time
+    assert stats["calls"] == 4 and stats["cumulative"] == 6 and stats["self"] == 6
+    assert stats["exceptions"] == {"ValueError": 1}
+    assert stats["mean_size"] is None
+
+
+def test_coroutines_and_tasks():
+    registry = CallRegistry()
+
+    async def leaf():
+        await asyncio.sleep(0.01)
+    leaf = instrumentation._instrument(leaf, "leaf", registry)
+
+    async def branch():
+        await asyncio.gather(leaf(), leaf())
+    branch = instrumentation._instrument(branch, "branch", registry)
+
+    asyncio.run(branch())
+    stacks = registry.to_dict()["stacks"]
+    assert set(stacks) == {"branch", "branch;leaf"}
+    assert registry.stats()["leaf"]["calls"] == 2 and registry.stats()["branch"]["calls"] == 1
+
+# Call registry #
+#---------------#
+
+def _filled_registry(calls):
+    registry = CallRegistry()
+    for _ in range(calls):
+        registry.record(("outer",), 5000, 3000, size=10)
+        registry.record(("outer", "inner"), 2000, 2000, exception="KeyError")
+    return registry
+
+
+def test_registry_report_and_reset():
+    registry = _filled_registry(2)
+    report_lines = registry.report(unit="us").splitlines()
+    assert report_lines[0].startswith("function") and report_lines[0].endswith("(us)")
+    assert report_lines[1].split() == ["outer", "2", "10", "6", "10", "0"]
+    assert report_lines[2].split() == ["inner", "2", "4", "4", "2"]
+    assert len(registry.report(limit=1).splitlines()) == 2
+
+    registry.reset()
+    assert registry.stats() == {}
+    with pytest.raises(ValueError):
+        registry.stats(unit="min")
+
+
+def test_registry_dumps_and_merged_profiles(tmp_path):
+    first, second = _filled_registry(1), _filled_registry(3)
+    first.dump_json(str(tmp_path / "pygenutils_profile_1.json"))
+    second.dump_json(str(tmp_path / "pygenutils_profile_2.json"))
+    (tmp_path / "unrelated.json").write_text("[]")
+
+    merged = load_call_profiles(str(tmp_path))
+    assert merged.stats() == _filled_registry(4).stats()
+    assert load_call_profiles(str(tmp_path / "pygenutils_profile_1.json")).stats() == first.stats()
+
+    folded_path = tmp_path / "profile.folded"
+    merged.dump_collapsed(str(folded_path))
+    assert folded_path.read_text().splitlines() == ["outer 12", "outer;inner 8"]
+
+# Switches #
+#----------#
+
+def test_enable_and_disable_instrumentation(instrumented_registry):
+    plain_flatten_list = data_manipulation.flatten_list
+    skipped_modules = enable_instrumentation(["arrays_and_lists"], registry=instrumented_registry)
+    assert skipped_modules == [] and is_instrumentation_enabled()
+    with pytest.raises(RuntimeError):
+        enable_instrumentation(["arrays_and_lists"])
+
+    assert data_manipulation.flatten_list.__instrumented__ is plain_flatten_list
+    assert data_manipulation.sort_1d_basic([3, [1, 2]]) == [1, 2, 3]
+    stats = instrumented_registry.stats()
+    name = "pygenutils.arrays_and_lists.data_manipulation.sort_1d_basic"
+    assert stats[name]["calls"] == 1 and stats[name]["mean_size"] == 2
+
+    disable_instrumentation()
+    assert not is_instrumentation_enabled()
+    assert data_manipulation.flatten_list is plain_flatten_list
+    data_manipulation.sort_1d_basic([2, 1])
+    assert instrumented_registry.stats()[name]["calls"] == 1
+
+
+def test_environment_variables_write_per_process_profiles(tmp_path):
+    env = dict(os.environ,
+               PYGENUTILS_INSTRUMENT="arrays_and_lists",
+               PYGENUTILS_INSTRUMENT_DIR=str(tmp_path))
+    statement = ("from pygenutils.arrays_and_lists.data_manipulation import flatten_list; "
+                 "flatten_list([1, [2, 3]])")
+    subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+
+    assert len(list(tmp_path.glob("pygenutils_profile_*.folded"))) == 1
+    stats = load_call_profiles(str(tmp_path)).stats()
+    assert stats["pygenutils.arrays_and_lists.data_manipulation.flatten_list"]["calls"] == 1
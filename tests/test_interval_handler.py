@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.sets_and_intervals.interval_handler import (
+    IntervalStabbingIndex,
+    basic_interval_operator,
+    define_interval,
+    numpy_interval_operator,
+    to_pandas_interval_array
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+def _contains(left, right, points, closed):
+    """Membership of every point (rows) in every interval (columns)."""
+    points = np.asarray(points)[:, None]
+    after_left = (points >= left) if closed in ["left", "both"] else (points > left)
+    before_right = (points <= right) if closed in ["right", "both"] else (points < right)
+    return after_left & before_right
+
+
+def _random_intervals(seed, n_intervals):
+    rng = np.random.default_rng(seed)
+    left = rng.integers(0, 20, n_intervals)
+    return np.column_stack([left, left + rng.integers(0, 6, n_intervals)])
+
+# Native interval engine #
+#------------------------#
+
+# Points on and between the integer endpoints
+GRID = np.arange(-1, 27, 0.5)
+
+EXPECTED_COVERAGE = {
+    "union" : lambda member: member.any(axis=1),
+    "intersection" : lambda member: member.all(axis=1),
+    "difference" : lambda member: member[:, 0] & ~member[:, 1:].any(axis=1),
+    "symmetric_difference" : lambda member: member.sum(axis=1) % 2 == 1,
+}
+
+
+# Difference-like operations only support half-open intervals
+OPERATOR_CLOSED_CASES = [(operator, closed)
+                         for operator in EXPECTED_COVERAGE
+                         for closed in ["left", "right", "both", "neither"]
+                         if operator in ["union", "intersection"] or closed in ["left", "right"]]
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("operator, closed", OPERATOR_CLOSED_CASES)
+def test_numpy_interval_operator_matches_point_coverage(operator, closed, seed):
+    bounds = _random_intervals(seed, 6)
+
+    result = numpy_interval_operator(bounds, closed=closed, operator=operator)
+    expected = EXPECTED_COVERAGE[operator](_contains(bounds[:, 0], bounds[:, 1], GRID, closed))
+    covered = _contains(result[:, 0], result[:, 1], GRID, closed).any(axis=1)
+    np.testing.assert_array_equal(covered, expected)
+
+    # Disjoint and sorted bounds
+    assert np.all(result[1:, 0] >= result[:-1, 1])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_numpy_interval_operator_complement(seed):
+    bounds = _random_intervals(seed, 6)
+    result = numpy_interval_operator(bounds, closed="left", operator="complement")
+
+    inside_span = GRID[(GRID >= bounds[:, 0].min()) & (GRID < bounds[:, 1].max())]
+    expected = ~_contains(bounds[:, 0], bounds[:, 1], inside_span, "left").any(axis=1)
+    covered = _contains(result[:, 0], result[:, 1], inside_span, "left").any(axis=1)
+    np.testing.assert_array_equal(covered, expected)
+
+
+def test_numpy_interval_operator_inputs_and_errors():
+    intervals = [pd.Interval(1, 3, closed="left"), pd.Interval(2, 5, closed="left")]
+    np.testing.assert_array_equal(numpy_interval_operator(intervals), [[1, 5]])
+    np.testing.assert_array_equal(numpy_interval_operator([[1, 3], [7, 9]], force_union=True),
+                                  [[1, 9]])
+    assert numpy_interval_operator([]).shape == (0, 2)
+
+    dates = np.array([["2020-01-01", "2020-01-05"], ["2020-01-03", "2020-01-10"]],
+                     dtype="datetime64[D]")
+    np.testing.assert_array_equal(numpy_interval_operator(dates),
+                                  np.array([["2020-01-01", "2020-01-10"]], dtype="datetime64[D]"))
+
+    with pytest.raises(ValueError):
+        numpy_interval_operator([[3, 1]])
+    with pytest.raises(ValueError):
+        numpy_interval_operator([[1, 3]], closed="both", operator="complement")
+    with pytest.raises(ValueError):
+        numpy_interval_operator([[1, 3]], operator="comparison")
+
+
+def test_basic_interval_operator_numpy_constructor():
+    result = basic_interval_operator([[1, 3], [2, 5], [7, 9]], constructor="numpy")
+    np.testing.assert_array_equal(result, [[1, 5], [7, 9]])
+
+    interval_array = to_pandas_interval_array(result, closed="left")
+    assert interval_array.closed == "left"
+    assert interval_array.left.tolist() == [1, 7] and interval_array.right.tolist() == [5, 9]
+
+
+# Batch point-in-interval queries #
+#---------------------------------#
+
+def _csr_to_sets(indptr, interval_idx):
+    return [set(interval_idx[start:stop].tolist()) for start, stop in zip(indptr[:-1], indptr[1:])]
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("seed", range(5))
+def test_stabbing_index_matches_brute_force(seed, closed):
+    rng = np.random.default_rng(seed)
+    left = rng.random(200) * 100
+    right = left + rng.choice([0, 0.5, 3, 40], 200) * rng.random(200)
+    right[:5] = left[:5]
+    index = IntervalStabbingIndex(left, right, closed=closed)
+
+    points = np.concatenate([rng.random(100) * 110 - 5, left[:20], right[:20]])
+    member = _contains(left, right, points, closed)
+    indptr, interval_idx = index.stab(points)
+    assert _csr_to_sets(indptr, interval_idx) == [set(np.flatnonzero(row).tolist()) for row in member]
+
+    query_left = rng.random(50) * 100
+    query_right = query_left + rng.random(50) * 10
+    indptr, interval_idx = index.overlap(query_left, query_right)
+    if closed == "both":
+        expected = (left <= query_right[:, None]) & (right >= query_left[:, None])
+    else:
+        expected = (left < query_right[:, None]) & (right > query_left[:, None])
+    assert _csr_to_sets(indptr, interval_idx) == [set(np.flatnonzero(row).tolist()) for row in expected]
+
+    query_idx, pair_idx = IntervalStabbingIndex.pairs(indptr, interval_idx)
+    assert set(zip(query_idx.tolist(), pair_idx.tolist())) == set(zip(*np.nonzero(expected)))
+
+
+def test_stabbing_index_from_intervals():
+    index = IntervalStabbingIndex.from_intervals([define_interval(0, 10), define_interval(5, 15)])
+    assert index.closed == "both" and len(index) == 2
+    indptr, interval_idx = index.stab([3, 7, 20])
+    assert _csr_to_sets(indptr, interval_idx) == [{0}, {0, 1}, set()]
+
+    pandas_index = IntervalStabbingIndex.from_intervals([pd.Interval(0, 10, closed="left")])
+    assert pandas_index.closed == "left"
+    assert pandas_index.stab([10])[0].tolist() == [0, 0]
+
+    restored = pickle.loads(pickle.dumps(index))
+    np.testing.assert_array_equal(restored.stab([7])[1], index.stab([7])[1])
+    with pytest.raises(ValueError):
+        IntervalStabbingIndex([2], [1])
+
+
+def test_stabbing_index_datetime64_endpoints():
+    left = np.array(["2020-01-01", "2020-01-10"], dtype="datetime64[D]")
+    right = np.array(["2020-01-05", "2020-01-20"], dtype="datetime64[D]")
+    index = IntervalStabbingIndex(left, right)
+    points = np.array(["2020-01-03T12:00", "2020-01-07", "2020-01-10"], dtype="datetime64[m]")
+    assert _csr_to_sets(*index.stab(points)) == [{0}, set(), {1}]
+
+
+def test_stabbing_index_finer_unit_queries_are_not_truncated():
+    index = IntervalStabbingIndex(np.array(["2020-01-01"], dtype="datetime64[D]"),
+                                  np.array(["2020-01-05"], dtype="datetime64[D]"))
+    points = np.array(["2020-01-05T12:00", "2020-01-05T00:00", "2019-12-31T23:59"],
+                      dtype="datetime64[m]")
+    assert _csr_to_sets(*index.stab(points)) == [set(), {0}, set()]
+    assert _csr_to_sets(*index.stab(["2020-01-05T00:00:01", "2020-01-04T23:59:59"])) == [set(), {0}]
+
+    query_left = np.array(["2020-01-05T00:01", "2020-01-04T23:00"], dtype="datetime64[m]")
+    query_right = np.array(["2020-01-06", "2020-01-06"], dtype="datetime64[D]")
+    assert _csr_to_sets(*index.overlap(query_left, query_right)) == [set(), {0}]
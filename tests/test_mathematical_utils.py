@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.number_bases import mathematical_utils
+from pygenutils.number_bases.mathematical_utils import adapted_factorial
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+def _exact_factorial(num, significant_digits):
+    sig_int, exponent = mathematical_utils._exact_factorial_digits(num, significant_digits)
+    return mathematical_utils._format_significant_digits(sig_int, exponent, significant_digits)
+
+# Adapted factorial #
+#-------------------#
+
+def test_adapted_factorial_examples():
+    assert adapted_factorial(10, 3) == "3.63e+06"
+    assert adapted_factorial(10**6, 6) == "8.26393e+5565708"
+    assert adapted_factorial(5.0, 3) == "120"
+
+
+@pytest.mark.parametrize("num", [1000, 1001, 2024, 4999, 12345])
+@pytest.mark.parametrize("significant_digits", [1, 3, 6, 10, 15])
+def test_adapted_factorial_estimate_matches_exact(num, significant_digits):
+    assert adapted_factorial(num, significant_digits) == _exact_factorial(num, significant_digits)
+
+
+def test_adapted_factorial_array_matches_scalar():
+    nums = np.array([[0, 1, 5], [170, 171, 2024]])
+    result = adapted_factorial(nums, 6)
+    assert result.shape == nums.shape
+    assert result.tolist() == [[adapted_factorial(int(num), 6) for num in row] for row in nums]
+    assert adapted_factorial([3, 4], 2).tolist() == ["6", "24"]
+
+
+@pytest.mark.parametrize("num, error", [
+    (-1, ValueError),
+    (2.5, ValueError),
+    ("5", TypeError),
+    (np.array([1, -2]), ValueError),
+])
+def test_adapted_factorial_invalid_inputs(num, error):
+    with pytest.raises(error):
+        adapted_factorial(num, 3)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import asyncio
+import gc
+from itertools import count
+import json
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.time_handling import program_snippet_exec_timers
+from pygenutils.time_handling.program_snippet_exec_timers import (
+    DEFAULT_TIMER_REGISTRY,
+    BenchmarkResult,
+    TimerRegistry,
+    benchmark,
+    compare_to_baseline,
+    load_benchmarks,
+    program_exec_timer,
+    save_benchmarks,
+    snippet_exec_timer
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Clock advancing by 1 ms on every reading."""
+    ticks = count(step=1_000_000)
+    monkeypatch.setattr(program_snippet_exec_timers, "time",
+                        SimpleNamespace(perf_counter_ns=lambda: next(ticks)))
+
+# Program timer #
+#---------------#
+
+def test_program_exec_timer_nesting():
+    program_exec_timer("start", module="timeit")
+    program_exec_timer("start", module="timeit")
+    assert isinstance(program_exec_timer("stop", module="timeit"), str)
+    assert isinstance(program_exec_timer("stop", module="timeit"), str)
+    with pytest.raises(RuntimeError):
+        program_exec_timer("stop")
+    with pytest.raises(ValueError):
+        program_exec_timer("pause")
+    with pytest.raises(ValueError):
+        program_exec_timer("start", module="calendar")
+
+# Timer registry #
+#----------------#
+
+def test_timer_registry_nesting(fake_clock):
+    timers = TimerRegistry()
+
+    @timers.timer("step")
+    def step():
+        return "done"
+
+    with timers.timer("pipeline"):
+        with timers.timer("load"):
+            pass
+        assert step() == "done"
+    timers.start("manual")
+    assert timers.stop("manual") == 1_000_000
+
+    stats = timers.stats(unit="ms")
+    assert list(stats) == ["manual", "pipeline", "pipeline/load", "pipeline/step"]
+    assert stats["pipeline/load"]["total"] == 1
+    assert stats["pipeline"]["total"] == 5
+    assert stats["pipeline"]["count"] == 1
+    assert step.__name__ == "step"
+
+    report_lines = timers.report().splitlines()
+    assert report_lines[0].startswith("timer") and report_lines[0].endswith("(ms)")
+    assert [line.split()[0] for line in report_lines[1:]] == ["manual", "pipeline", "load", "step"]
+    assert report_lines[3].startswith("  load")
+
+
+def test_timer_registry_records_errors_and_stop_checks():
+    timers = TimerRegistry()
+    with pytest.raises(ZeroDivisionError):
+        with timers.timer("failing"):
+            1 / 0
+    assert timers.stats()["failing"]["count"] == 1
+
+    with pytest.raises(RuntimeError):
+        timers.stop()
+    timers.start("outer")
+    with pytest.raises(RuntimeError):
+        timers.stop("inner")
+    timers.stop("outer")
+
+
+def test_timer_registry_statistics():
+    timers = TimerRegistry(reservoir_size=2000)
+    times_ns = np.random.default_rng(0).integers(1, 10**6, 1000)
+    for elapsed_ns in times_ns:
+        timers.record(("outer", "inner"), int(elapsed_ns))
+
+    stats = timers.stats(unit="us", percentiles=(50, 99.5))["outer/inner"]
+    assert stats["count"] == 1000
+    assert stats["total"] == pytest.approx(times_ns.sum() / 1000)
+    assert stats["mean"] == pytest.approx(times_ns.mean() / 1000)
+    assert stats["min"] == times_ns.min() / 1000 and stats["max"] == times_ns.max() / 1000
+    assert stats["p50"] == pytest.approx(np.percentile(times_ns, 50) / 1000)
+    assert stats["p99.5"] == pytest.approx(np.percentile(times_ns, 99.5) / 1000)
+
+    timers.reset()
+    assert timers.stats() == {}
+    with pytest.raises(ValueError):
+        timers.stats(unit="min")
+    with pytest.raises(ValueError):
+        TimerRegistry(reservoir_size=0)
+
+
+def test_timer_registry_reservoir_is_bounded():
+    timers = TimerRegistry(reservoir_size=16)
+    for elapsed_ns in range(1000):
+        timers.record("loop", elapsed_ns)
+    samples = timers._stats[("loop",)].samples
+    assert len(samples) == 16 and set(samples) <= set(range(1000))
+    assert timers.stats()["loop"]["count"] == 1000
+
+
+def test_timer_registry_threads():
+    timers = TimerRegistry()
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        for _ in range(200):
+            with timers.timer("outer"):
+                with timers.timer("inner"):
+                    pass
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = timers.stats()
+    assert list(stats) == ["outer", "outer/inner"]
+    assert stats["outer"]["count"] == stats["outer/inner"]["count"] == 1600
+
+
+def test_timer_registry_asyncio_tasks():
+    timers = TimerRegistry()
+
+    @timers.timer("fetch")
+    async def fetch(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    async def job(name, delay):
+        with timers.timer(name):
+            return await fetch(delay)
+
+    async def main():
+        return await asyncio.gather(job("first", 0.02), job("second", 0.01))
+
+    assert asyncio.run(main()) == [0.02, 0.01]
+    stats = timers.stats(unit="s")
+    assert list(stats) == ["first", "first/fetch", "second", "second/fetch"]
+    assert stats["first/fetch"]["total"] >= 0.02
+
+
+def test_default_timer_registry():
+    assert isinstance(DEFAULT_TIMER_REGISTRY, TimerRegistry)
+    DEFAULT_TIMER_REGISTRY.record("test_default_timer_registry", 5)
+    try:
+        assert DEFAULT_TIMER_REGISTRY.stats(unit="ns")["test_default_timer_registry"]["total"] == 5
+    finally:
+        DEFAULT_TIMER_REGISTRY.reset()
+
+# Benchmark harness #
+#-------------------#
+
+def test_snippet_exec_timer_times_the_snippet(capsys):
+    calls = []
+    snippet_exec_timer(lambda: calls.append(1), trials=50, decimal_places=None)
+    assert len(calls) == 50
+    assert "50 trials with no repeats" in capsys.readouterr().out
+
+    namespace = dict(calls=calls)
+    snippet_exec_timer("calls.append(2)", repeats=3, trials=10, decimal_places=6,
+                       return_best_time=True, setup="calls.append(0)", globals=namespace)
+    assert calls.count(2) == 30 and calls.count(0) == 3
+    assert "Best:" in capsys.readouterr().out
+    with pytest.raises(TypeError):
+        snippet_exec_timer("pass", decimal_places=1.5)
+
+
+def test_benchmark_runs_and_summarises():
+    calls = []
+    result = benchmark(lambda: calls.append(1), repeats=5, number=20, warmups=2)
+    assert len(calls) == (2 + 5) * 20
+    assert result.number == 20 and len(result.times) == 5
+    assert result.name == "test_benchmark_runs_and_summarises.<locals>.<lambda>"
+    assert result.min <= result.q1 <= result.median <= result.q3
+    assert result.metadata["gc_disabled"] and result.metadata["warmups"] == 2
+
+    calibrated = benchmark("sum(range(100))", repeats=2, min_time=1e-3, warmups=0)
+    assert calibrated.name == "sum(range(100))"
+    assert str(calibrated.number)[0] in "125"
+    assert calibrated.number * calibrated.times[0] > 0
+
+
+def test_benchmark_garbage_collector_option():
+    gc_states = []
+    benchmark(lambda: gc_states.append(gc.isenabled()), repeats=2, number=1, warmups=0)
+    benchmark(lambda: gc_states.append(gc.isenabled()), repeats=2, number=1, warmups=0,
+              disable_gc=False)
+    assert gc_states == [False, False, True, True]
+
+
+def test_benchmark_invalid_arguments():
+    with pytest.raises(ValueError):
+        benchmark("pass", repeats=1)
+    with pytest.raises(ValueError):
+        benchmark("pass", number=0)
+    with pytest.raises(ValueError):
+        benchmark("pass", min_time=0)
+
+
+def test_benchmark_result_statistics_and_serialisation():
+    times = [1.0, 1.1, 0.9, 1.05, 0.95, 5.0]
+    result = BenchmarkResult("loop", times, number=10, metadata=dict(python="3"))
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    assert (result.q1, result.median, result.q3) == (q1, median, q3)
+    assert result.iqr == q3 - q1 and result.std == pytest.approx(np.std(times, ddof=1))
+    assert result.outliers == [5]
+    assert BenchmarkResult("loop", times, 10, outlier_factor=100).outliers == []
+
+    restored = BenchmarkResult.from_dict(json.loads(result.to_json()))
+    assert restored.to_dict() == result.to_dict()
+    assert "median=1.025 s" in repr(result)
+
+
+def test_save_load_and_compare_to_baseline(tmp_path):
+    baseline = [BenchmarkResult("steady", [1.0, 1.01, 0.99, 1.02], 1),
+                BenchmarkResult("slower", [1.0, 1.01, 0.99, 1.02], 1),
+                BenchmarkResult("faster", [1.0, 1.01, 0.99, 1.02], 1)]
+    path = str(tmp_path / "baseline.json")
+    save_benchmarks(baseline, path)
+    assert [result.to_dict() for result in load_benchmarks(path)] \
+           == [result.to_dict() for result in baseline]
+
+    current = [BenchmarkResult("steady", [1.03, 0.98, 1.0, 1.04], 1),
+               BenchmarkResult("slower", [1.3, 1.31, 1.29, 1.32], 1),
+               BenchmarkResult("faster", [0.7, 0.71, 0.69, 0.72], 1),
+               BenchmarkResult("new", [1.0, 1.0], 1)]
+    for base in (path, baseline, [result.to_dict() for result in baseline]):
+        comparisons = {comparison["name"]: comparison for comparison in compare_to_baseline(current, base)}
+        assert list(comparisons) == ["steady", "slower", "faster"]
+        assert [comparisons[name]["regression"] for name in comparisons] == [False, True, False]
+        assert [comparisons[name]["improvement"] for name in comparisons] == [False, False, True]
+        assert comparisons["slower"]["ratio"] == pytest.approx(1.305 / 1.005)
+
+    save_benchmarks(current[0], path)
+    assert len(load_benchmarks(path)) == 1
+    assert compare_to_baseline(current[0], path)[0]["ratio"] == 1
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+from functools import reduce
+from itertools import product
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.sets_and_intervals.sets_handler import (
+    LazyCartesianProduct,
+    bulk_sets_operator
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Bulk set operations #
+#---------------------#
+
+SETS = [{1, 2, 3, 10}, {2, 3, 4}, {3, 4, 5, 2}]
+
+PAIRWISE_OPERATIONS = {
+    "union" : set.union,
+    "intersection" : set.intersection,
+    "difference" : set.difference,
+    "symmetric_difference" : set.symmetric_difference,
+}
+
+
+@pytest.mark.parametrize("backend", ["auto", "numpy", "bitmap", "default"])
+@pytest.mark.parametrize("operator", list(PAIRWISE_OPERATIONS))
+def test_bulk_sets_operator_matches_pairwise_reduction(operator, backend):
+    expected = reduce(PAIRWISE_OPERATIONS[operator], SETS)
+    result = bulk_sets_operator(SETS, operator=operator, backend=backend)
+    assert set(np.asarray(list(result)).tolist()) == expected
+
+
+def test_bulk_sets_operator_non_integer_sets_fall_back():
+    assert bulk_sets_operator([{"a", "b"}, {"b", "c"}]) == {"a", "b", "c"}
+    with pytest.raises(TypeError):
+        bulk_sets_operator([{"a", "b"}, {"b", "c"}], backend="numpy")
+
+
+def test_bulk_sets_operator_uint64_beyond_int64():
+    big = 2**63 + 5
+    sets = [np.array([big, 1], dtype=np.uint64), np.array([1], dtype=np.uint64)]
+
+    # Not representable as int64: the default backend keeps the exact values
+    assert bulk_sets_operator(sets, operator="union") == {big, 1}
+    with pytest.raises(TypeError):
+        bulk_sets_operator(sets, operator="union", backend="numpy")
+
+    # Small unsigned values still use the integer backends
+    small = [np.array([3, 1], dtype=np.uint64), np.array([1], dtype=np.uint64)]
+    assert bulk_sets_operator(small, operator="union", backend="numpy").tolist() == [1, 3]
+
+
+# Lazy cartesian product #
+#------------------------#
+
+@pytest.mark.parametrize("factors", [
+    [[1, 2], ["a", "b", "c"], [0.5]],
+    [[1, 2, 3]],
+    [[1, 2], []],
+    [],
+])
+def test_lazy_cartesian_product_matches_itertools(factors):
+    prod = LazyCartesianProduct(factors)
+    expected = list(product(*factors))
+
+    assert len(prod) == len(expected)
+    assert list(prod) == expected
+    assert [prod[index] for index in range(len(prod))] == expected
+    assert sum(chunk.shape[0] for chunk in prod.chunks(chunk_size=2)) == len(expected)
+
+
+def test_lazy_cartesian_product_chunks_and_shards():
+    prod = LazyCartesianProduct([[1, 2, 3], [10, 20]])
+    rows = np.concatenate(list(prod.chunks(chunk_size=4)))
+    assert rows.tolist() == [list(item) for item in product([1, 2, 3], [10, 20])]
+
+    shards = [prod.shard(worker_index, 4) for worker_index in range(4)]
+    assert shards[0][0] == 0 and shards[-1][1] == len(prod)
+    assert all(prev[1] == curr[0] for prev, curr in zip(shards, shards[1:]))
+    with pytest.raises(IndexError):
+        prod[len(prod)]
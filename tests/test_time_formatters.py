@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.time_handling import time_formatters
+from pygenutils.time_handling.time_formatters import (
+    dt_obj_converter,
+    make_converter,
+    parse_dt_string,
+    parse_float_dt
+)
+
+#------------------#
+# Define functions #
+#------------------#
+
+DT_FMT_STR = "%Y-%m-%d %H:%M:%S"
+
+# Time string parsing #
+#---------------------#
+
+DT_STRINGS = ["2020-01-02 03:04:05", "2021-12-31 23:59:59", "1999-02-28 00:00:00"]
+
+
+@pytest.mark.parametrize("module", ["datetime", "dateutil", "pandas", "numpy"])
+def test_parse_dt_string_arrays_match_scalars(module):
+    expected = [parse_dt_string(dt_str, DT_FMT_STR, module=module) for dt_str in DT_STRINGS]
+    for container in (list, tuple, np.array):
+        parsed = parse_dt_string(container(DT_STRINGS), DT_FMT_STR, module=module)
+        assert list(parsed) == expected
+
+    series = pd.Series(DT_STRINGS, index=[3, 4, 5], name="obs")
+    parsed_series = parse_dt_string(series, DT_FMT_STR, module=module)
+    assert parsed_series.index.tolist() == [3, 4, 5] and parsed_series.name == "obs"
+    assert list(parsed_series) == expected
+
+
+def test_parse_dt_string_array_containers():
+    parsed = parse_dt_string(np.array([DT_STRINGS[:2]]), DT_FMT_STR, module="numpy", unit="s")
+    assert parsed.shape == (1, 2) and parsed.dtype == np.dtype("datetime64[s]")
+    assert isinstance(parse_dt_string(DT_STRINGS, DT_FMT_STR, module="pandas"), pd.DatetimeIndex)
+    assert isinstance(parse_dt_string(tuple(DT_STRINGS), DT_FMT_STR), list)
+
+
+def test_parse_dt_string_array_fallback_and_errors():
+    # Time zones are left to the per-element parser
+    tz_strings = ["2020-01-02T00:00+0100", "2020-01-02T00:00-0230"]
+    parsed = parse_dt_string(tz_strings, "%Y-%m-%dT%H:%M%z")
+    assert [dt_obj.utcoffset().total_seconds() for dt_obj in parsed] == [3600, -9000]
+
+    with pytest.raises(ValueError):
+        parse_dt_string([DT_STRINGS[0], "not a date"], DT_FMT_STR)
+    with pytest.raises(ValueError):
+        parse_dt_string(DT_STRINGS, module="datetime")
+
+# Format inference cache #
+#------------------------#
+
+@pytest.fixture
+def empty_format_cache(monkeypatch):
+    format_cache = OrderedDict()
+    monkeypatch.setattr(time_formatters, "_FORMAT_INFERENCE_CACHE", format_cache)
+    return format_cache
+
+
+def test_inferred_formats_are_cached_per_column(empty_format_cache):
+    series = pd.Series(["02/01/2020 10:00", "13/01/2020 11:30"], name="obs")
+    parsed = parse_dt_string(series, module="pandas", dayfirst=True)
+    assert parsed.tolist() == [pd.Timestamp("2020-01-02 10:00"), pd.Timestamp("2020-01-13 11:30")]
+    assert list(empty_format_cache.values()) == ["%d/%m/%Y %H:%M"]
+
+    # Same layout and options: the cached format is reused
+    parse_dt_string(pd.Series(["25/12/2021 00:15"], name="obs"), module="pandas", dayfirst=True)
+    assert len(empty_format_cache) == 1
+    parse_dt_string(pd.Series(["25/12/2021 00:15"], name="other"), module="pandas", dayfirst=True)
+    assert len(empty_format_cache) == 2
+
+
+def test_inferred_format_matches_dateutil(empty_format_cache):
+    from dateutil.parser import parse
+
+    dt_strs = ["2020-01-02", "2020-02-03"]
+    assert parse_dt_string(dt_strs, module="dateutil") == [parse(dt_str) for dt_str in dt_strs]
+    assert list(empty_format_cache.values()) == ["%Y-%m-%d"]
+
+    # Values not matching the cached format fall back to dateutil
+    mixed_strs = ["2020-01-02", "Jan 3 2020"]
+    assert parse_dt_string(mixed_strs, module="dateutil") == [parse(dt_str) for dt_str in mixed_strs]
+
+    # Formats that disagree with dateutil on the sample are not cached
+    parse_dt_string(["01/02/2020", "13/02/2020"], module="dateutil", dayfirst=True)
+    assert list(empty_format_cache.values()) == ["%Y-%m-%d"]
+
+
+def test_format_cache_is_bounded(empty_format_cache, monkeypatch):
+    monkeypatch.setattr(time_formatters, "FORMAT_INFERENCE_CACHE_SIZE", 2)
+    for name in ["a", "b", "c"]:
+        parse_dt_string(pd.Series(["2020-01-02"], name=name), module="pandas")
+    assert [fingerprint[0] for fingerprint in empty_format_cache] == ["b", "c"]
+
+# Floated time parsing #
+#----------------------#
+
+
+@pytest.mark.parametrize("value, unit", [
+    (1_700_000_000, "s"),
+    (1_700_000_000_123, "ms"),
+    (1_700_000_000_123_456, "us"),
+    (19_675, "D"),
+])
+def test_parse_float_dt_str_honours_unit(value, unit):
+    expected = pd.to_datetime(value, unit=unit).strftime(DT_FMT_STR)
+    assert parse_float_dt(value, unit=unit, module="str", dt_fmt_str=DT_FMT_STR) == expected
+    assert parse_float_dt([value], unit=unit, module="str", dt_fmt_str=DT_FMT_STR).tolist() == [expected]
+
+
+def test_parse_float_dt_str_defaults_to_seconds():
+    assert parse_float_dt(1_700_000_000.5, module="str", dt_fmt_str=DT_FMT_STR) == "2023-11-14 22:13:20"
+    with pytest.raises(ValueError):
+        parse_float_dt(1_700_000_000, unit="weeks", module="str", dt_fmt_str=DT_FMT_STR)
+
+
+def test_parse_float_dt_arrays_match_scalars():
+    values = [1_700_000_000_123, 1_700_000_001_456]
+    scalars = [parse_float_dt(value, unit="ms", module="numpy") for value in values]
+    assert parse_float_dt(np.array(values), unit="ms", module="numpy").tolist() == scalars
+
+    series = pd.Series(values, index=["a", "b"], name="t")
+    converted = parse_float_dt(series, unit="ms", module="str", dt_fmt_str=DT_FMT_STR)
+    assert converted.index.tolist() == ["a", "b"] and converted.name == "t"
+    assert converted.tolist() == ["2023-11-14 22:13:20", "2023-11-14 22:13:21"]
+
+
+def test_parse_float_dt_frac_precision_rounding():
+    result = parse_float_dt([1.2345678], unit="s", module="numpy", frac_precision=3)
+    assert result[0] == np.datetime64("1970-01-01T00:00:01.235")
+
+# Conversion plans #
+#------------------#
+
+DT_OBJS = [datetime(2020, 1, 2, 3, 4, 5), datetime(2021, 6, 7, 8, 9, 10, 500000)]
+DT64_ARR = np.array(["2020-01-02T03:04:05", "2021-06-07"], dtype="datetime64[s]")
+
+
+@pytest.mark.parametrize("convert_to", ["float", "str"])
+def test_make_converter_matches_dt_obj_converter(convert_to):
+    converter = make_converter(datetime, convert_to, dt_fmt_str=DT_FMT_STR)
+    expected = [dt_obj_converter(dt_obj, convert_to, dt_fmt_str=DT_FMT_STR) for dt_obj in DT_OBJS]
+
+    assert [converter(dt_obj) for dt_obj in DT_OBJS] == expected
+    assert converter(DT_OBJS) == expected
+    assert converter(tuple(DT_OBJS)) == expected
+    converted_array = converter(np.array(DT_OBJS, dtype=object).reshape(2, 1))
+    assert converted_array.shape == (2, 1) and converted_array.ravel().tolist() == expected
+    assert make_converter("datetime", convert_to, dt_fmt_str=DT_FMT_STR)(DT_OBJS[0]) == expected[0]
+
+
+@pytest.mark.parametrize("convert_to", ["float", "str", "pandas", "datetime"])
+def test_make_converter_datetime64_arrays(convert_to):
+    converter = make_converter("datetime64", convert_to, dt_fmt_str=DT_FMT_STR)
+    expected = [dt_obj_converter(dt64, convert_to, dt_fmt_str=DT_FMT_STR) for dt64 in DT64_ARR]
+    assert list(converter(DT64_ARR)) == expected
+
+
+def test_make_converter_validates_options_once():
+    with pytest.raises(ValueError):
+        make_converter(datetime, "struct_time")
+    with pytest.raises(ValueError):
+        make_converter(datetime, "float", unit="weeks")
+    with pytest.raises(ValueError):
+        make_converter("not_a_type", "float")
+
+    # Conversion errors are wrapped by dt_obj_converter only
+    with pytest.raises(RuntimeError):
+        dt_obj_converter(DT_OBJS[0], "str", dt_fmt_str=123)
+
+# Conversions of whole columns #
+#------------------------------#
+
+DT64_COLUMN = np.array(["2020-01-02T03:04:05.123456", "1969-12-31T23:59:59", "NaT"],
+                       dtype="datetime64[us]")
+
+
+@pytest.mark.parametrize("dt_fmt_str", ["%Y-%m-%d %H:%M:%S.%f", "%d/%m/%y %H%M", "%a %d %b %Y"])
+def test_to_str_arrays_and_series_match_strftime(dt_fmt_str):
+    # Missing values are rendered as 'NaT' whichever path formats the format string
+    values = DT64_COLUMN
+    expected = [pd.Timestamp(value).strftime(dt_fmt_str) for value in values[:2]] + ["NaT"]
+
+    assert dt_obj_converter(values, "str", dt_fmt_str=dt_fmt_str).tolist() == expected
+    assert dt_obj_converter(values[::-1].reshape(1, 3), "str", dt_fmt_str=dt_fmt_str).tolist() \
+           == [expected[::-1]]
+    series = pd.Series(values, index=["a", "b", "c"], name="t")
+    converted = dt_obj_converter(series, "str", dt_fmt_str=dt_fmt_str)
+    assert converted.tolist() == expected and converted.index.tolist() == ["a", "b", "c"]
+
+    objects = pd.Series([pd.Timestamp(value).to_pydatetime() for value in values])
+    assert dt_obj_converter(objects, "str", dt_fmt_str=dt_fmt_str).tolist() == expected
+
+
+def test_to_str_special_columns():
+    assert dt_obj_converter(DT64_COLUMN, "str", dt_fmt_str="%Y")[-1] == "NaT"
+    epochs = np.array([[0, 86400]])
+    assert dt_obj_converter(epochs, "str", unit="s", dt_fmt_str="%Y-%m-%d").tolist() \
+           == [["1970-01-01", "1970-01-02"]]
+
+    aware = pd.Series(pd.to_datetime(["2020-01-02 03:04", "2020-07-03 04:05", "NaT"]).tz_localize("Europe/Madrid"))
+    assert dt_obj_converter(aware, "str", dt_fmt_str="%H:%M %z").tolist() == ["03:04 +0100", "04:05 +0200", "NaT"]
+
+    frame = pd.DataFrame({"t" : DT64_COLUMN[:2], "x" : [1, 2]})
+    converted = dt_obj_converter(frame, "str", dt_fmt_str="%d/%m/%Y")
+    assert converted["t"].tolist() == ["02/01/2020", "31/12/1969"]
+    assert converted["x"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns", "D"])
+def test_to_float_series_and_frames_match_scalars(unit):
+    expected = [dt_obj_converter(value, "float", unit=unit) for value in DT64_COLUMN[:2]]
+
+    totals = dt_obj_converter(pd.Series(DT64_COLUMN, name="t"), "float", unit=unit)
+    assert totals.name == "t" and np.isnan(totals.iloc[-1])
+    np.testing.assert_allclose(totals.iloc[:2], expected)
+
+    frame = pd.DataFrame({"t" : DT64_COLUMN[:2], "x" : ["a", "b"]})
+    converted = dt_obj_converter(frame, "float", unit=unit)
+    np.testing.assert_allclose(converted["t"], expected)
+    assert converted["x"].tolist() == ["a", "b"]
+
+
+def test_column_normalisation_keeps_wall_times():
+    mixed_zones = pd.Series([datetime(2020, 1, 1, tzinfo=timezone.utc),
+                             datetime(2020, 1, 1, 5, tzinfo=timezone(timedelta(hours=5)))])
+    totals = dt_obj_converter(mixed_zones, "float", unit="s")
+    assert totals.tolist() == [1_577_836_800.0, 1_577_854_800.0]
+
+    aware = pd.Series(pd.to_datetime(["2020-07-03 04:05"]).tz_localize("Europe/Madrid"))
+    assert dt_obj_converter(aware, "pandas").tolist() == [pd.Timestamp("2020-07-03 04:05")]
+
+    epochs = pd.Series([0, 90_061.5])
+    assert dt_obj_converter(epochs, "pandas").tolist() == [pd.Timestamp("1970-01-01"),
+                                                           pd.Timestamp("1970-01-02 01:01:01.5")]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+from datetime import datetime
+import time
+
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils.time_handling import time_utils
+from pygenutils.time_handling.time_utils import get_nano_datetime, get_nano_datetime_array
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Auxiliary functions #
+#---------------------#
+
+@pytest.fixture
+def madrid_time_zone(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time zones can only be switched with time.tzset")
+    monkeypatch.setenv("TZ", "Europe/Madrid")
+    time.tzset()
+    time_utils._format_epoch_second.cache_clear()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+    time_utils._format_epoch_second.cache_clear()
+
+
+def _reference_local_str(t_ns):
+    seconds, nanoseconds = divmod(t_ns, 10**9)
+    return f"{datetime.fromtimestamp(seconds).strftime('%Y-%m-%dT%H:%M:%S')}.{nanoseconds:09d}"
+
+# Nanosecond timestamps #
+#-----------------------#
+
+# Around the end of daylight saving time in Europe (2023-10-29T01:00 UTC)
+T_NS = [1_698_541_199_999_999_999, 1_698_541_200_000_000_001, 1_700_000_000_123_456_789, -1]
+
+
+def test_get_nano_datetime_utc():
+    assert get_nano_datetime(1_700_000_000_123_456_789, module="arrow") == "2023-11-14T22:13:20.123456789"
+    assert get_nano_datetime(-1, module="arrow") == "1969-12-31T23:59:59.999999999"
+    assert get_nano_datetime(1_700_000_000.5, module="arrow") == "2023-11-14T22:13:20.500000000"
+    assert get_nano_datetime_array(T_NS, module="arrow").tolist() \
+           == [get_nano_datetime(t_ns, module="arrow") for t_ns in T_NS]
+
+
+def test_get_nano_datetime_local_time(madrid_time_zone):
+    expected = [_reference_local_str(t_ns) for t_ns in T_NS]
+    assert [get_nano_datetime(t_ns) for t_ns in T_NS] == expected
+    assert get_nano_datetime_array(np.array(T_NS).reshape(2, 2)).ravel().tolist() == expected
+    assert expected[0].startswith("2023-10-29T02:59:59") and expected[1].startswith("2023-10-29T02:00:00")
+
+
+def test_get_nano_datetime_current_time():
+    before = time.time_ns()
+    now_str = get_nano_datetime(module="arrow")
+    after = time.time_ns()
+    now_ns = int(np.datetime64(now_str, "ns").astype(np.int64))
+    assert before <= now_ns <= after
+
+
+def test_get_nano_datetime_invalid_inputs():
+    with pytest.raises(TypeError):
+        get_nano_datetime("1700000000")
+    with pytest.raises(ValueError):
+        get_nano_datetime(0, module="calendar")
+    with pytest.raises(ValueError):
+        get_nano_datetime_array([0], module="calendar")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+from collections import OrderedDict
+import datetime
+import sys
+import threading
+import time
+from types import ModuleType
+
+import numpy as np
+import pandas as pd
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from pygenutils._type_dispatch import TYPE_KEYS, TypeRegistry, type_key
+
+#------------------#
+# Define functions #
+#------------------#
+
+# Type keys #
+#-----------#
+
+@pytest.mark.parametrize("obj, expected", [
+    (True, "bool"),
+    (1, "int"),
+    ("a", "str"),
+    ([1], "list"),
+    (OrderedDict(), "dict"),
+    (frozenset(), "frozenset"),
+    (datetime.datetime(2020, 1, 1), "datetime"),
+    (datetime.date(2020, 1, 1), "date"),
+    (time.localtime(0), "struct_time"),
+    (np.array([1]), "ndarray"),
+    (np.datetime64("2020-01-01"), "datetime64"),
+    (np.float64(1), "float"),
+    (np.int64(1), "int64"),
+    (pd.Series([1]), "series"),
+    (pd.DataFrame(), "dataframe"),
+    (pd.Timestamp("2020-01-01"), "timestamp"),
+    (pd.Timedelta(1), "timedelta"),
+    (range(2), "range"),
+])
+def test_type_key_follows_the_mro(obj, expected):
+    assert type_key(obj) == expected
+    assert TYPE_KEYS.resolve(type(obj)) == expected
+
+# Type registry #
+#---------------#
+
+def test_registry_resolves_closest_base_and_caches():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    registry = TypeRegistry({Base : "base"})
+    assert registry.lookup(Child()) == "base"
+    assert registry.lookup(1) is None
+    assert Child in registry._cache
+
+    registry.register(Child, "child")
+    assert registry.lookup(Child()) == "child"
+    assert registry.lookup(Base()) == "base"
+
+
+def test_registry_lazy_types(monkeypatch):
+    registry = TypeRegistry({"fake_module.Thing" : "thing",
+                             "fake_module.Missing" : "missing"},
+                            default=lambda obj_type: obj_type.__name__)
+
+    class Thing:
+        pass
+    assert registry.lookup(Thing()) == "Thing"
+
+    fake_module = ModuleType("fake_module")
+    fake_module.Thing = Thing
+    monkeypatch.setitem(sys.modules, "fake_module", fake_module)
+    registry.register(int, "integer")
+    assert registry.lookup(Thing()) == "thing"
+    assert registry.lookup(1) == "integer"
+    assert registry._lazy_registry == {}
+
+
+def test_registry_lazy_types_resolved_concurrently(monkeypatch):
+    type_names = [f"Thing{i}" for i in range(50)]
+    registry = TypeRegistry({f"fake_module.{name}" : name for name in type_names})
+    fake_module = ModuleType("fake_module")
+    for name in type_names:
+        setattr(fake_module, name, type(name, (), {}))
+    monkeypatch.setitem(sys.modules, "fake_module", fake_module)
+
+    barrier = threading.Barrier(8)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append([registry.lookup(getattr(fake_module, name)())
+                            for name in type_names])
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert results == [type_names] * 8
+    assert registry._lazy_registry == {}